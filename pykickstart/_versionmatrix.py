@@ -0,0 +1,514 @@
+# Generated by pykickstart.versionmatrix.writeMatrix.  Do not edit this
+# file.  Run "make versionmatrix" to write it again instead.
+# pylint: skip-file
+VERSIONS = (
+    'RHEL3',
+    'FC3',
+    'RHEL4',
+    'FC4',
+    'FC5',
+    'FC6',
+    'RHEL5',
+    'F7',
+    'F8',
+    'F9',
+    'F10',
+    'F11',
+    'F12',
+    'F13',
+    'RHEL6',
+    'F14',
+    'F15',
+    'F16',
+    'F17',
+    'F18',
+    'F19',
+    'F20',
+    'F21',
+    'RHEL7',
+    'F22',
+    'F23',
+    'F24',
+)
+
+COMMANDS = {
+    'auth': (0x7ffffff, 0x0, {
+    }),
+    'authconfig': (0x7ffffff, 0x0, {
+    }),
+    'autopart': (0x7ffffff, 0x0, {
+        '--backuppassphrase': (0x7fff000, 0x0),
+        '--cipher': (0x7f84000, 0x0),
+        '--encrypted': (0x7fffe40, 0x0),
+        '--escrowcert': (0x7fff000, 0x0),
+        '--fstype': (0x7400000, 0x0),
+        '--nolvm': (0x7fe0000, 0x0),
+        '--passphrase': (0x7fffe40, 0x0),
+        '--type': (0x7fc0000, 0x0),
+    }),
+    'autostep': (0x7ffffff, 0x0, {
+        '--autoscreenshot': (0x7ffffff, 0x0),
+    }),
+    'bootloader': (0x7ffffff, 0x0, {
+        '--append': (0x7ffffff, 0x0),
+        '--boot-drive': (0x7fc0000, 0x0),
+        '--default': (0x7ffff00, 0x0),
+        '--disabled': (0x7c00000, 0x0),
+        '--driveorder': (0x7ffffff, 0x0),
+        '--extlinux': (0x7f00000, 0x0),
+        '--hvargs': (0x40, 0x0),
+        '--iscrypted': (0x7ff4000, 0x0),
+        '--lba32': (0x7fff, 0x7000),
+        '--leavebootorder': (0x7f80000, 0x0),
+        '--linear': (0x7, 0x0),
+        '--location': (0x7ffffff, 0x0),
+        '--md5pass': (0x7ffffff, 0x0),
+        '--nolinear': (0x7, 0x0),
+        '--nombr': (0x7c00000, 0x0),
+        '--password': (0x7ffffff, 0x0),
+        '--timeout': (0x7ffff00, 0x0),
+        '--upgrade': (0x7ffffff, 0x0),
+        '--useLilo': (0x7, 0x0),
+    }),
+    'btrfs': (0x7fc0000, 0x0, {
+        '--data': (0x7fc0000, 0x0),
+        '--label': (0x7fc0000, 0x0),
+        '--metadata': (0x7fc0000, 0x0),
+        '--mkfsoptions': (0x6800000, 0x0),
+        '--name': (0x7fc0000, 0x0),
+        '--noformat': (0x7fc0000, 0x0),
+        '--parent': (0x7fc0000, 0x0),
+        '--subvol': (0x7fc0000, 0x0),
+        '--useexisting': (0x7fc0000, 0x0),
+    }),
+    'cdrom': (0x7ffffff, 0x0, {
+    }),
+    'clearpart': (0x7ffffff, 0x0, {
+        '--all': (0x7ffffff, 0x0),
+        '--disklabel': (0x7c00000, 0x0),
+        '--drives': (0x7ffffff, 0x0),
+        '--initlabel': (0x7ffffff, 0x0),
+        '--linux': (0x7ffffff, 0x0),
+        '--list': (0x7fc0000, 0x0),
+        '--none': (0x7ffffff, 0x0),
+    }),
+    'cmdline': (0x7ffffff, 0x0, {
+    }),
+    'device': (0x7ffffff, 0x0, {
+        '--opts': (0x7ffffff, 0x0),
+    }),
+    'deviceprobe': (0x7ffffff, 0x0, {
+    }),
+    'dmraid': (0x7ffffe0, 0x0, {
+        '--dev': (0x7ffffe0, 0x0),
+        '--name': (0x7ffffe0, 0x0),
+    }),
+    'driverdisk': (0x7ffffff, 0x0, {
+        '--biospart': (0x7fffffc, 0x0),
+        '--source': (0x7ffffff, 0x0),
+        '--type': (0x7fff, 0x7040),
+    }),
+    'eula': (0x7e00000, 0x0, {
+        '--agreed': (0x7e00000, 0x0),
+    }),
+    'fcoe': (0x7fff000, 0x0, {
+        '--autovlan': (0x800000, 0x0),
+        '--dcb': (0x7ffe000, 0x0),
+        '--nic': (0x7fff000, 0x0),
+    }),
+    'firewall': (0x7ffffff, 0x0, {
+        '--disable': (0x7ffffff, 0x0),
+        '--enable': (0x7ffffff, 0x0),
+        '--ftp': (0x7ffffff, 0x0),
+        '--high': (0x1ff, 0x1ff),
+        '--http': (0x7fffc00, 0x0),
+        '--medium': (0x1ff, 0x1ff),
+        '--port': (0x7ffffff, 0x0),
+        '--remove-service': (0x7e00000, 0x0),
+        '--service': (0x7fffc00, 0x0),
+        '--smtp': (0x7fffc00, 0x0),
+        '--ssh': (0x7fffc00, 0x0),
+        '--telnet': (0x7c00, 0x7c00),
+        '--trust': (0x7ffffff, 0x0),
+    }),
+    'firstboot': (0x7ffffff, 0x0, {
+        '--disable': (0x7ffffff, 0x0),
+        '--enable': (0x7ffffff, 0x0),
+        '--reconfig': (0x7ffffff, 0x0),
+    }),
+    'graphical': (0x7ffffff, 0x0, {
+    }),
+    'group': (0x7fff000, 0x0, {
+        '--gid': (0x7fff000, 0x0),
+        '--name': (0x7fff000, 0x0),
+    }),
+    'halt': (0x7ffffff, 0x0, {
+        '--eject': (0x7ffffe0, 0x0),
+        '--kexec': (0x6000000, 0x0),
+    }),
+    'harddrive': (0x7ffffff, 0x0, {
+        '--biospart': (0x7ffffff, 0x0),
+        '--dir': (0x7ffffff, 0x0),
+        '--partition': (0x7ffffff, 0x0),
+    }),
+    'ignoredisk': (0x7ffffff, 0x0, {
+        '--drives': (0x7ffffff, 0x0),
+        '--interactive': (0x7ffc000, 0x0),
+        '--only-use': (0x7ffff44, 0x0),
+    }),
+    'install': (0x7ffffff, 0x0, {
+        '--root-device': (0x7fff800, 0x0),
+    }),
+    'interactive': (0xffff, 0x8000, {
+    }),
+    'iscsi': (0x7ffffe0, 0x0, {
+        '--iface': (0x7fc4000, 0x0),
+        '--ipaddr': (0x7ffffe0, 0x0),
+        '--password': (0x7ffffe0, 0x0),
+        '--port': (0x7ffffe0, 0x0),
+        '--reverse-password': (0x7fffc00, 0x0),
+        '--reverse-user': (0x7fffc00, 0x0),
+        '--target': (0x7ffffe0, 0x0),
+        '--user': (0x7ffffe0, 0x0),
+    }),
+    'iscsiname': (0x7ffffe0, 0x0, {
+    }),
+    'key': (0x40, 0x0, {
+        '--skip': (0x40, 0x0),
+    }),
+    'keyboard': (0x7ffffff, 0x0, {
+        '--switch': (0x7f80000, 0x0),
+        '--vckeymap': (0x7f80000, 0x0),
+        '--xlayouts': (0x7f80000, 0x0),
+    }),
+    'lang': (0x7ffffff, 0x0, {
+        '--addsupport': (0x7f00000, 0x0),
+    }),
+    'langsupport': (0x7f, 0x70, {
+        '--default': (0xf, 0x0),
+    }),
+    'lilo': (0x7, 0x0, {
+        '--append': (0x7, 0x0),
+        '--driveorder': (0x7, 0x0),
+        '--lba32': (0x7, 0x0),
+        '--linear': (0x7, 0x0),
+        '--location': (0x7, 0x0),
+        '--md5pass': (0x7, 0x0),
+        '--nolinear': (0x7, 0x0),
+        '--password': (0x7, 0x0),
+        '--upgrade': (0x7, 0x0),
+        '--useLilo': (0x7, 0x0),
+    }),
+    'lilocheck': (0x7, 0x0, {
+    }),
+    'liveimg': (0x7f00000, 0x0, {
+        '--checksum': (0x7f00000, 0x0),
+        '--noverifyssl': (0x7f00000, 0x0),
+        '--proxy': (0x7f00000, 0x0),
+        '--url': (0x7f00000, 0x0),
+    }),
+    'logging': (0x7ffffe0, 0x0, {
+        '--host': (0x7ffffe0, 0x0),
+        '--level': (0x7ffffe0, 0x0),
+        '--port': (0x7ffffe0, 0x0),
+    }),
+    'logvol': (0x7ffffff, 0x0, {
+        '--backuppassphrase': (0x7fff000, 0x0),
+        '--bytes-per-inode': (0x7ff8, 0x7e00),
+        '--cachemode': (0x6000000, 0x0),
+        '--cachepvs': (0x6000000, 0x0),
+        '--cachesize': (0x6000000, 0x0),
+        '--chunksize': (0x7e04000, 0x0),
+        '--cipher': (0x7f84000, 0x0),
+        '--encrypted': (0x7fffe40, 0x0),
+        '--escrowcert': (0x7fff000, 0x0),
+        '--fsoptions': (0x7fffff8, 0x0),
+        '--fsprofile': (0x7fffe00, 0x0),
+        '--fstype': (0x7ffffff, 0x0),
+        '--grow': (0x7ffffff, 0x0),
+        '--hibernation': (0x7f84000, 0x0),
+        '--label': (0x7ff0000, 0x0),
+        '--maxsize': (0x7ffffff, 0x0),
+        '--metadatasize': (0x7e04000, 0x0),
+        '--mkfsoptions': (0x6800000, 0x0),
+        '--name': (0x7ffffff, 0x0),
+        '--noformat': (0x7ffffff, 0x0),
+        '--passphrase': (0x7fffe40, 0x0),
+        '--percent': (0x7ffffff, 0x0),
+        '--poolname': (0x7e04000, 0x0),
+        '--profile': (0x6c04000, 0x0),
+        '--recommended': (0x7ffffff, 0x0),
+        '--resize': (0x7fc0000, 0x0),
+        '--size': (0x7ffffff, 0x0),
+        '--thin': (0x7e04000, 0x0),
+        '--thinpool': (0x7e04000, 0x0),
+        '--useexisting': (0x7ffffff, 0x0),
+        '--vgname': (0x7ffffff, 0x0),
+    }),
+    'mediacheck': (0x7fffff8, 0x0, {
+    }),
+    'method': (0x7ffffff, 0x0, {
+        '--mirrorlist': (0x7f80000, 0x0),
+        '--noverifyssl': (0x7ffc000, 0x0),
+        '--proxy': (0x7ffe000, 0x0),
+        '--url': (0x7ffffff, 0x0),
+    }),
+    'monitor': (0x7ffff, 0x7fc00, {
+        '--hsync': (0x3ff, 0x0),
+        '--monitor': (0x3ff, 0x0),
+        '--noprobe': (0x3e0, 0x0),
+        '--vsync': (0x3ff, 0x0),
+    }),
+    'mouse': (0x7f, 0x7e, {
+        '--device': (0x1, 0x0),
+        '--emulthree': (0x1, 0x0),
+    }),
+    'multipath': (0x7ffffe0, 0x0, {
+        '--device': (0x7ffffe0, 0x0),
+        '--name': (0x7ffffe0, 0x0),
+        '--rule': (0x7ffffe0, 0x0),
+    }),
+    'network': (0x7ffffff, 0x0, {
+        '--activate': (0x7fe4000, 0x0),
+        '--bondopts': (0x7f84000, 0x0),
+        '--bondslaves': (0x7f84000, 0x0),
+        '--bootproto': (0x7ffffff, 0x0),
+        '--bridgeopts': (0x7800000, 0x0),
+        '--bridgeslaves': (0x7800000, 0x0),
+        '--device': (0x7ffffff, 0x0),
+        '--dhcpclass': (0x7ffffff, 0x0),
+        '--essid': (0x7ffffff, 0x0),
+        '--ethtool': (0x7ffffff, 0x0),
+        '--gateway': (0x7ffffff, 0x0),
+        '--hostname': (0x7ffffff, 0x0),
+        '--interfacename': (0x7c00000, 0x0),
+        '--ip': (0x7ffffff, 0x0),
+        '--ipv6': (0x7ffff00, 0x0),
+        '--ipv6gateway': (0x7f80000, 0x0),
+        '--mtu': (0x7ffffff, 0x0),
+        '--nameserver': (0x7ffffff, 0x0),
+        '--netmask': (0x7ffffff, 0x0),
+        '--nodefroute': (0x7fe4000, 0x0),
+        '--nodns': (0x7ffffff, 0x0),
+        '--noipv4': (0x7ffffe0, 0x0),
+        '--noipv6': (0x7ffffe0, 0x0),
+        '--notksdevice': (0x7fffffc, 0x0),
+        '--onboot': (0x7ffffff, 0x0),
+        '--teamconfig': (0x7e00000, 0x0),
+        '--teamslaves': (0x7e00000, 0x0),
+        '--vlanid': (0x7f84000, 0x0),
+        '--wepkey': (0x7ffffff, 0x0),
+        '--wpakey': (0x7fe0000, 0x0),
+    }),
+    'nfs': (0x7ffffff, 0x0, {
+        '--dir': (0x7ffffff, 0x0),
+        '--opts': (0x7ffffe0, 0x0),
+        '--server': (0x7ffffff, 0x0),
+    }),
+    'ostreesetup': (0x7c00000, 0x0, {
+        '--nogpg': (0x7c00000, 0x0),
+        '--osname': (0x7c00000, 0x0),
+        '--ref': (0x7c00000, 0x0),
+        '--remote': (0x7c00000, 0x0),
+        '--url': (0x7c00000, 0x0),
+    }),
+    'part': (0x7ffffff, 0x0, {
+        '--active': (0x7ffffff, 0x0),
+        '--asprimary': (0x7ffffff, 0x0),
+        '--backuppassphrase': (0x7fff000, 0x0),
+        '--bytes-per-inode': (0x7ff8, 0x7e00),
+        '--cipher': (0x7f84000, 0x0),
+        '--encrypted': (0x7fffe40, 0x0),
+        '--end': (0x7fff, 0x7800),
+        '--escrowcert': (0x7fff000, 0x0),
+        '--fsoptions': (0x7fffff8, 0x0),
+        '--fsprofile': (0x7fffe00, 0x0),
+        '--fstype': (0x7ffffff, 0x0),
+        '--grow': (0x7ffffff, 0x0),
+        '--hibernation': (0x7f84000, 0x0),
+        '--label': (0x7fffff8, 0x0),
+        '--maxsize': (0x7ffffff, 0x0),
+        '--mkfsoptions': (0x6800000, 0x0),
+        '--noformat': (0x7ffffff, 0x0),
+        '--onbiosdisk': (0x7ffffff, 0x0),
+        '--ondisk': (0x7ffffff, 0x0),
+        '--onpart': (0x7ffffff, 0x0),
+        '--passphrase': (0x7fffe40, 0x0),
+        '--recommended': (0x7ffffff, 0x0),
+        '--resize': (0x7fc0000, 0x0),
+        '--size': (0x7ffffff, 0x0),
+        '--start': (0x7fff, 0x7800),
+    }),
+    'partition': (0x7ffffff, 0x0, {
+        '--active': (0x7ffffff, 0x0),
+        '--asprimary': (0x7ffffff, 0x0),
+        '--backuppassphrase': (0x7fff000, 0x0),
+        '--bytes-per-inode': (0x7ff8, 0x7e00),
+        '--cipher': (0x7f84000, 0x0),
+        '--encrypted': (0x7fffe40, 0x0),
+        '--end': (0x7fff, 0x7800),
+        '--escrowcert': (0x7fff000, 0x0),
+        '--fsoptions': (0x7fffff8, 0x0),
+        '--fsprofile': (0x7fffe00, 0x0),
+        '--fstype': (0x7ffffff, 0x0),
+        '--grow': (0x7ffffff, 0x0),
+        '--hibernation': (0x7f84000, 0x0),
+        '--label': (0x7fffff8, 0x0),
+        '--maxsize': (0x7ffffff, 0x0),
+        '--mkfsoptions': (0x6800000, 0x0),
+        '--noformat': (0x7ffffff, 0x0),
+        '--onbiosdisk': (0x7ffffff, 0x0),
+        '--ondisk': (0x7ffffff, 0x0),
+        '--onpart': (0x7ffffff, 0x0),
+        '--passphrase': (0x7fffe40, 0x0),
+        '--recommended': (0x7ffffff, 0x0),
+        '--resize': (0x7fc0000, 0x0),
+        '--size': (0x7ffffff, 0x0),
+        '--start': (0x7fff, 0x7800),
+    }),
+    'poweroff': (0x7ffffff, 0x0, {
+        '--eject': (0x7ffffe0, 0x0),
+        '--kexec': (0x6000000, 0x0),
+    }),
+    'raid': (0x7ffffff, 0x0, {
+        '--backuppassphrase': (0x7fff000, 0x0),
+        '--bytes-per-inode': (0x7ff0, 0x7e00),
+        '--cipher': (0x7fa4000, 0x0),
+        '--device': (0x7ffffff, 0x0),
+        '--encrypted': (0x7fffe40, 0x0),
+        '--escrowcert': (0x7fff000, 0x0),
+        '--fsoptions': (0x7fffff8, 0x0),
+        '--fsprofile': (0x7fffe00, 0x0),
+        '--fstype': (0x7ffffff, 0x0),
+        '--label': (0x7ff0000, 0x0),
+        '--level': (0x7ffffff, 0x0),
+        '--mkfsoptions': (0x6800000, 0x0),
+        '--noformat': (0x7ffffff, 0x0),
+        '--passphrase': (0x7fffe40, 0x0),
+        '--spares': (0x7ffffff, 0x0),
+        '--useexisting': (0x7ffffff, 0x0),
+    }),
+    'realm': (0x7f00000, 0x0, {
+    }),
+    'reboot': (0x7ffffff, 0x0, {
+        '--eject': (0x7ffffe0, 0x0),
+        '--kexec': (0x6000000, 0x0),
+    }),
+    'repo': (0x7ffffe0, 0x0, {
+        '--baseurl': (0x7ffffe0, 0x0),
+        '--cost': (0x7ffff00, 0x0),
+        '--excludepkgs': (0x7ffff00, 0x0),
+        '--ignoregroups': (0x7fff800, 0x0),
+        '--includepkgs': (0x7ffff00, 0x0),
+        '--install': (0x7c00000, 0x0),
+        '--mirrorlist': (0x7ffffe0, 0x0),
+        '--name': (0x7ffffe0, 0x0),
+        '--noverifyssl': (0x7ffc000, 0x0),
+        '--proxy': (0x7ffe000, 0x0),
+    }),
+    'reqpart': (0x6800000, 0x0, {
+        '--add-boot': (0x6800000, 0x0),
+    }),
+    'rescue': (0x7fffc00, 0x0, {
+        '--nomount': (0x7fffc00, 0x0),
+        '--romount': (0x7fffc00, 0x0),
+    }),
+    'rootpw': (0x7ffffff, 0x0, {
+        '--iscrypted': (0x7ffffff, 0x0),
+        '--lock': (0x7ffff00, 0x0),
+        '--plaintext': (0x7ffff00, 0x0),
+    }),
+    'selinux': (0x7fffffe, 0x0, {
+        '--disabled': (0x7fffffe, 0x0),
+        '--enforcing': (0x7fffffe, 0x0),
+        '--permissive': (0x7fffffe, 0x0),
+    }),
+    'services': (0x7ffffe0, 0x0, {
+        '--disabled': (0x7ffffe0, 0x0),
+        '--enabled': (0x7ffffe0, 0x0),
+    }),
+    'shutdown': (0x7ffffff, 0x0, {
+        '--eject': (0x7ffffe0, 0x0),
+        '--kexec': (0x6000000, 0x0),
+    }),
+    'skipx': (0x7ffffff, 0x0, {
+    }),
+    'sshkey': (0x7000000, 0x0, {
+        '--username': (0x7000000, 0x0),
+    }),
+    'sshpw': (0x7ffe000, 0x0, {
+        '--iscrypted': (0x7ffe000, 0x0),
+        '--lock': (0x7ffe000, 0x0),
+        '--plaintext': (0x7ffe000, 0x0),
+        '--username': (0x7ffe000, 0x0),
+    }),
+    'text': (0x7ffffff, 0x0, {
+    }),
+    'timezone': (0x7ffffff, 0x0, {
+        '--nontp': (0x7f80000, 0x0),
+        '--ntpservers': (0x7f80000, 0x0),
+        '--utc': (0x7ffffff, 0x0),
+    }),
+    'unsupported_hardware': (0x804000, 0x0, {
+    }),
+    'updates': (0x7ffff80, 0x0, {
+    }),
+    'upgrade': (0x7ffffff, 0x7e00000, {
+        '--root-device': (0x1ff800, 0x0),
+    }),
+    'url': (0x7ffffff, 0x0, {
+        '--mirrorlist': (0x7f80000, 0x0),
+        '--noverifyssl': (0x7ffc000, 0x0),
+        '--proxy': (0x7ffe000, 0x0),
+        '--url': (0x7ffffff, 0x0),
+    }),
+    'user': (0x7ffffe0, 0x0, {
+        '--gecos': (0x7fff000, 0x0),
+        '--gid': (0x7f00000, 0x0),
+        '--groups': (0x7ffffe0, 0x0),
+        '--homedir': (0x7ffffe0, 0x0),
+        '--iscrypted': (0x7ffffe0, 0x0),
+        '--lock': (0x7ffff00, 0x0),
+        '--name': (0x7ffffe0, 0x0),
+        '--password': (0x7ffffe0, 0x0),
+        '--plaintext': (0x7ffff00, 0x0),
+        '--shell': (0x7ffffe0, 0x0),
+        '--uid': (0x7ffffe0, 0x0),
+    }),
+    'vnc': (0x7ffffff, 0x0, {
+        '--connect': (0x1ff, 0x0),
+        '--host': (0x7ffffe0, 0x0),
+        '--password': (0x7ffffff, 0x0),
+        '--port': (0x7ffffe0, 0x0),
+    }),
+    'volgroup': (0x7ffffff, 0x0, {
+        '--noformat': (0x7ffffff, 0x0),
+        '--pesize': (0x7ffffff, 0x0),
+        '--reserved-percent': (0x7fe0000, 0x0),
+        '--reserved-space': (0x7fe0000, 0x0),
+        '--useexisting': (0x7ffffff, 0x0),
+    }),
+    'xconfig': (0x7ffffff, 0x0, {
+        '--card': (0x1ff, 0x1e0),
+        '--defaultdesktop': (0x7ffffff, 0x0),
+        '--depth': (0x7fff, 0x7c00),
+        '--driver': (0x7fe0, 0x7c00),
+        '--hsync': (0x1ff, 0x1e0),
+        '--monitor': (0x1ff, 0x1e0),
+        '--noprobe': (0x1ff, 0x1e0),
+        '--resolution': (0x7fff, 0x7c00),
+        '--server': (0x7ffffff, 0x0),
+        '--startxonboot': (0x7ffffff, 0x0),
+        '--videoram': (0x7fff, 0x7c00),
+        '--vsync': (0x1ff, 0x1e0),
+    }),
+    'zerombr': (0x7ffffff, 0x0, {
+    }),
+    'zfcp': (0x7fffffe, 0x0, {
+        '--devnum': (0x7fffffe, 0x0),
+        '--fcplun': (0x7fffffe, 0x0),
+        '--scsiid': (0x7ffe, 0x7000),
+        '--scsilun': (0x7ffe, 0x7000),
+        '--wwpn': (0x7fffffe, 0x0),
+    }),
+}
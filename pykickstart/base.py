@@ -40,13 +40,72 @@ This module exports several important base classes:
 """
 from pykickstart.i18n import _
 
+from collections import MutableMapping
 import six
-import warnings
-from pykickstart.errors import KickstartParseError, formatErrorMsg
+from pykickstart.diagnostics import _activeParser, warn
+from pykickstart.errors import KickstartError, KickstartParseError, formatErrorMsg
 from pykickstart.ko import KickstartObject
-from pykickstart.parser import Packages
+from pykickstart.options import sharedParser
+from pykickstart.parser import Packages, Script
+from pykickstart.schema import Field, initFields, renderFields
 from pykickstart.version import versionToString
 
+# The layout of the dicts made by the to_dict methods.  This must be bumped
+# whenever a change is made that older from_dict methods can't read.
+SCHEMA_VERSION = 2
+
+# The types of attribute values that can be saved by to_dict as they are.
+_scalarTypes = frozenset((six.text_type, str, bool, float, type(None)) + six.integer_types)
+
+# Turn an attribute value into something made only of dicts, lists, strings,
+# numbers, booleans, and None.  Data objects become dicts tagged with the
+# name the handler knows their class by.
+def _encodeValue(value, handler):
+    if type(value) in _scalarTypes:
+        return value
+    elif isinstance(value, BaseData):
+        d = value.to_dict()
+        d["__data__"] = handler._dataName(value) if handler else value.__class__.__name__
+        return d
+    elif isinstance(value, (set, frozenset)):
+        return [_encodeValue(v, handler) for v in sorted(value)]
+    elif isinstance(value, (list, tuple)):
+        return [_encodeValue(v, handler) for v in value]
+    elif isinstance(value, dict):
+        return dict((k, _encodeValue(v, handler)) for (k, v) in value.items())
+    else:
+        return value
+
+# The opposite of _encodeValue.  default is the value the attribute has in a
+# brand new object, and gives the type lists should be turned back into.
+def _decodeValue(value, default, handler):
+    if type(value) in _scalarTypes:
+        return value
+    elif isinstance(value, dict):
+        if "__data__" in value:
+            d = dict(value)
+            name = d.pop("__data__")
+            dataClass = getattr(handler, name, None)
+            if not isinstance(dataClass, type) or not issubclass(dataClass, BaseData):
+                raise KickstartError(_("Unknown data object: %s") % name)
+
+            return dataClass.from_dict(d)
+
+        return dict((k, _decodeValue(v, None, handler)) for (k, v) in value.items())
+    elif isinstance(value, list):
+        lst = [_decodeValue(v, None, handler) for v in value]
+        if isinstance(default, (set, frozenset, tuple)):
+            return default.__class__(lst)
+
+        return lst
+    else:
+        return value
+
+# A dict mapping KickstartCommand subclasses to what to_dict returns for a new
+# instance.  This is maintained by BaseHandler.to_dict.  No one else should be
+# touching it.
+_defaultDicts = {}
+
 ###
 ### COMMANDS
 ###
@@ -55,6 +114,9 @@ class KickstartCommand(KickstartObject):
     removedKeywords = []
     removedAttrs = []
 
+    _op = None
+    _dataIndex = None
+
     def __init__(self, writePriority=0, *args, **kwargs):
         """Create a new KickstartCommand instance.  This method must be
            provided by all subclasses, but subclasses must call
@@ -68,6 +130,12 @@ class KickstartCommand(KickstartObject):
                             command is contained withing.  This is needed to
                             allow referencing of Data objects.
            lineno        -- The current line number in the input file.
+           op            -- The KSOptionParser used to parse the arguments of
+                            this command.  It is created from the _getParser
+                            method the first time it is needed, and its
+                            option table is shared by all instances of the
+                            same class.  Commands that do not provide a
+                            _getParser method have no op attribute.
            seen          -- If this command was ever used in the kickstart file,
                             this attribute will be set to True.  This allows
                             for differentiating commands that were omitted
@@ -101,6 +169,20 @@ class KickstartCommand(KickstartObject):
         for arg in (kw for kw in self.removedKeywords if kw in kwargs):
             kwargs.pop(arg)
 
+    @property
+    def op(self):
+        if self._op is None:
+            if not hasattr(self, "_getParser"):
+                raise AttributeError("%s has no option parser" % self.__class__.__name__)
+
+            self._op = sharedParser(self.__class__, None, self._getParser)
+
+        return self._op
+
+    @op.setter
+    def op(self, value):
+        self._op = value
+
     def __call__(self, *args, **kwargs):
         """Set multiple attributes on a subclass of KickstartCommand at once
            via keyword arguments.  Valid attributes are anything specified in
@@ -136,6 +218,28 @@ class KickstartCommand(KickstartObject):
         """
         return None
 
+    def to_dict(self):
+        """Return a dict of all the attributes of this command, suitable for
+           encoding as JSON.  Data objects in the data list become dicts too.
+           The result can be turned back into a command with from_dict.
+        """
+        return dict((k, _encodeValue(v, self.handler)) for (k, v) in self.__dict__.items()
+                    if k not in self._unsavedAttrs and k != "handler")
+
+    @classmethod
+    def from_dict(cls, d, handler=None):
+        """Return a new instance of this command with the attributes given by
+           d, as returned by to_dict.  handler is the BaseHandler subclass the
+           command will belong to, and is needed to create any data objects.
+        """
+        obj = cls()
+        obj.handler = handler
+
+        for (k, v) in d.items():
+            setattr(obj, k, _decodeValue(v, getattr(obj, k, None), handler))
+
+        return obj
+
     def deleteRemovedAttrs(self):
         """Remove all attributes from self that are given in the removedAttrs
            list.  This method should be called from __init__ in a subclass,
@@ -144,6 +248,41 @@ class KickstartCommand(KickstartObject):
         for attr in [k for k in self.removedAttrs if hasattr(self, k)]:
             delattr(self, attr)
 
+    # The option parser can't be pickled because of its callbacks, and neither
+    # it nor the data index are worth saving.  Both are created again when
+    # needed.  Every other attribute, even one starting with an underscore,
+    # may be holding what the command was given.
+    _unsavedAttrs = ("_op", "_dataIndex")
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for attr in self._unsavedAttrs:
+            state.pop(attr, None)
+
+        return state
+
+    # Return whether an object equal to obj is already in the data list.  The
+    # data objects must provide a _getDupKey method returning the attributes
+    # their __eq__ compares.  This is the same as "obj in self.dataList()",
+    # but only compares obj against the objects with the same key.
+    #
+    # The index is only used while a parser is reading a file into this
+    # command's handler, and is built again for every file.  Nothing but the
+    # parser can change the data list or the objects in it while it reads,
+    # and it only ever appends.  Anything else could change the key of an
+    # object already indexed, so other callers get a plain search.
+    def _isDuplicate(self, obj):
+        parser = _activeParser()
+
+        if parser is None or parser.handler is not self.handler:
+            self._dataIndex = None
+            return obj in self.dataList()
+
+        if self._dataIndex is None or self._dataIndex.token is not parser._readToken:
+            self._dataIndex = _DataIndex(parser._readToken)
+
+        return self._dataIndex.contains(self.dataList(), obj)
+
     # Set the contents of the opts object (an instance of optparse.Values
     # returned by parse_args) as attributes on the KickstartCommand object.
     # It's useful to call this from KickstartCommand subclasses after parsing
@@ -157,8 +296,51 @@ class KickstartCommand(KickstartObject):
     # of objects (like partitions, network devices, etc.) and need to populate
     # a Data object.
     def _setToObj(self, optParser, opts, obj):
-        for key in [k for k in list(optParser.keys()) if getattr(opts, k) != None]:
-            setattr(obj, key, getattr(opts, key))
+        values = vars(opts)
+
+        for key in optParser.keys():
+            value = values.get(key)
+            if value is not None:
+                setattr(obj, key, value)
+
+class _DataIndex(object):
+    """An index over a command's data list, mapping the key of each data
+       object to the list of objects with that key.  Objects appended to the
+       data list are indexed the next time it is searched.  If the data list
+       is replaced, shrinks, or has its last indexed object swapped, the index
+       is rebuilt from scratch.  Changes to objects already indexed are not
+       noticed, so an index must only be used for as long as nothing but
+       appending can happen to the list.  See KickstartCommand._isDuplicate.
+    """
+    def __init__(self, token=None):
+        """Create a new _DataIndex instance.  Instance attributes:
+
+           token -- Whatever the owner uses to tell whether the index is
+                    still good.
+        """
+        self.token = token
+        self._lst = None
+        self._count = 0
+        self._last = None
+        self._keys = {}
+
+    def _sync(self, lst):
+        if lst is not self._lst or len(lst) < self._count or \
+           (self._count and lst[self._count-1] is not self._last):
+            self._lst = lst
+            self._count = 0
+            self._keys = {}
+
+        for i in range(self._count, len(lst)):
+            self._keys.setdefault(lst[i]._getDupKey(), []).append(lst[i])
+
+        self._count = len(lst)
+        self._last = lst[-1] if lst else None
+
+    def contains(self, lst, obj):
+        """Return whether an object equal to obj is in lst."""
+        self._sync(lst)
+        return any(other == obj for other in self._keys.get(obj._getDupKey(), []))
 
 class DeprecatedCommand(KickstartCommand):
     """Specify that a command is deprecated and no longer has any function.
@@ -181,7 +363,7 @@ class DeprecatedCommand(KickstartCommand):
     def parse(self, args):
         """Print a warning message if the command is seen in the input file."""
         mapping = {"lineno": self.lineno, "cmd": self.currentCmd}
-        warnings.warn(_("Ignoring deprecated command on line %(lineno)s:  The %(cmd)s command has been deprecated and no longer has any effect.  It may be removed from future releases, which will result in a fatal error from kickstart.  Please modify your kickstart file to remove this command.") % mapping, DeprecationWarning)
+        warn(_("Ignoring deprecated command on line %(lineno)s:  The %(cmd)s command has been deprecated and no longer has any effect.  It may be removed from future releases, which will result in a fatal error from kickstart.  Please modify your kickstart file to remove this command.") % mapping, "deprecated-command", DeprecationWarning)
 
 
 ###
@@ -251,11 +433,11 @@ class BaseHandler(KickstartObject):
         # This isn't really a good place for these, but it's better than
         # everything else I can think of.
         self.scripts = []
-        self.packages = Packages()
+        self.packages = Packages(version=self.version)
         self.platform = ""
 
         # These will be set by the dispatcher.
-        self.commands = {}
+        self.commands = _CommandMap(self)
         self.currentLine = 0
 
         # A dict keyed by an integer priority number, with each value being a
@@ -264,36 +446,67 @@ class BaseHandler(KickstartObject):
         # it.
         self._writeOrder = {}
 
+        # Command objects are only created once something asks for them.
+        # _commandObjs maps a command class name to its one instance, and
+        # _commandAttrs maps the attribute name a command is available under
+        # (handler.network, for instance) to the class to create for it.
+        self._commandObjs = {}
+        self._commandAttrs = {}
+        self._masked = False
+
+        # Maps each data class to the name it's available under (PartData,
+        # for instance).
+        self._dataNames = {}
+
         self._registerCommands(mapping, dataMapping, commandUpdates, dataUpdates)
 
+    def __getattr__(self, name):
+        # This is only called when regular attribute lookup fails, which is
+        # the case for commands that have not been created yet.
+        cmdClass = self.__dict__.get("_commandAttrs", {}).get(name)
+        if cmdClass is None:
+            raise AttributeError("%s object has no attribute %s" % (self.__class__.__name__, name))
+
+        return self._getCommandObj(cmdClass)
+
     def __str__(self):
         """Return a string formatted for output to a kickstart file."""
-        retval = ""
+        return "".join(self._strChunks())
+
+    def write(self, f):
+        """Write the kickstart file this handler describes to the file object
+           f.  The output is the same as that of str(), but is written out a
+           piece at a time instead of being built up in memory first.
+        """
+        for chunk in self._strChunks():
+            f.write(chunk)
+
+    def _strChunks(self):
+        # Yield the pieces of the kickstart file in order, leaving it to the
+        # caller to join them up or write them out.
+        def _encode(obj_str):
+            if isinstance(obj_str, six.text_type) and not six.PY3:
+                obj_str = obj_str.encode("utf-8")
+            return obj_str
 
         if self.platform != "":
-            retval += "#platform=%s\n" % self.platform
+            yield "#platform=%s\n" % self.platform
 
-        retval += "#version=%s\n" % versionToString(self.version)
+        yield "#version=%s\n" % versionToString(self.version)
 
-        lst = list(self._writeOrder.keys())
-        lst.sort()
+        # Every command has to be asked how it should be written out, so
+        # create all the ones nobody has needed yet.
+        for cmd in self.commands:
+            self.commands.get(cmd)
 
-        for prio in lst:
+        for prio in sorted(self._writeOrder.keys()):
             for obj in self._writeOrder[prio]:
-                obj_str = obj.__str__()
-                if isinstance(obj_str, six.text_type) and not six.PY3:
-                    obj_str = obj_str.encode("utf-8")
-                retval += obj_str
+                yield _encode(obj.__str__())
 
         for script in self.scripts:
-            script_str = script.__str__()
-            if isinstance(script_str, six.text_type) and not six.PY3:
-                script_str = script_str.encode("utf-8")
-            retval += script_str
-
-        retval += self.packages.__str__()
+            yield _encode(script.__str__())
 
-        return retval
+        yield self.packages.__str__()
 
     def _insertSorted(self, lst, obj):
         length = len(lst)
@@ -316,20 +529,33 @@ class BaseHandler(KickstartObject):
         else:
             lst.insert(i, obj)
 
-    def _setCommand(self, cmdObj):
-        # Add an attribute on this version object.  We need this to provide a
-        # way for clients to access the command objects.  We also need to strip
-        # off the version part from the front of the name.
-        if cmdObj.__class__.__name__.find("_") != -1:
-            name = cmdObj.__class__.__name__.split("_", 1)[1]
-            if not six.PY3:
-                name = unicode(name)    # pylint: disable=undefined-variable
+    def _commandAttrName(self, cmdClass):
+        # We need to strip off the version part from the front of the name.
+        if cmdClass.__name__.find("_") != -1:
+            name = cmdClass.__name__.split("_", 1)[1]
         else:
-            name = cmdObj.__class__.__name__.lower()
-            if not six.PY3:
-                name = unicode(name)    # pylint: disable=undefined-variable
+            name = cmdClass.__name__
+
+        name = name.lower()
+        if not six.PY3:
+            name = unicode(name)    # pylint: disable=undefined-variable
 
-        setattr(self, name.lower(), cmdObj)
+        return name
+
+    def _setCommand(self, cmdObj):
+        # Add an attribute on this version object.  We need this to provide a
+        # way for clients to access the command objects.  When two classes
+        # share an attribute name (F11_Upgrade and F20_Upgrade, for
+        # instance), only the one _registerCommands picked gets it, no matter
+        # which was created first.
+        name = self._commandAttrName(cmdObj.__class__)
+        if self._commandAttrs.get(name) is cmdObj.__class__:
+            setattr(self, name, cmdObj)
+
+        # Once maskAllExcept has been called, nothing else should be written
+        # out.
+        if self._masked:
+            return
 
         # Also, add the object into the _writeOrder dict in the right place.
         if cmdObj.writePriority is not None:
@@ -338,17 +564,37 @@ class BaseHandler(KickstartObject):
             else:
                 self._writeOrder[cmdObj.writePriority] = [cmdObj]
 
+    def _getCommandObj(self, cmdClass):
+        # Only one instance of each command class should ever exist, no matter
+        # how many command strings map to it.  If we haven't instantiated this
+        # command handler yet, do so now.
+        cmdObj = self._commandObjs.get(cmdClass.__name__)
+
+        if cmdObj is None:
+            cmdObj = cmdClass()
+            cmdObj.handler = self
+            self._commandObjs[cmdClass.__name__] = cmdObj
+            self._setCommand(cmdObj)
+
+        return cmdObj
+
     def _registerCommands(self, mapping=None, dataMapping=None, commandUpdates=None,
                           dataUpdates=None):
+        # Versioned handler classes carry their own maps.  Only go looking
+        # through every handler module if this one doesn't.
         if mapping == {} or mapping == None:
-            from pykickstart.handlers.control import commandMap
-            cMap = commandMap[self.version]
+            cMap = getattr(self, "commandMap", None)
+            if cMap is None:
+                from pykickstart.handlers.control import commandMap
+                cMap = commandMap[self.version]
         else:
             cMap = mapping
 
         if dataMapping == {} or dataMapping == None:
-            from pykickstart.handlers.control import dataMap
-            dMap = dataMap[self.version]
+            dMap = getattr(self, "dataMap", None)
+            if dMap is None:
+                from pykickstart.handlers.control import dataMap
+                dMap = dataMap[self.version]
         else:
             dMap = dataMapping
 
@@ -358,34 +604,25 @@ class BaseHandler(KickstartObject):
         if isinstance(dataUpdates, dict):
             dMap.update(dataUpdates)
 
+        # Record which class handles each command.  The command objects
+        # themselves are created by _getCommandObj the first time they are
+        # needed.  Where two classes share an attribute name, the one that
+        # appears last in cMap owns it, as it did when every command object
+        # was created here.
+        seen = set()
         for (cmdName, cmdClass) in list(cMap.items()):
-            # First make sure we haven't instantiated this command handler
-            # already.  If we have, we just need to make another mapping to
-            # it in self.commands.
-            # NOTE:  We can't use the resetCommand method here since that relies
-            # upon cmdClass already being instantiated.  We'll just have to keep
-            # these two code blocks in sync.
-            cmdObj = None
-
-            for (_key, val) in list(self.commands.items()):
-                if val.__class__.__name__ == cmdClass.__name__:
-                    cmdObj = val
-                    break
-
-            # If we didn't find an instance in self.commands, create one now.
-            if cmdObj == None:
-                cmdObj = cmdClass()
-                self._setCommand(cmdObj)
-
-            # Finally, add the mapping to the commands dict.
-            self.commands[cmdName] = cmdObj
-            self.commands[cmdName].handler = self
+            self.commands[cmdName] = cmdClass
+
+            if cmdClass not in seen:
+                seen.add(cmdClass)
+                self._commandAttrs[self._commandAttrName(cmdClass)] = cmdClass
 
         # We also need to create attributes for the various data objects.
         # No checks here because dMap is a bijection.  At least, that's what
         # the comment says.  Hope no one screws that up.
         for (dataName, dataClass) in list(dMap.items()):
             setattr(self, dataName, dataClass)
+            self._dataNames[dataClass] = dataName
 
     def resetCommand(self, cmdName):
         """Given the name of a command that's already been instantiated, create
@@ -398,11 +635,33 @@ class BaseHandler(KickstartObject):
         if cmdName not in self.commands:
             raise KeyError
 
-        cmdObj = self.commands[cmdName].__class__()
+        cmdObj = self.commands.commandClass(cmdName)()
+        cmdObj.handler = self
 
+        self._commandObjs[cmdObj.__class__.__name__] = cmdObj
         self._setCommand(cmdObj)
         self.commands[cmdName] = cmdObj
-        self.commands[cmdName].handler = self
+
+    def reset(self):
+        """Return this handler to the state it was in when it was created, so
+           it can be used to parse another kickstart file.  This is much
+           cheaper than creating a new handler.  All command objects are
+           thrown away, which also empties out the data lists, and will be
+           created again the first time they are needed.  The scripts list and
+           Packages object are replaced with empty ones.  Commands masked by
+           maskAllExcept stay masked.
+        """
+        for name in self._commandAttrs:
+            self.__dict__.pop(name, None)
+
+        self._commandObjs = {}
+        self._writeOrder = {}
+        self.commands.reset()
+
+        self.scripts = []
+        self.packages = Packages(version=self.version)
+        self.platform = ""
+        self.currentLine = 0
 
     def dispatcher(self, args, lineno):
         """Call the appropriate KickstartCommand handler for the current line
@@ -438,8 +697,9 @@ class BaseHandler(KickstartObject):
            the lst.  All other commands will not be processed.
         """
         self._writeOrder = {}
+        self._masked = True
 
-        for (key, _val) in list(self.commands.items()):
+        for key in list(self.commands.keys()):
             if not key in lst:
                 self.commands[key] = None
 
@@ -447,17 +707,191 @@ class BaseHandler(KickstartObject):
         """Return true if there is a handler for the string cmd."""
         return hasattr(self, cmd)
 
+    def _dataName(self, obj):
+        # Subclasses of the data classes we know about are saved under the
+        # same name, since that's how they would have been created.
+        for cls in obj.__class__.__mro__:
+            if cls in self._dataNames:
+                return self._dataNames[cls]
+
+        return obj.__class__.__name__
+
+    def to_dict(self):
+        """Return a dict describing everything held by this handler, suitable
+           for encoding as JSON.  Only commands that differ from their
+           defaults, and that are not masked, are included.  The result can be turned back into a
+           handler with from_dict.
+        """
+        commands = {}
+
+        # Commands are saved under the first command string that maps to
+        # their class.  Attribute names are not enough, since different
+        # classes can share one.
+        names = {}
+        for cmdName in sorted(self.commands):
+            cmdClass = self.commands.commandClass(cmdName)
+            if cmdClass is not None:
+                names.setdefault(cmdClass.__name__, cmdName)
+
+        for cmdObj in list(self._commandObjs.values()):
+            name = names.get(cmdObj.__class__.__name__)
+            if name is None:
+                continue
+
+            if cmdObj.__class__ not in _defaultDicts:
+                _defaultDicts[cmdObj.__class__] = cmdObj.__class__().to_dict()
+
+            d = cmdObj.to_dict()
+            if d != _defaultDicts[cmdObj.__class__]:
+                commands[name] = d
+
+        return {"schema": SCHEMA_VERSION,
+                "version": versionToString(self.version),
+                "platform": self.platform,
+                "commands": commands,
+                "scripts": [script.to_dict() for script in self.scripts],
+                "packages": self.packages.to_dict()}
+
+    @classmethod
+    def from_dict(cls, d):
+        """Return a new handler holding everything described by d, as
+           returned by to_dict.  When called on BaseHandler itself, the
+           handler is created for the version given in d.  Raises
+           KickstartError if d can't be read.
+        """
+        if d.get("schema") != SCHEMA_VERSION:
+            raise KickstartError(_("Unsupported schema version: %s") % d.get("schema"))
+
+        if cls is BaseHandler:
+            from pykickstart.version import makeVersion
+            handler = makeVersion(d["version"])
+        else:
+            handler = cls()
+
+        for (name, cmdDict) in d["commands"].items():
+            cmdClass = handler.commands.commandClass(name) if name in handler.commands else None
+            if cmdClass is None:
+                raise KickstartError(_("Unknown command: %s") % name)
+
+            cmdObj = cmdClass.from_dict(cmdDict, handler)
+            handler._commandObjs[cmdClass.__name__] = cmdObj
+            handler._setCommand(cmdObj)
+
+        handler.platform = d["platform"]
+        handler.scripts = [Script.from_dict(script) for script in d["scripts"]]
+        handler.packages = Packages.from_dict(d["packages"])
+
+        return handler
+
+
+class _CommandMap(MutableMapping):
+    """A dict-like mapping from command strings to KickstartCommand objects,
+       as found in BaseHandler.commands.  Values may be given as a
+       KickstartCommand subclass, in which case the handler is asked to
+       create the command object the first time the key is looked up.
+    """
+    def __init__(self, handler):
+        self._handler = handler
+        self._data = {}
+
+    def __getitem__(self, key):
+        val = self._data[key]
+
+        if isinstance(val, type):
+            val = self._handler._getCommandObj(val)
+            self._data[key] = val
+
+        return val
+
+    def __setitem__(self, key, val):
+        self._data[key] = val
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def reset(self):
+        """Put the class back in place of every command object that has been
+           created, so new ones are created the next time they are looked up.
+           Masked commands are left as None.
+        """
+        for (key, val) in self._data.items():
+            if val is not None and not isinstance(val, type):
+                self._data[key] = val.__class__
+
+    def commandClass(self, key):
+        """Return the class handling the given command string without creating
+           the command object, or None if it has been masked.  Raises
+           KeyError if key is unknown.
+        """
+        val = self._data[key]
+
+        if val is None or isinstance(val, type):
+            return val
+        else:
+            return val.__class__
 
 ###
 ### DATA
 ###
-class BaseData(KickstartObject):
-    """The base class for all data objects.  This is an abstract class."""
+class _DataMeta(type):
+    """The metaclass for BaseData.  Every data class in pykickstart declares
+       the attributes it adds in __slots__, so data objects have no
+       __dict__.  A class that lists its attributes in fields (see
+       pykickstart.schema) gets a slot for each field a base class does not
+       already have, unless it gives its own __slots__.  Subclasses that
+       declare neither, such as ones written outside pykickstart, get a
+       __dict__ as usual.
+    """
+    def __new__(mcs, name, bases, namespace):
+        if "fields" in namespace:
+            if "__slots__" not in namespace:
+                taken = set()
+                for base in bases:
+                    for klass in base.__mro__:
+                        taken.update(klass.__dict__.get("__slots__", ()))
+
+                namespace["__slots__"] = tuple(f.dest for f in namespace["fields"]
+                                               if isinstance(f, Field) and f.dest not in taken)
+
+        cls = type.__new__(mcs, name, bases, namespace)
+
+        slotNames = []
+        for klass in reversed(cls.__mro__):
+            slotNames.extend(s for s in klass.__dict__.get("__slots__", ())
+                             if s not in ("__dict__", "__weakref__"))
+        cls._slotNames = tuple(slotNames)
+
+        return cls
+
+class BaseData(six.with_metaclass(_DataMeta, KickstartObject)):
+    """The base class for all data objects.  This is an abstract class.
+
+       Attributes are kept in slots, so every subclass has to list the
+       attributes its __init__ method adds in __slots__, or declare them as
+       fields.  See _DataMeta.
+    """
+    __slots__ = ("lineno",)
+
     removedKeywords = []
     removedAttrs = []
 
+    # The attributes of a data class that declares them, instead of setting
+    # them in __init__ and writing them out in _getArgsAsStr.  See
+    # pykickstart.schema.
+    fields = ()
+
     def __init__(self, *args, **kwargs):
-        """Create a new BaseData instance.
+        """Create a new BaseData instance.  Any fields the class declares are
+           set from the keyword arguments or to their initial values.
 
            lineno -- Line number in the ks-file where this object was defined
         """
@@ -469,10 +903,18 @@ class BaseData(KickstartObject):
         KickstartObject.__init__(self, *args, **kwargs)
         self.lineno = 0
 
+        if self.fields:
+            initFields(self, self.fields, kwargs)
+
     def __str__(self):
         """Return a string formatted for output to a kickstart file."""
         return ""
 
+    def _getArgsAsStr(self):
+        # The options for the declared fields.  Classes without fields write
+        # their own.
+        return renderFields(self, self.fields)
+
     def __call__(self, *args, **kwargs):
         """Set multiple attributes on a subclass of BaseData at once via
            keyword arguments.  Valid attributes are anything specified in a
@@ -487,6 +929,38 @@ class BaseData(KickstartObject):
             if hasattr(self, key):
                 setattr(self, key, val)
 
+    def to_dict(self):
+        """Return a dict of all the attributes of this data object, suitable
+           for encoding as JSON.  The result can be turned back into a data
+           object with from_dict.
+        """
+        return dict((k, _encodeValue(v, None)) for (k, v) in self._attrItems()
+                    if not k.startswith("_"))
+
+    @classmethod
+    def from_dict(cls, d):
+        """Return a new instance of this class with the attributes given by d,
+           as returned by to_dict.
+        """
+        obj = cls()
+
+        for (k, v) in d.items():
+            setattr(obj, k, _decodeValue(v, getattr(obj, k, None), None))
+
+        return obj
+
+    def _attrItems(self):
+        # Every attribute that is set, whether it lives in a slot or, for
+        # subclasses without slots of their own, in __dict__.
+        for name in self._slotNames:
+            try:
+                yield (name, getattr(self, name))
+            except AttributeError:
+                pass
+
+        for item in getattr(self, "__dict__", {}).items():
+            yield item
+
     def deleteRemovedAttrs(self):
         """Remove all attributes from self that are given in the removedAttrs
            list.  This method should be called from __init__ in a subclass,
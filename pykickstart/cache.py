@@ -0,0 +1,425 @@
+#
+# Copyright 2016 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Caching of parse results.
+
+This module exports two classes:
+
+    ParseCache - Remembers the handler state that parsing a kickstart file
+                 produced, so parsing the same file again can skip straight
+                 to the result.
+    URLCache   - Remembers the contents of remote kickstart files, so they
+                 are only downloaded again when they have changed.
+
+A ParseCache is given to KickstartParser with the cache argument.  A URLCache
+is used for all remote files once pykickstart.load.URL_CACHE is set to it.
+"""
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import pickle
+import six
+import stat
+import tempfile
+import time
+import warnings
+
+from pykickstart.errors import KickstartError
+from pykickstart.load import load_to_str
+
+# Part of every ParseCache key.  Change it whenever what a snapshot holds
+# changes, so snapshots written by older versions are not used.
+_SNAPSHOT_FORMAT = "3"
+
+def _digest(s):
+    if s is None:
+        return None
+
+    if isinstance(s, six.text_type):
+        s = s.encode("utf-8")
+
+    return hashlib.sha1(s).hexdigest()
+
+class _HandlerPickler(pickle.Pickler):
+    # Commands and other objects refer back to their handler.  Those
+    # references are not written into the snapshot, so that restoring one
+    # points them at whatever handler is being restored into.
+    def __init__(self, f, handler):
+        pickle.Pickler.__init__(self, f, pickle.HIGHEST_PROTOCOL)
+        self._handler = handler
+
+    def persistent_id(self, obj):   # pylint: disable=method-hidden
+        if obj is self._handler:
+            return "handler"
+
+        return None
+
+class _HandlerUnpickler(pickle.Unpickler):
+    def __init__(self, f, handler):
+        pickle.Unpickler.__init__(self, f)
+        self._handler = handler
+
+    def persistent_load(self, pid):     # pylint: disable=method-hidden
+        if pid == "handler":
+            return self._handler
+
+        raise pickle.UnpicklingError("unknown persistent id %s" % pid)
+
+def _isPrivate(path):
+    # Return whether path belongs to this user and nobody else can write to
+    # it.
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return False
+
+    return not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+class ParseCache(object):
+    """A cache of parse results, keyed by the contents of the kickstart file,
+       the handler and its version, and the parser's settings.  Results are
+       kept as pickled snapshots of the handler's state.  The most recently
+       used maxsize results are kept in memory, and all of them are written
+       to directory as well if one is given.
+
+       Files brought in by %include are remembered along with each result.
+       If any of them have changed since, the result is thrown away and the
+       kickstart file is parsed again.  Warnings raised while parsing, or
+       added to the parser's diagnostics, are remembered too, and raised or
+       added again every time the result is used.  Parsers that do not treat
+       errors as fatal are never cached, since the errors they go past
+       could not be repeated.
+
+       Loading a pickled snapshot can run any code it names, so directory
+       must only be writable by whoever is using the cache.  If directory or
+       a file in it belongs to anyone else, or can be written to by anyone
+       else, the on-disk cache is not used at all.
+
+       Instance attributes:
+
+       directory -- The directory holding the on-disk cache, or None.
+       hits      -- The number of times a cached result was used.
+       maxsize   -- The largest number of results kept in memory.
+       misses    -- The number of times a kickstart file had to be parsed.
+    """
+    def __init__(self, maxsize=128, directory=None):
+        self.directory = directory
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Throw away everything in the in-memory cache.  The on-disk cache
+           is left alone.
+        """
+        self._entries.clear()
+
+    def _key(self, parser, s):
+        handler = parser.handler
+        # Masked commands show up as NoneType here.
+        cmdClasses = sorted((cmd, handler.commands.commandClass(cmd).__name__)
+                            for cmd in handler.commands)
+
+        parts = [_SNAPSHOT_FORMAT, _digest(s), handler.__class__.__module__, handler.__class__.__name__,
+                 str(handler.version), parser.__class__.__name__, str(cmdClasses),
+                 str(parser.followIncludes), str(parser.missingIncludeIsFatal),
+                 str(parser.unknownSectionIsFatal), str(parser._collectWarnings)]
+
+        # Relative %include paths are looked for in the current directory and
+        # the directory of the kickstart file.
+        if parser.followIncludes:
+            parts += [os.getcwd(), str(parser.currentdir.get(0))]
+
+        return _digest("\0".join(parts))
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".cache")
+
+    def _diskUsable(self):
+        return self.directory is not None and _isPrivate(self.directory)
+
+    def _get(self, key):
+        if key in self._entries:
+            entry = self._entries.pop(key)
+        elif self._diskUsable() and _isPrivate(self._path(key)):
+            try:
+                with open(self._path(key), "rb") as f:
+                    entry = pickle.load(f)
+            except (IOError, OSError, EOFError, pickle.UnpicklingError):
+                return None
+        else:
+            return None
+
+        # If any included file changed, this result is no good anymore.
+        for (path, digest) in entry[0]:
+            try:
+                current = _digest(load_to_str(path))
+            except KickstartError:
+                current = None
+
+            if current != digest:
+                self._remove(key)
+                return None
+
+        self._put(key, entry, write=False)
+        return entry
+
+    def _put(self, key, entry, write=True):
+        self._entries[key] = entry
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+        if write and self._diskUsable():
+            # Write to a temporary file first so other processes sharing the
+            # directory never see a partial entry.
+            (fd, tmpName) = tempfile.mkstemp(".tmp", "", self.directory)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+
+            os.rename(tmpName, self._path(key))
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+
+        if self.directory:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def read(self, parser, s, readFn):
+        """Set up parser.handler with the result of parsing the kickstart file
+           given by the string s.  If this has been parsed before, the
+           handler is restored from the cache.  Otherwise, the handler and
+           parser are reset, readFn is called to do the actual parsing, and
+           the result is stored in the cache.
+        """
+        if parser.handler is None or not parser.errorsAreFatal:
+            readFn()
+            return
+
+        key = self._key(parser, s)
+        entry = self._get(key)
+
+        if entry is not None:
+            self.hits += 1
+            (_includes, snapshot, caught, diagnostics) = entry
+            state = _HandlerUnpickler(six.BytesIO(snapshot), parser.handler).load()
+            parser.handler.__dict__.clear()
+            parser.handler.__dict__.update(state)
+
+            for d in diagnostics:
+                parser.diagnostics.add(*d)
+        else:
+            self.misses += 1
+            parser._resetHandler()
+            parser._includes = []
+            start = len(parser.diagnostics)
+
+            try:
+                with warnings.catch_warnings(record=True) as caught:
+                    readFn()
+
+                includes = [(path, _digest(contents)) for (path, contents) in parser._includes]
+            finally:
+                parser._includes = None
+
+            f = six.BytesIO()
+            _HandlerPickler(f, parser.handler).dump(parser.handler.__dict__)
+            caught = [(w.message, w.category, w.filename, w.lineno) for w in caught]
+            diagnostics = [(d.severity, d.code, d.message, d.lineno, d.file, d.command)
+                           for d in parser.diagnostics[start:]]
+            self._put(key, (includes, f.getvalue(), caught, diagnostics))
+
+        # Whether it's the first time or not, warnings should come out the
+        # same way.
+        for (message, category, filename, lineno) in caught:
+            warnings.warn_explicit(message, category, filename, lineno)
+
+class URLCache(object):
+    """An on-disk cache of remote kickstart files, keyed by URL.  Each file
+       is kept along with the ETag and Last-Modified headers it was sent
+       with.
+
+       A file fetched less than ttl seconds ago is used as it is.  After
+       that, the server is asked whether it has changed, using the
+       If-None-Match and If-Modified-Since headers.  If it has not, the copy
+       on disk is used and the ttl starts over.
+
+       When the files in the cache take up more than maxsize bytes, the ones
+       used least recently are thrown away.  This is safe to use from several
+       threads or processes at once.  Entries are stored as JSON, so nothing
+       in the directory is ever run as code.
+
+       Instance attributes:
+
+       directory -- The directory holding the cache.
+       maxsize   -- The largest number of bytes the cache may take up.
+       ttl       -- How many seconds a file is used before asking the server
+                    about it again.
+    """
+    def __init__(self, directory, ttl=300, maxsize=64*1024*1024):
+        self.directory = directory
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        # About how many bytes the cache takes up, or None if the directory
+        # hasn't been looked at yet.  Other processes may add to it too, so
+        # the real size is only found when it looks like it's too big.
+        self._size = None
+
+    def _path(self, url):
+        return os.path.join(self.directory, _digest(url) + ".url")
+
+    def get(self, url):
+        """Return the cached entry for url, or None.  An entry is a dict with
+           the keys contents, etag, lastModified, and fetched, which is the
+           time it was last known to be current.
+        """
+        path = self._path(url)
+
+        try:
+            with open(path, "rb") as f:
+                entry = json.loads(f.read().decode("utf-8"))
+        except (IOError, OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+
+        # Remember this was just used, for throwing out the oldest later.
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        return entry
+
+    def isFresh(self, entry):
+        """Return whether entry can be used without asking the server."""
+        return time.time() - entry["fetched"] < self.ttl
+
+    def headers(self, entry):
+        """Return the headers asking the server for the file only if it is
+           different from entry.
+        """
+        headers = {}
+
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["lastModified"]:
+            headers["If-Modified-Since"] = entry["lastModified"]
+
+        return headers
+
+    def put(self, url, contents, etag=None, lastModified=None):
+        """Store contents as the current version of url."""
+        entry = {"url": url, "contents": contents, "etag": etag,
+                 "lastModified": lastModified, "fetched": time.time()}
+
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                if not os.path.isdir(self.directory):
+                    raise
+
+        # Write to a temporary file first so nobody else sharing the
+        # directory ever sees a partial entry.
+        data = json.dumps(entry).encode("utf-8")
+        path = self._path(url)
+
+        if self._size is None:
+            self._size = self._scan()[1]
+
+        try:
+            self._size -= os.path.getsize(path)
+        except OSError:
+            pass
+
+        (fd, tmpName) = tempfile.mkstemp(".tmp", "", self.directory)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+        os.rename(tmpName, path)
+        self._size += len(data)
+
+        if self._size > self.maxsize:
+            self._evict()
+
+    def touch(self, url, entry):
+        """Note that the server said entry is still the current version of
+           url.
+        """
+        self.put(url, entry["contents"], entry["etag"], entry["lastModified"])
+
+    def clear(self):
+        """Throw away everything in the cache."""
+        for name in self._names():
+            self._remove(name)
+
+        self._size = 0
+
+    def _names(self):
+        try:
+            return [name for name in os.listdir(self.directory) if name.endswith(".url")]
+        except OSError:
+            return []
+
+    def _remove(self, name):
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
+
+    def _scan(self):
+        # Return a list of (mtime, name, size) for every entry, oldest first,
+        # and the total size.
+        entries = []
+        total = 0
+
+        for name in self._names():
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+
+            entries.append((st.st_mtime, name, st.st_size))
+            total += st.st_size
+
+        entries.sort()
+        return (entries, total)
+
+    def _evict(self):
+        (entries, total) = self._scan()
+
+        while total > self.maxsize and entries:
+            (_mtime, name, size) = entries.pop(0)
+            self._remove(name)
+            total -= size
+
+        self._size = total
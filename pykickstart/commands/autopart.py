@@ -56,8 +56,6 @@ class F9_AutoPart(FC3_AutoPart):
         self.encrypted = kwargs.get("encrypted", False)
         self.passphrase = kwargs.get("passphrase", "")
 
-        self.op = self._getParser()
-
     def __str__(self):
         retval = KickstartCommand.__str__(self)
 
@@ -212,13 +210,16 @@ class F16_AutoPart(F12_AutoPart):
         return op
 
 class F17_AutoPart(F16_AutoPart):
+    # This belongs to the class, since the option parser that reads it is
+    # shared by every instance.
+    typeMap = { "lvm": AUTOPART_TYPE_LVM,
+                "btrfs": AUTOPART_TYPE_BTRFS,
+                "plain": AUTOPART_TYPE_PLAIN,
+                "partition": AUTOPART_TYPE_PLAIN }
+
     def __init__(self, writePriority=100, *args, **kwargs):
         F16_AutoPart.__init__(self, writePriority=writePriority, *args, **kwargs)
         self.type = kwargs.get("type", None)
-        self.typeMap = { "lvm": AUTOPART_TYPE_LVM,
-                         "btrfs": AUTOPART_TYPE_BTRFS,
-                         "plain": AUTOPART_TYPE_PLAIN,
-                         "partition": AUTOPART_TYPE_PLAIN }
 
     def _typeAsStr(self):
         retval = None
@@ -247,10 +248,14 @@ class F17_AutoPart(F16_AutoPart):
         return retval
 
     def _getParser(self):
+        # None of these callbacks may refer to self, since the parser is
+        # shared by every instance of this class.
+        typeMap = self.typeMap
+
         def type_cb(option, opt_str, value, parser):
-            if value.lower() in self.typeMap:
+            if value.lower() in typeMap:
                 parser.values.ensure_value(option.dest,
-                                           self.typeMap[value.lower()])
+                                           typeMap[value.lower()])
 
         def nolvm_cb(option, opt_str, value, parser):
             parser.values.ensure_value(option.dest, AUTOPART_TYPE_PLAIN)
@@ -303,9 +308,8 @@ class F18_AutoPart(F17_AutoPart):
 
 
 class F20_AutoPart(F18_AutoPart):
-    def __init__(self, writePriority=100, *args, **kwargs):
-        F18_AutoPart.__init__(self, writePriority=writePriority, *args, **kwargs)
-        self.typeMap["thinp"] = AUTOPART_TYPE_LVM_THINP
+    typeMap = dict(F18_AutoPart.typeMap)
+    typeMap["thinp"] = AUTOPART_TYPE_LVM_THINP
 
     def parse(self, args):
         # call the overriden command to do it's job first
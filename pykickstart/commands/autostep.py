@@ -26,7 +26,6 @@ class FC3_AutoStep(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.autostep = kwargs.get("autostep", False)
         self.autoscreenshot = kwargs.get("autoscreenshot", False)
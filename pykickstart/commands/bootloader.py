@@ -29,7 +29,6 @@ class FC3_Bootloader(KickstartCommand):
 
     def __init__(self, writePriority=10, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.driveorder = kwargs.get("driveorder", [])
         self.appendLine = kwargs.get("appendLine", "")
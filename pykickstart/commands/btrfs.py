@@ -19,15 +19,18 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartValueError, formatErrorMsg
 from pykickstart.options import KSOptionParser
 
-import warnings
 from pykickstart.i18n import _
 
 class F17_BTRFSData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    # parent is taken on the command line but never written out.
+    __slots__ = ("format", "preexist", "label", "mountpoint", "devices",
+                 "dataLevel", "metaDataLevel", "subvol", "name", "parent")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -43,6 +46,9 @@ class F17_BTRFSData(BaseData):
         self.subvol = kwargs.get("subvol", False)
         self.name = kwargs.get("name", None)        # required
 
+    def _getDupKey(self):
+        return self.mountpoint
+
     def __eq__(self, y):
         if not y:
             return False
@@ -78,6 +84,7 @@ class F17_BTRFSData(BaseData):
 class F23_BTRFSData(F17_BTRFSData):
     removedKeywords = F17_BTRFSData.removedKeywords
     removedAttrs = F17_BTRFSData.removedAttrs
+    __slots__ = ("mkfsopts",)
 
     def __init__(self, *args, **kwargs):
         F17_BTRFSData.__init__(self, *args, **kwargs)
@@ -97,36 +104,38 @@ class F17_BTRFS(KickstartCommand):
     removedKeywords = KickstartCommand.removedKeywords
     removedAttrs = KickstartCommand.removedAttrs
 
+    # A dict of all the RAID levels we support.  This means that if we
+    # support more levels in the future, subclasses don't have to
+    # duplicate too much.  It belongs to the class, since the option parser
+    # that reads it is shared by every instance.
+    levelMap = { "raid0": "raid0", "0": "raid0",
+                 "raid1": "raid1", "1": "raid1",
+                 "raid10": "raid10", "10": "raid10",
+                 "single": "single" }
+
     def __init__(self, writePriority=132, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
-
-        # A dict of all the RAID levels we support.  This means that if we
-        # support more levels in the future, subclasses don't have to
-        # duplicate too much.
-        self.levelMap = { "raid0": "raid0", "0": "raid0",
-                          "raid1": "raid1", "1": "raid1",
-                          "raid10": "raid10", "10": "raid10",
-                          "single": "single" }
 
         self.btrfsList = kwargs.get("btrfsList", [])
 
     def __str__(self):
-        retval = ""
-        for btr in self.btrfsList:
-            retval += btr.__str__()
+        retval = "".join(btr.__str__() for btr in self.btrfsList)
 
         return retval
 
     def _getParser(self):
+        # None of these callbacks may refer to self, since the parser is
+        # shared by every instance of this class.
+        levelMap = self.levelMap
+
         # Have to be a little more complicated to set two values.
         def btrfs_cb (option, opt_str, value, parser):
             parser.values.format = False
             parser.values.preexist = True
 
         def level_cb (option, opt_str, value, parser):
-            if value.lower() in self.levelMap:
-                parser.values.ensure_value(option.dest, self.levelMap[value.lower()])
+            if value.lower() in levelMap:
+                parser.values.ensure_value(option.dest, levelMap[value.lower()])
 
         op = KSOptionParser()
         op.add_option("--noformat", action="callback", callback=btrfs_cb,
@@ -174,8 +183,8 @@ class F17_BTRFS(KickstartCommand):
         data.devices = extra[1:]
 
         # Check for duplicates in the data list.
-        if data in self.dataList():
-            warnings.warn(_("A btrfs volume with the mountpoint %s has already been defined.") % data.label)
+        if self._isDuplicate(data):
+            warn(_("A btrfs volume with the mountpoint %s has already been defined.") % data.label, "duplicate")
 
         return data
 
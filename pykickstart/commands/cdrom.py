@@ -29,7 +29,6 @@ class FC3_Cdrom(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
     def __str__(self):
         retval = KickstartCommand.__str__(self)
@@ -27,7 +27,6 @@ class FC3_ClearPart(KickstartCommand):
 
     def __init__(self, writePriority=120, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.drives = kwargs.get("drives", [])
         self.initAll = kwargs.get("initAll", False)
@@ -101,7 +100,7 @@ class F17_ClearPart(FC3_ClearPart):
         op = FC3_ClearPart._getParser(self)
 
         def list_cb (option, opt_str, value, parser):
-            self.type = CLEARPART_TYPE_LIST
+            parser.values.ensure_value("type", CLEARPART_TYPE_LIST)
             for d in value.split(','):
                 parser.values.ensure_value(option.dest, []).append(d)
 
@@ -18,15 +18,16 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartValueError, formatErrorMsg
 from pykickstart.options import KSOptionParser
 
-import warnings
 from pykickstart.i18n import _
 
 class F8_DeviceData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("moduleName", "moduleOpts")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -59,7 +60,6 @@ class FC3_Device(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.type = kwargs.get("type", "")
         self.moduleName = kwargs.get("moduleName", "")
@@ -110,9 +110,7 @@ class F8_Device(FC3_Device):
         self.deviceList = kwargs.get("deviceList", [])
 
     def __str__(self):
-        retval = ""
-        for device in self.deviceList:
-            retval += device.__str__()
+        retval = "".join(device.__str__() for device in self.deviceList)
 
         return retval
 
@@ -129,7 +127,7 @@ class F8_Device(FC3_Device):
 
         # Check for duplicates in the data list.
         if dd in self.dataList():
-            warnings.warn(_("A module with the name %s has already been defined.") % dd.moduleName)
+            warn(_("A module with the name %s has already been defined.") % dd.moduleName, "duplicate")
 
         return dd
 
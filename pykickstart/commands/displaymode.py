@@ -30,7 +30,6 @@ class FC3_DisplayMode(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.displayMode = kwargs.get("displayMode", None)
 
     def __str__(self):
@@ -19,14 +19,15 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.options import KSOptionParser
 
-import warnings
 from pykickstart.i18n import _
 
 class FC6_DmRaidData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("name", "devices", "dmset")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -59,14 +60,11 @@ class FC6_DmRaid(KickstartCommand):
 
     def __init__(self, writePriority=60, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.dmraids = kwargs.get("dmraids", [])
 
     def __str__(self):
-        retval = ""
-        for dm in self.dmraids:
-            retval += dm.__str__()
+        retval = "".join(dm.__str__() for dm in self.dmraids)
 
         return retval
 
@@ -87,7 +85,7 @@ class FC6_DmRaid(KickstartCommand):
 
         # Check for duplicates in the data list.
         if dm in self.dataList():
-            warnings.warn(_("A DM RAID device with the name %s and devices %s has already been defined.") % (dm.name, dm.devices))
+            warn(_("A DM RAID device with the name %s and devices %s has already been defined.") % (dm.name, dm.devices), "duplicate")
 
         return dm
 
@@ -26,6 +26,7 @@ from pykickstart.i18n import _
 class FC3_DriverDiskData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("partition", "source", "type")
 
     def __init__(self, writePriority=0, *args, **kwargs):
         BaseData.__init__(self, writePriority, *args, **kwargs)
@@ -54,6 +55,7 @@ class FC3_DriverDiskData(BaseData):
 class FC4_DriverDiskData(FC3_DriverDiskData):
     removedKeywords = FC3_DriverDiskData.removedKeywords
     removedAttrs = FC3_DriverDiskData.removedAttrs
+    __slots__ = ("biospart",)
 
     def __init__(self, writePriority=0, *args, **kwargs):
         FC3_DriverDiskData.__init__(self, *args, **kwargs)
@@ -79,6 +81,7 @@ class FC4_DriverDiskData(FC3_DriverDiskData):
 class F12_DriverDiskData(FC4_DriverDiskData):
     removedKeywords = FC4_DriverDiskData.removedKeywords + ["type"]
     removedAttrs = FC4_DriverDiskData.removedAttrs + ["type"]
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         FC4_DriverDiskData.__init__(self, *args, **kwargs)
@@ -92,14 +95,11 @@ class FC3_DriverDisk(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.driverdiskList = kwargs.get("driverdiskList", [])
 
     def __str__(self):
-        retval = ""
-        for dd in self.driverdiskList:
-            retval += dd.__str__()
+        retval = "".join(dd.__str__() for dd in self.driverdiskList)
 
         return retval
 
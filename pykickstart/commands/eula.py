@@ -29,7 +29,6 @@ class F20_Eula(KickstartCommand):
 
     def __init__(self, *args, **kwargs):
         KickstartCommand.__init__(self, *args, **kwargs)
-        self.op = self._getParser()
         self.agreed = kwargs.get("agreed", False)
 
     def __str__(self):
@@ -18,15 +18,16 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartValueError, formatErrorMsg
 from pykickstart.options import KSOptionParser
 
-import warnings
 from pykickstart.i18n import _
 
 class F12_FcoeData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("nic",)
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -57,6 +58,8 @@ class F12_FcoeData(BaseData):
 class F13_FcoeData(F12_FcoeData):
     removedKeywords = F12_FcoeData.removedKeywords
     removedAttrs = F12_FcoeData.removedAttrs
+    # RHEL7 pairs this with a command that takes --autovlan.
+    __slots__ = ("dcb", "autovlan")
 
     def __init__(self, *args, **kwargs):
         F12_FcoeData.__init__(self, *args, **kwargs)
@@ -73,6 +76,7 @@ class F13_FcoeData(F12_FcoeData):
 class RHEL7_FcoeData(F13_FcoeData):
     removedKeywords = F13_FcoeData.removedKeywords
     removedAttrs = F13_FcoeData.removedAttrs
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         F13_FcoeData.__init__(self, *args, **kwargs)
@@ -92,13 +96,10 @@ class F12_Fcoe(KickstartCommand):
 
     def __init__(self, writePriority=71, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.fcoe = kwargs.get("fcoe", [])
 
     def __str__(self):
-        retval = ""
-        for fcoe in self.fcoe:
-            retval += fcoe.__str__()
+        retval = "".join(fcoe.__str__() for fcoe in self.fcoe)
 
         return retval
 
@@ -119,7 +120,7 @@ class F12_Fcoe(KickstartCommand):
 
         # Check for duplicates in the data list.
         if zd in self.dataList():
-            warnings.warn(_("A FCOE device with the name %s has already been defined.") % zd.nic)
+            warn(_("A FCOE device with the name %s has already been defined.") % zd.nic, "duplicate")
 
         return zd
 
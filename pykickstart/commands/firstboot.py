@@ -27,7 +27,6 @@ class FC3_Firstboot(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.firstboot = kwargs.get("firstboot", None)
 
@@ -18,19 +18,19 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
-from pykickstart.options import KSOptionParser
+from pykickstart.diagnostics import warn
+from pykickstart.schema import Field, buildParser
 
-import warnings
 from pykickstart.i18n import _
 
 class F12_GroupData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
 
-    def __init__(self, *args, **kwargs):
-        BaseData.__init__(self, *args, **kwargs)
-        self.name = kwargs.get("name", "")
-        self.gid = kwargs.get("gid", None)
+    fields = (
+        Field("name", "", opts=["--name"], render=" --name=%s", required=1),
+        Field("gid", None, opts=["--gid"], render=" --gid=%s", type="int"),
+    )
 
     def __eq__(self, y):
         if not y:
@@ -43,12 +43,7 @@ class F12_GroupData(BaseData):
 
     def __str__(self):
         retval = BaseData.__str__(self)
-        retval += "group"
-
-        if self.name:
-            retval += " --name=%s" % self.name
-        if self.gid:
-            retval += " --gid=%s" % self.gid
+        retval += "group" + self._getArgsAsStr()
 
         return retval + "\n"
 
@@ -58,22 +53,16 @@ class F12_Group(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.groupList = kwargs.get("groupList", [])
 
     def __str__(self):
-        retval = ""
-        for user in self.groupList:
-            retval += user.__str__()
+        retval = "".join(user.__str__() for user in self.groupList)
 
         return retval
 
     def _getParser(self):
-        op = KSOptionParser()
-        op.add_option("--name", required=1)
-        op.add_option("--gid", type="int")
-        return op
+        return buildParser(F12_GroupData.fields)
 
     def parse(self, args):
         gd = self.handler.GroupData()
@@ -83,7 +72,7 @@ class F12_Group(KickstartCommand):
 
         # Check for duplicates in the data list.
         if gd in self.dataList():
-            warnings.warn(_("A group with the name %s has already been defined.") % gd.name)
+            warn(_("A group with the name %s has already been defined.") % gd.name, "duplicate")
 
         return gd
 
@@ -33,8 +33,6 @@ class FC3_HardDrive(KickstartCommand):
         self.partition = kwargs.get("partition", None)
         self.dir = kwargs.get("dir", None)
 
-        self.op = self._getParser()
-
     def __eq__(self, other):
         if not other:
             return False
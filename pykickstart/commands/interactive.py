@@ -29,7 +29,6 @@ class FC3_Interactive(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.interactive = kwargs.get("interactive", False)
 
     def __str__(self):
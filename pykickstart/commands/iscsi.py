@@ -27,6 +27,7 @@ from pykickstart.i18n import _
 class FC6_IscsiData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("ipaddr", "port", "target", "user", "password")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -60,6 +61,7 @@ class FC6_IscsiData(BaseData):
 class F10_IscsiData(FC6_IscsiData):
     removedKeywords = FC6_IscsiData.removedKeywords
     removedAttrs = FC6_IscsiData.removedAttrs
+    __slots__ = ("user_in", "password_in")
 
     def __init__(self, *args, **kwargs):
         FC6_IscsiData.__init__(self, *args, **kwargs)
@@ -79,6 +81,7 @@ class F10_IscsiData(FC6_IscsiData):
 class RHEL6_IscsiData(F10_IscsiData):
     removedKeywords = F10_IscsiData.removedKeywords
     removedAttrs = F10_IscsiData.removedAttrs
+    __slots__ = ("iface",)
 
     def __init__(self, *args, **kwargs):
         F10_IscsiData.__init__(self, *args, **kwargs)
@@ -95,6 +98,7 @@ class RHEL6_IscsiData(F10_IscsiData):
 class F17_IscsiData(F10_IscsiData):
     removedKeywords = F10_IscsiData.removedKeywords
     removedAttrs = F10_IscsiData.removedAttrs
+    __slots__ = ("iface",)
 
     def __init__(self, *args, **kwargs):
         F10_IscsiData.__init__(self, *args, **kwargs)
@@ -114,14 +118,11 @@ class FC6_Iscsi(KickstartCommand):
 
     def __init__(self, writePriority=71, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.iscsi = kwargs.get("iscsi", [])
 
     def __str__(self):
-        retval = ""
-        for iscsi in self.iscsi:
-            retval += iscsi.__str__()
+        retval = "".join(iscsi.__str__() for iscsi in self.iscsi)
 
         return retval
 
@@ -30,7 +30,6 @@ class FC6_IscsiName(KickstartCommand):
 
     def __init__(self, writePriority=70, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.iscsiname = kwargs.get("iscsiname", "")
 
     def __str__(self):
@@ -29,7 +29,6 @@ class FC3_Keyboard(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.keyboard = kwargs.get("keyboard", "")
 
     def __str__(self):
@@ -56,7 +55,6 @@ class FC3_Keyboard(KickstartCommand):
 class F18_Keyboard(FC3_Keyboard):
     def __init__(self, writePriority=0, *args, **kwargs):               # pylint: disable=super-init-not-called
         KickstartCommand.__init__(self, writePriority, *args, **kwargs) # pylint: disable=non-parent-init-called
-        self.op = self._getParser()
         self._keyboard = kwargs.get("_keyboard", "")
         self.vc_keymap = kwargs.get("vc_keymap", "")
         self.x_layouts = kwargs.get("x_layouts", [])
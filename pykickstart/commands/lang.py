@@ -29,7 +29,6 @@ class FC3_Lang(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.lang = kwargs.get("lang", "")
 
     def __str__(self):
@@ -60,8 +59,6 @@ class F19_Lang(FC3_Lang):
         FC3_Lang.__init__(self, writePriority, *args, **kwargs)
         self.addsupport = kwargs.get("addsupport", [])
 
-        self.op = self._getParser()
-
     def __str__(self):
         s = FC3_Lang.__str__(self)
         if s and self.addsupport:
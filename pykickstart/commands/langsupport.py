@@ -26,7 +26,6 @@ class FC3_LangSupport(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.deflang = kwargs.get("deflang", "")
         self.supported = kwargs.get("supported", [])
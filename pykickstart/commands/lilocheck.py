@@ -29,7 +29,6 @@ class FC3_LiloCheck(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.check = kwargs.get("check", False)
 
     def __str__(self):
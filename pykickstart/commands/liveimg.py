@@ -31,8 +31,6 @@ class F19_Liveimg(KickstartCommand):
         self.proxy = kwargs.get("proxy", None)
         self.url = kwargs.get("url", None)
 
-        self.op = self._getParser()
-
     def __eq__(self, other):
         if not other:
             return False
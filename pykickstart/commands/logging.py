@@ -29,7 +29,6 @@ class FC6_Logging(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.host = kwargs.get("host", "")
         self.level = kwargs.get("level", "")
@@ -18,15 +18,17 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartParseError, KickstartValueError, formatErrorMsg
 from pykickstart.options import KSOptionParser
 
-import warnings
 from pykickstart.i18n import _
 
 class FC3_LogVolData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("fstype", "grow", "maxSizeMB", "name", "format", "percent",
+                 "recommended", "size", "preexist", "vgname", "mountpoint")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -42,6 +44,9 @@ class FC3_LogVolData(BaseData):
         self.vgname = kwargs.get("vgname", "")
         self.mountpoint = kwargs.get("mountpoint", "")
 
+    def _getDupKey(self):
+        return (self.vgname, self.name)
+
     def __eq__(self, y):
         if not y:
             return False
@@ -81,6 +86,7 @@ class FC3_LogVolData(BaseData):
 class FC4_LogVolData(FC3_LogVolData):
     removedKeywords = FC3_LogVolData.removedKeywords
     removedAttrs = FC3_LogVolData.removedAttrs
+    __slots__ = ("bytesPerInode", "fsopts")
 
     def __init__(self, *args, **kwargs):
         FC3_LogVolData.__init__(self, *args, **kwargs)
@@ -100,6 +106,7 @@ class FC4_LogVolData(FC3_LogVolData):
 class RHEL5_LogVolData(FC4_LogVolData):
     removedKeywords = FC4_LogVolData.removedKeywords
     removedAttrs = FC4_LogVolData.removedAttrs
+    __slots__ = ("encrypted", "passphrase")
 
     def __init__(self, *args, **kwargs):
         FC4_LogVolData.__init__(self, *args, **kwargs)
@@ -120,6 +127,7 @@ class RHEL5_LogVolData(FC4_LogVolData):
 class F9_LogVolData(FC4_LogVolData):
     removedKeywords = FC4_LogVolData.removedKeywords + ["bytesPerInode"]
     removedAttrs = FC4_LogVolData.removedAttrs + ["bytesPerInode"]
+    __slots__ = ("fsprofile", "encrypted", "passphrase")
 
     def __init__(self, *args, **kwargs):
         FC4_LogVolData.__init__(self, *args, **kwargs)
@@ -146,6 +154,7 @@ class F9_LogVolData(FC4_LogVolData):
 class F12_LogVolData(F9_LogVolData):
     removedKeywords = F9_LogVolData.removedKeywords
     removedAttrs = F9_LogVolData.removedAttrs
+    __slots__ = ("escrowcert", "backuppassphrase")
 
     def __init__(self, *args, **kwargs):
         F9_LogVolData.__init__(self, *args, **kwargs)
@@ -168,6 +177,8 @@ class F12_LogVolData(F9_LogVolData):
 class RHEL6_LogVolData(F12_LogVolData):
     removedKeywords = F12_LogVolData.removedKeywords
     removedAttrs = F12_LogVolData.removedAttrs
+    __slots__ = ("cipher", "hibernation", "thin_pool", "thin_volume",
+                 "pool_name", "chunk_size", "metadata_size", "profile")
 
     def __init__(self, *args, **kwargs):
         F12_LogVolData.__init__(self, *args, **kwargs)
@@ -213,6 +224,7 @@ F14_LogVolData = F12_LogVolData
 class F15_LogVolData(F14_LogVolData):
     removedKeywords = F14_LogVolData.removedKeywords
     removedAttrs = F14_LogVolData.removedAttrs
+    __slots__ = ("label",)
 
     def __init__(self, *args, **kwargs):
         F14_LogVolData.__init__(self, *args, **kwargs)
@@ -229,6 +241,7 @@ class F15_LogVolData(F14_LogVolData):
 class F17_LogVolData(F15_LogVolData):
     removedKeywords = F15_LogVolData.removedKeywords
     removedAttrs = F15_LogVolData.removedAttrs
+    __slots__ = ("resize",)
 
     def __init__(self, *args, **kwargs):
         F15_LogVolData.__init__(self, *args, **kwargs)
@@ -244,6 +257,7 @@ class F17_LogVolData(F15_LogVolData):
 class F18_LogVolData(F17_LogVolData):
     removedKeywords = F17_LogVolData.removedKeywords
     removedAttrs = F17_LogVolData.removedAttrs
+    __slots__ = ("hibernation", "cipher")
 
     def __init__(self, *args, **kwargs):
         F17_LogVolData.__init__(self, *args, **kwargs)
@@ -264,6 +278,8 @@ class F18_LogVolData(F17_LogVolData):
 class F20_LogVolData(F18_LogVolData):
     removedKeywords = F18_LogVolData.removedKeywords
     removedAttrs = F18_LogVolData.removedAttrs
+    __slots__ = ("thin_pool", "thin_volume", "pool_name", "chunk_size",
+                 "metadata_size")
 
     def __init__(self, *args, **kwargs):
         F18_LogVolData.__init__(self, *args, **kwargs)
@@ -295,6 +311,7 @@ class F20_LogVolData(F18_LogVolData):
 class F21_LogVolData(F20_LogVolData):
     removedKeywords = F20_LogVolData.removedKeywords
     removedAttrs = F20_LogVolData.removedAttrs
+    __slots__ = ("profile",)
 
     def __init__(self, *args, **kwargs):
         F20_LogVolData.__init__(self, *args, **kwargs)
@@ -311,6 +328,7 @@ class F21_LogVolData(F20_LogVolData):
 class RHEL7_LogVolData(F21_LogVolData):
     removedKeywords = F21_LogVolData.removedKeywords
     removedAttrs = F21_LogVolData.removedAttrs
+    __slots__ = ("mkfsopts",)
 
     def __init__(self, *args, **kwargs):
         F21_LogVolData.__init__(self, *args, **kwargs)
@@ -325,6 +343,7 @@ class RHEL7_LogVolData(F21_LogVolData):
         return retval
 
 class F23_LogVolData(F21_LogVolData):
+    __slots__ = ("cache_size", "cache_mode", "cache_pvs", "mkfsopts")
     def __init__(self, *args, **kwargs):
         F21_LogVolData.__init__(self, *args, **kwargs)
         self.cache_size = kwargs.get("cache_size", 0)
@@ -352,15 +371,11 @@ class FC3_LogVol(KickstartCommand):
 
     def __init__(self, writePriority=133, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.lvList = kwargs.get("lvList", [])
 
     def __str__(self):
-        retval = ""
-
-        for part in self.lvList:
-            retval += part.__str__()
+        retval = "".join(part.__str__() for part in self.lvList)
 
         return retval
 
@@ -401,8 +416,8 @@ class FC3_LogVol(KickstartCommand):
         lvd.mountpoint=extra[0]
 
         # Check for duplicates in the data list.
-        if lvd in self.dataList():
-            warnings.warn(_("A logical volume with the name %s has already been defined in volume group %s.") % (lvd.name, lvd.vgname))
+        if self._isDuplicate(lvd):
+            warn(_("A logical volume with the name %s has already been defined in volume group %s.") % (lvd.name, lvd.vgname), "duplicate")
 
         return lvd
 
@@ -29,7 +29,6 @@ class FC4_MediaCheck(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.mediacheck = kwargs.get("mediacheck", False)
 
     def __str__(self):
@@ -30,6 +30,12 @@ class FC3_Method(KickstartCommand):
 
     _methods = ["cdrom", "harddrive", "nfs", "url"]
 
+    # The option parser is looked up in the seen method like everything
+    # else, instead of KickstartCommand building one for this class.
+    @property
+    def op(self):
+        return self.__getattr__("op")
+
     def _clear_seen(self):
         """ Reset all the method's seen attrs to False"""
         for method in self._methods:
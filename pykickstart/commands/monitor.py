@@ -29,7 +29,6 @@ class FC3_Monitor(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.hsync = kwargs.get("hsync", "")
         self.monitor = kwargs.get("monitor", "")
@@ -29,7 +29,6 @@ class RHEL3_Mouse(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.device = kwargs.get("device", "")
         self.emulthree = kwargs.get("emulthree", False)
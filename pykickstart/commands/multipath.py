@@ -27,6 +27,7 @@ from pykickstart.i18n import _
 class FC6_MpPathData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("mpdev", "device", "rule")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -40,6 +41,7 @@ class FC6_MpPathData(BaseData):
 class FC6_MultiPathData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("name", "paths")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -60,14 +62,11 @@ class FC6_MultiPath(KickstartCommand):
 
     def __init__(self, writePriority=50, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.mpaths = kwargs.get("mpaths", [])
 
     def __str__(self):
-        retval = ""
-        for mpath in self.mpaths:
-            retval += mpath.__str__()
+        retval = "".join(mpath.__str__() for mpath in self.mpaths)
 
         return retval
 
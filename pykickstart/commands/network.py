@@ -19,10 +19,10 @@
 #
 from pykickstart.base import BaseData, KickstartCommand
 from pykickstart.constants import BOOTPROTO_BOOTP, BOOTPROTO_DHCP, BOOTPROTO_IBFT, BOOTPROTO_QUERY, BOOTPROTO_STATIC
+from pykickstart.diagnostics import warn
 from pykickstart.options import KSOptionParser
 from pykickstart.errors import KickstartValueError, formatErrorMsg
 
-import warnings
 from pykickstart.i18n import _
 
 MIN_VLAN_ID = 0
@@ -31,6 +31,9 @@ MAX_VLAN_ID = 4095
 class FC3_NetworkData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("bootProto", "dhcpclass", "device", "essid", "ethtool",
+                 "gateway", "hostname", "ip", "mtu", "nameserver", "netmask",
+                 "nodns", "onboot", "wepkey")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -100,6 +103,7 @@ class FC3_NetworkData(BaseData):
 class FC4_NetworkData(FC3_NetworkData):
     removedKeywords = FC3_NetworkData.removedKeywords
     removedAttrs = FC3_NetworkData.removedAttrs
+    __slots__ = ("notksdevice",)
 
     def __init__(self, *args, **kwargs):
         FC3_NetworkData.__init__(self, *args, **kwargs)
@@ -116,6 +120,7 @@ class FC4_NetworkData(FC3_NetworkData):
 class FC6_NetworkData(FC4_NetworkData):
     removedKeywords = FC4_NetworkData.removedKeywords
     removedAttrs = FC4_NetworkData.removedAttrs
+    __slots__ = ("noipv4", "noipv6")
 
     def __init__(self, *args, **kwargs):
         FC4_NetworkData.__init__(self, *args, **kwargs)
@@ -135,6 +140,7 @@ class FC6_NetworkData(FC4_NetworkData):
 class F8_NetworkData(FC6_NetworkData):
     removedKeywords = FC6_NetworkData.removedKeywords
     removedAttrs = FC6_NetworkData.removedAttrs
+    __slots__ = ("ipv6",)
 
     def __init__(self, *args, **kwargs):
         FC6_NetworkData.__init__(self, *args, **kwargs)
@@ -151,6 +157,9 @@ class F8_NetworkData(FC6_NetworkData):
 class F16_NetworkData(F8_NetworkData):
     removedKeywords = F8_NetworkData.removedKeywords
     removedAttrs = F8_NetworkData.removedAttrs
+    # F18 pairs this with a command that takes the options F19 adds.
+    __slots__ = ("activate", "nodefroute", "wpakey", "bondslaves", "bondopts",
+                 "vlanid", "ipv6gateway")
 
     def __init__(self, *args, **kwargs):
         F8_NetworkData.__init__(self, *args, **kwargs)
@@ -173,6 +182,7 @@ class F16_NetworkData(F8_NetworkData):
 class F19_NetworkData(F16_NetworkData):
     removedKeywords = F16_NetworkData.removedKeywords
     removedAttrs = F16_NetworkData.removedAttrs
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         F16_NetworkData.__init__(self, *args, **kwargs)
@@ -198,6 +208,7 @@ class F19_NetworkData(F16_NetworkData):
 class F20_NetworkData(F19_NetworkData):
     removedKeywords = F19_NetworkData.removedKeywords
     removedAttrs = F19_NetworkData.removedAttrs
+    __slots__ = ("teamslaves", "teamconfig")
 
     def __init__(self, *args, **kwargs):
         F19_NetworkData.__init__(self, *args, **kwargs)
@@ -223,6 +234,7 @@ class F20_NetworkData(F19_NetworkData):
 class F21_NetworkData(F20_NetworkData):
     removedKeywords = F20_NetworkData.removedKeywords
     removedAttrs = F20_NetworkData.removedAttrs
+    __slots__ = ("interfacename",)
 
     def __init__(self, *args, **kwargs):
         F20_NetworkData.__init__(self, *args, **kwargs)
@@ -238,6 +250,7 @@ class F21_NetworkData(F20_NetworkData):
 class F22_NetworkData(F21_NetworkData):
     removedKeywords = F21_NetworkData.removedKeywords
     removedAttrs = F21_NetworkData.removedAttrs
+    __slots__ = ("bridgeslaves", "bridgeopts")
 
     def __init__(self, *args, **kwargs):
         F21_NetworkData.__init__(self, *args, **kwargs)
@@ -256,6 +269,7 @@ class F22_NetworkData(F21_NetworkData):
 class RHEL4_NetworkData(FC3_NetworkData):
     removedKeywords = FC3_NetworkData.removedKeywords
     removedAttrs = FC3_NetworkData.removedAttrs
+    __slots__ = ("notksdevice",)
 
     def __init__(self, *args, **kwargs):
         FC3_NetworkData.__init__(self, *args, **kwargs)
@@ -272,6 +286,7 @@ class RHEL4_NetworkData(FC3_NetworkData):
 class RHEL6_NetworkData(F8_NetworkData):
     removedKeywords = F8_NetworkData.removedKeywords
     removedAttrs = F8_NetworkData.removedAttrs
+    __slots__ = ("activate", "nodefroute", "vlanid", "bondslaves", "bondopts")
 
     def __init__(self, *args, **kwargs):
         F8_NetworkData.__init__(self, *args, **kwargs)
@@ -301,6 +316,7 @@ class RHEL6_NetworkData(F8_NetworkData):
 class RHEL7_NetworkData(F21_NetworkData):
     removedKeywords = F21_NetworkData.removedKeywords
     removedAttrs = F21_NetworkData.removedAttrs
+    __slots__ = ("bridgeslaves", "bridgeopts")
 
     def __init__(self, *args, **kwargs):
         F21_NetworkData.__init__(self, *args, **kwargs)
@@ -320,20 +336,17 @@ class FC3_Network(KickstartCommand):
     removedKeywords = KickstartCommand.removedKeywords
     removedAttrs = KickstartCommand.removedAttrs
 
+    # This belongs to the class, since the option parser that reads it is
+    # shared by every instance.
+    bootprotoList = [BOOTPROTO_DHCP, BOOTPROTO_BOOTP,
+                     BOOTPROTO_STATIC]
+
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.bootprotoList = [BOOTPROTO_DHCP, BOOTPROTO_BOOTP,
-                              BOOTPROTO_STATIC]
-
-        self.op = self._getParser()
-
         self.network = kwargs.get("network", [])
 
     def __str__(self):
-        retval = ""
-
-        for nic in self.network:
-            retval += nic.__str__()
+        retval = "".join(nic.__str__() for nic in self.network)
 
         if retval != "":
             return "# Network information\n" + retval
@@ -370,7 +383,7 @@ class FC3_Network(KickstartCommand):
 
         # Check for duplicates in the data list.
         if nd in self.dataList():
-            warnings.warn(_("A network device with the name %s has already been defined.") % nd.device)
+            warn(_("A network device with the name %s has already been defined.") % nd.device, "duplicate")
 
         return nd
 
@@ -412,9 +425,7 @@ class F9_Network(F8_Network):
     removedKeywords = F8_Network.removedKeywords
     removedAttrs = F8_Network.removedAttrs
 
-    def __init__(self, writePriority=0, *args, **kwargs):
-        F8_Network.__init__(self, writePriority, *args, **kwargs)
-        self.bootprotoList.append(BOOTPROTO_QUERY)
+    bootprotoList = F8_Network.bootprotoList + [BOOTPROTO_QUERY]
 
     def _getParser(self):
         op = F8_Network._getParser(self)
@@ -427,9 +438,7 @@ class F16_Network(F9_Network):
     removedKeywords = F9_Network.removedKeywords
     removedAttrs = F9_Network.removedAttrs
 
-    def __init__(self, writePriority=0, *args, **kwargs):
-        F9_Network.__init__(self, writePriority, *args, **kwargs)
-        self.bootprotoList.append(BOOTPROTO_IBFT)
+    bootprotoList = F9_Network.bootprotoList + [BOOTPROTO_IBFT]
 
     def _getParser(self):
         op = F9_Network._getParser(self)
@@ -572,9 +581,7 @@ class RHEL5_Network(FC6_Network):
     removedKeywords = FC6_Network.removedKeywords
     removedAttrs = FC6_Network.removedAttrs
 
-    def __init__(self, writePriority=0, *args, **kwargs):
-        FC6_Network.__init__(self, writePriority, *args, **kwargs)
-        self.bootprotoList.append(BOOTPROTO_QUERY)
+    bootprotoList = FC6_Network.bootprotoList + [BOOTPROTO_QUERY]
 
     def _getParser(self):
         op = FC6_Network._getParser(self)
@@ -587,9 +594,7 @@ class RHEL6_Network(F9_Network):
     removedKeywords = F9_Network.removedKeywords
     removedAttrs = F9_Network.removedAttrs
 
-    def __init__(self, writePriority=0, *args, **kwargs):
-        F9_Network.__init__(self, writePriority, *args, **kwargs)
-        self.bootprotoList.append(BOOTPROTO_IBFT)
+    bootprotoList = F9_Network.bootprotoList + [BOOTPROTO_IBFT]
 
     def _getParser(self):
         op = F9_Network._getParser(self)
@@ -29,8 +29,6 @@ class FC3_NFS(KickstartCommand):
         self.server = kwargs.get("server", None)
         self.dir = kwargs.get("dir", None)
 
-        self.op = self._getParser()
-
     def __eq__(self, other):
         if not other:
             return False
@@ -26,7 +26,6 @@ class F21_OSTreeSetup(KickstartCommand):
 
     def __init__(self, *args, **kwargs):
         KickstartCommand.__init__(self, *args, **kwargs)
-        self.op = self._getParser()
         self.osname = kwargs.get('osname', None)
         self.remote = kwargs.get("remote", self.osname)
         self.url = kwargs.get('url', None)
@@ -18,15 +18,18 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartParseError, KickstartValueError, formatErrorMsg
 from pykickstart.options import KSOptionParser
 
-import warnings
 from pykickstart.i18n import _
 
 class FC3_PartData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("active", "primOnly", "end", "fstype", "grow", "maxSizeMB",
+                 "format", "onbiosdisk", "disk", "onPart", "recommended",
+                 "size", "start", "mountpoint")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -45,6 +48,9 @@ class FC3_PartData(BaseData):
         self.start = kwargs.get("start", 0)
         self.mountpoint = kwargs.get("mountpoint", "")
 
+    def _getDupKey(self):
+        return self.mountpoint
+
     def __eq__(self, y):
         if not y:
             return False
@@ -94,6 +100,7 @@ class FC3_PartData(BaseData):
 class FC4_PartData(FC3_PartData):
     removedKeywords = FC3_PartData.removedKeywords
     removedAttrs = FC3_PartData.removedAttrs
+    __slots__ = ("bytesPerInode", "fsopts", "label")
 
     def __init__(self, *args, **kwargs):
         FC3_PartData.__init__(self, *args, **kwargs)
@@ -116,6 +123,7 @@ class FC4_PartData(FC3_PartData):
 class RHEL5_PartData(FC4_PartData):
     removedKeywords = FC4_PartData.removedKeywords
     removedAttrs = FC4_PartData.removedAttrs
+    __slots__ = ("encrypted", "passphrase")
 
     def __init__(self, *args, **kwargs):
         FC4_PartData.__init__(self, *args, **kwargs)
@@ -136,6 +144,7 @@ class RHEL5_PartData(FC4_PartData):
 class F9_PartData(FC4_PartData):
     removedKeywords = FC4_PartData.removedKeywords + ["bytesPerInode"]
     removedAttrs = FC4_PartData.removedAttrs + ["bytesPerInode"]
+    __slots__ = ("fsprofile", "encrypted", "passphrase")
 
     def __init__(self, *args, **kwargs):
         FC4_PartData.__init__(self, *args, **kwargs)
@@ -163,10 +172,12 @@ class F9_PartData(FC4_PartData):
 class F11_PartData(F9_PartData):
     removedKeywords = F9_PartData.removedKeywords + ["start", "end"]
     removedAttrs = F9_PartData.removedAttrs + ["start", "end"]
+    __slots__ = ()
 
 class F12_PartData(F11_PartData):
     removedKeywords = F11_PartData.removedKeywords
     removedAttrs = F11_PartData.removedAttrs
+    __slots__ = ("escrowcert", "backuppassphrase")
 
     def __init__(self, *args, **kwargs):
         F11_PartData.__init__(self, *args, **kwargs)
@@ -188,6 +199,7 @@ class F12_PartData(F11_PartData):
 class RHEL6_PartData(F12_PartData):
     removedKeywords = F12_PartData.removedKeywords
     removedAttrs = F12_PartData.removedAttrs
+    __slots__ = ("cipher", "hibernation")
 
     def __init__(self, *args, **kwargs):
         F12_PartData.__init__(self, *args, **kwargs)
@@ -210,6 +222,7 @@ F14_PartData = F12_PartData
 class F17_PartData(F14_PartData):
     removedKeywords = F14_PartData.removedKeywords
     removedAttrs = F14_PartData.removedAttrs
+    __slots__ = ("resize",)
 
     def __init__(self, *args, **kwargs):
         F14_PartData.__init__(self, *args, **kwargs)
@@ -227,6 +240,7 @@ class F17_PartData(F14_PartData):
 class F18_PartData(F17_PartData):
     removedKeywords = F17_PartData.removedKeywords
     removedAttrs = F17_PartData.removedAttrs
+    __slots__ = ("hibernation", "cipher")
 
     def __init__(self, *args, **kwargs):
         F17_PartData.__init__(self, *args, **kwargs)
@@ -246,6 +260,7 @@ class F18_PartData(F17_PartData):
         return retval
 
 class F23_PartData(F18_PartData):
+    __slots__ = ("mkfsopts",)
     def __init__(self, *args, **kwargs):
         F18_PartData.__init__(self, *args, **kwargs)
 
@@ -267,15 +282,11 @@ class FC3_Partition(KickstartCommand):
 
     def __init__(self, writePriority=130, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.partitions = kwargs.get("partitions", [])
 
     def __str__(self):
-        retval = ""
-
-        for part in self.partitions:
-            retval += part.__str__()
+        retval = "".join(part.__str__() for part in self.partitions)
 
         if retval != "":
             return "# Disk partitioning information\n" + retval
@@ -326,8 +337,8 @@ class FC3_Partition(KickstartCommand):
         pd.mountpoint=extra[0]
 
         # Check for duplicates in the data list.
-        if pd.mountpoint != "swap" and pd in self.dataList():
-            warnings.warn(_("A partition with the mountpoint %s has already been defined.") % pd.mountpoint)
+        if pd.mountpoint != "swap" and self._isDuplicate(pd):
+            warn(_("A partition with the mountpoint %s has already been defined.") % pd.mountpoint, "duplicate")
 
         return pd
 
@@ -18,15 +18,17 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartParseError, KickstartValueError, formatErrorMsg
 from pykickstart.options import KSOptionParser
 
-import warnings
 from pykickstart.i18n import _
 
 class FC3_RaidData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("device", "fstype", "level", "format", "spares", "preexist",
+                 "mountpoint", "members")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -39,6 +41,9 @@ class FC3_RaidData(BaseData):
         self.mountpoint = kwargs.get("mountpoint", "")
         self.members = kwargs.get("members", [])
 
+    def _getDupKey(self):
+        return self.device
+
     def __eq__(self, y):
         if not y:
             return False
@@ -80,6 +85,7 @@ class FC3_RaidData(BaseData):
 class FC4_RaidData(FC3_RaidData):
     removedKeywords = FC3_RaidData.removedKeywords
     removedAttrs = FC3_RaidData.removedAttrs
+    __slots__ = ("fsopts",)
 
     def __init__(self, *args, **kwargs):
         FC3_RaidData.__init__(self, *args, **kwargs)
@@ -96,6 +102,7 @@ class FC4_RaidData(FC3_RaidData):
 class FC5_RaidData(FC4_RaidData):
     removedKeywords = FC4_RaidData.removedKeywords
     removedAttrs = FC4_RaidData.removedAttrs
+    __slots__ = ("bytesPerInode",)
 
     def __init__(self, *args, **kwargs):
         FC4_RaidData.__init__(self, *args, **kwargs)
@@ -112,6 +119,7 @@ class FC5_RaidData(FC4_RaidData):
 class RHEL5_RaidData(FC5_RaidData):
     removedKeywords = FC5_RaidData.removedKeywords
     removedAttrs = FC5_RaidData.removedAttrs
+    __slots__ = ("encrypted", "passphrase")
 
     def __init__(self, *args, **kwargs):
         FC5_RaidData.__init__(self, *args, **kwargs)
@@ -134,6 +142,7 @@ F7_RaidData = FC5_RaidData
 class F9_RaidData(FC5_RaidData):
     removedKeywords = FC5_RaidData.removedKeywords + ["bytesPerInode"]
     removedAttrs = FC5_RaidData.removedAttrs + ["bytesPerInode"]
+    __slots__ = ("fsprofile", "encrypted", "passphrase")
 
     def __init__(self, *args, **kwargs):
         FC5_RaidData.__init__(self, *args, **kwargs)
@@ -159,6 +168,7 @@ class F9_RaidData(FC5_RaidData):
 class F12_RaidData(F9_RaidData):
     removedKeywords = F9_RaidData.removedKeywords
     removedAttrs = F9_RaidData.removedAttrs
+    __slots__ = ("escrowcert", "backuppassphrase")
 
     def __init__(self, *args, **kwargs):
         F9_RaidData.__init__(self, *args, **kwargs)
@@ -182,6 +192,7 @@ F13_RaidData = F12_RaidData
 class RHEL6_RaidData(F13_RaidData):
     removedKeywords = F13_RaidData.removedKeywords
     removedAttrs = F13_RaidData.removedAttrs
+    __slots__ = ("cipher",)
 
     def __init__(self, *args, **kwargs):
         F13_RaidData.__init__(self, *args, **kwargs)
@@ -201,6 +212,8 @@ F14_RaidData = F13_RaidData
 class F15_RaidData(F14_RaidData):
     removedKeywords = F14_RaidData.removedKeywords
     removedAttrs = F14_RaidData.removedAttrs
+    # F16 pairs this with a command that takes --cipher.
+    __slots__ = ("label", "cipher")
 
     def __init__(self, *args, **kwargs):
         F14_RaidData.__init__(self, *args, **kwargs)
@@ -219,6 +232,7 @@ class F15_RaidData(F14_RaidData):
 class F18_RaidData(F15_RaidData):
     removedKeywords = F15_RaidData.removedKeywords
     removedAttrs = F15_RaidData.removedAttrs
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         F15_RaidData.__init__(self, *args, **kwargs)
@@ -236,6 +250,7 @@ class F18_RaidData(F15_RaidData):
 class F23_RaidData(F18_RaidData):
     removedKeywords = F18_RaidData.removedKeywords
     removedAttrs = F18_RaidData.removedAttrs
+    __slots__ = ("mkfsopts",)
 
     def __init__(self, *args, **kwargs):
         F18_RaidData.__init__(self, *args, **kwargs)
@@ -255,29 +270,30 @@ class FC3_Raid(KickstartCommand):
     removedKeywords = KickstartCommand.removedKeywords
     removedAttrs = KickstartCommand.removedAttrs
 
+    # A dict of all the RAID levels we support.  This means that if we
+    # support more levels in the future, subclasses don't have to
+    # duplicate too much.  It belongs to the class, since the option parser
+    # that reads it is shared by every instance.
+    levelMap = { "RAID0": "RAID0", "0": "RAID0",
+                 "RAID1": "RAID1", "1": "RAID1",
+                 "RAID5": "RAID5", "5": "RAID5",
+                 "RAID6": "RAID6", "6": "RAID6" }
+
     def __init__(self, writePriority=131, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
-
-        # A dict of all the RAID levels we support.  This means that if we
-        # support more levels in the future, subclasses don't have to
-        # duplicate too much.
-        self.levelMap = { "RAID0": "RAID0", "0": "RAID0",
-                          "RAID1": "RAID1", "1": "RAID1",
-                          "RAID5": "RAID5", "5": "RAID5",
-                          "RAID6": "RAID6", "6": "RAID6" }
 
         self.raidList = kwargs.get("raidList", [])
 
     def __str__(self):
-        retval = ""
-
-        for raid in self.raidList:
-            retval += raid.__str__()
+        retval = "".join(raid.__str__() for raid in self.raidList)
 
         return retval
 
     def _getParser(self):
+        # None of these callbacks may refer to self, since the parser is
+        # shared by every instance of this class.
+        levelMap = self.levelMap
+
         def raid_cb (option, opt_str, value, parser):
             parser.values.format = False
             parser.values.preexist = True
@@ -289,8 +305,8 @@ class FC3_Raid(KickstartCommand):
                 parser.values.ensure_value(option.dest, value)
 
         def level_cb (option, opt_str, value, parser):
-            if value.upper() in self.levelMap:
-                parser.values.ensure_value(option.dest, self.levelMap[value.upper()])
+            if value.upper() in levelMap:
+                parser.values.ensure_value(option.dest, levelMap[value.upper()])
 
         op = KSOptionParser()
         op.add_option("--device", action="callback", callback=device_cb,
@@ -339,8 +355,8 @@ class FC3_Raid(KickstartCommand):
             rd.members = extra[1:]
 
         # Check for duplicates in the data list.
-        if rd in self.dataList():
-            warnings.warn(_("A RAID device with the name %s has already been defined.") % rd.device)
+        if self._isDuplicate(rd):
+            warn(_("A RAID device with the name %s has already been defined.") % rd.device, "duplicate")
 
         if not rd.preexist and not rd.level:
             raise KickstartValueError(formatErrorMsg(self.lineno, msg="RAID Partition defined without RAID level"))
@@ -376,10 +392,8 @@ class RHEL5_Raid(FC5_Raid):
     removedKeywords = FC5_Raid.removedKeywords
     removedAttrs = FC5_Raid.removedAttrs
 
-    def __init__(self, writePriority=131, *args, **kwargs):
-        FC5_Raid.__init__(self, writePriority, *args, **kwargs)
-
-        self.levelMap.update({"RAID10": "RAID10", "10": "RAID10"})
+    levelMap = dict(FC5_Raid.levelMap)
+    levelMap.update({"RAID10": "RAID10", "10": "RAID10"})
 
     def _getParser(self):
         op = FC5_Raid._getParser(self)
@@ -391,10 +405,8 @@ class F7_Raid(FC5_Raid):
     removedKeywords = FC5_Raid.removedKeywords
     removedAttrs = FC5_Raid.removedAttrs
 
-    def __init__(self, writePriority=131, *args, **kwargs):
-        FC5_Raid.__init__(self, writePriority, *args, **kwargs)
-
-        self.levelMap.update({"RAID10": "RAID10", "10": "RAID10"})
+    levelMap = dict(FC5_Raid.levelMap)
+    levelMap.update({"RAID10": "RAID10", "10": "RAID10"})
 
 class F9_Raid(F7_Raid):
     removedKeywords = F7_Raid.removedKeywords
@@ -422,10 +434,8 @@ class F13_Raid(F12_Raid):
     removedKeywords = F12_Raid.removedKeywords
     removedAttrs = F12_Raid.removedAttrs
 
-    def __init__(self, writePriority=131, *args, **kwargs):
-        F12_Raid.__init__(self, writePriority, *args, **kwargs)
-
-        self.levelMap.update({"RAID4": "RAID4", "4": "RAID4"})
+    levelMap = dict(F12_Raid.levelMap)
+    levelMap.update({"RAID4": "RAID4", "4": "RAID4"})
 
 class RHEL6_Raid(F13_Raid):
     removedKeywords = F13_Raid.removedKeywords
@@ -58,7 +58,6 @@ class FC6_Reboot(FC3_Reboot):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         FC3_Reboot.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.eject = kwargs.get("eject", False)
 
@@ -88,7 +87,6 @@ class F18_Reboot(FC6_Reboot):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         FC6_Reboot.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
     def __str__(self):
         retval = FC6_Reboot.__str__(self)
@@ -111,7 +109,6 @@ class F23_Reboot(F18_Reboot):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         F18_Reboot.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.kexec = kwargs.get("kexec", False)
 
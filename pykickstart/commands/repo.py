@@ -18,15 +18,16 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartError, KickstartValueError, formatErrorMsg
 from pykickstart.options import KSOptionParser
 
-import warnings
 from pykickstart.i18n import _
 
 class FC6_RepoData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("baseurl", "mirrorlist", "name")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -61,6 +62,7 @@ class FC6_RepoData(BaseData):
 class F8_RepoData(FC6_RepoData):
     removedKeywords = FC6_RepoData.removedKeywords
     removedAttrs = FC6_RepoData.removedAttrs
+    __slots__ = ("cost", "includepkgs", "excludepkgs")
 
     def __init__(self, *args, **kwargs):
         FC6_RepoData.__init__(self, *args, **kwargs)
@@ -83,6 +85,7 @@ class F8_RepoData(FC6_RepoData):
 class F11_RepoData(F8_RepoData):
     removedKeywords = F8_RepoData.removedKeywords
     removedAttrs = F8_RepoData.removedAttrs
+    __slots__ = ("ignoregroups",)
 
     def __init__(self, *args, **kwargs):
         F8_RepoData.__init__(self, *args, **kwargs)
@@ -98,6 +101,7 @@ class F11_RepoData(F8_RepoData):
 class F13_RepoData(F11_RepoData):
     removedKeywords = F11_RepoData.removedKeywords
     removedAttrs = F11_RepoData.removedAttrs
+    __slots__ = ("proxy",)
 
     def __init__(self, *args, **kwargs):
         F11_RepoData.__init__(self, *args, **kwargs)
@@ -114,6 +118,7 @@ class F13_RepoData(F11_RepoData):
 class F14_RepoData(F13_RepoData):
     removedKeywords = F13_RepoData.removedKeywords
     removedAttrs = F13_RepoData.removedAttrs
+    __slots__ = ("noverifyssl",)
 
     def __init__(self, *args, **kwargs):
         F13_RepoData.__init__(self, *args, **kwargs)
@@ -134,6 +139,7 @@ F15_RepoData = F14_RepoData
 class F21_RepoData(F14_RepoData):
     removedKeywords = F14_RepoData.removedKeywords
     removedAttrs = F14_RepoData.removedAttrs
+    __slots__ = ("install",)
 
     def __init__(self, *args, **kwargs):
         F14_RepoData.__init__(self, *args, **kwargs)
@@ -157,14 +163,11 @@ class FC6_Repo(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.repoList = kwargs.get("repoList", [])
 
     def __str__(self):
-        retval = ""
-        for repo in self.repoList:
-            retval += repo.__str__()
+        retval = "".join(repo.__str__() for repo in self.repoList)
 
         return retval
 
@@ -196,7 +199,7 @@ class FC6_Repo(KickstartCommand):
 
         # Check for duplicates in the data list.
         if rd in self.dataList():
-            warnings.warn(_("A repo with the name %s has already been defined.") % rd.name)
+            warn(_("A repo with the name %s has already been defined.") % rd.name, "duplicate")
 
         return rd
 
@@ -208,9 +211,7 @@ class F8_Repo(FC6_Repo):
     removedAttrs = FC6_Repo.removedAttrs
 
     def __str__(self):
-        retval = ""
-        for repo in self.repoList:
-            retval += repo.__str__()
+        retval = "".join(repo.__str__() for repo in self.repoList)
 
         return retval
 
@@ -33,8 +33,6 @@ class F23_ReqPart(KickstartCommand):
         self.reqpart = kwargs.get("reqpart", False)
         self.addBoot = kwargs.get("addBoot", False)
 
-        self.op = self._getParser()
-
     def _getArgsAsStr(self):
         retval = ""
 
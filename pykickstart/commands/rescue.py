@@ -29,7 +29,6 @@ class F10_Rescue(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.rescue = False
         self.nomount = kwargs.get("nomount", False)
@@ -29,7 +29,6 @@ class FC3_RootPw(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.isCrypted = kwargs.get("isCrypted", False)
         self.password = kwargs.get("password", "")
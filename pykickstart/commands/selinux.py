@@ -27,7 +27,6 @@ class FC3_SELinux(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.selinux = kwargs.get("selinux", None)
 
@@ -29,7 +29,6 @@ class FC6_Services(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.disabled = kwargs.get("disabled", [])
         self.enabled = kwargs.get("enabled", [])
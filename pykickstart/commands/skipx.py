@@ -29,7 +29,6 @@ class FC3_SkipX(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.skipx = kwargs.get("skipx", False)
 
     def __str__(self):
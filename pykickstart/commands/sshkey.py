@@ -18,15 +18,16 @@
 # with the express permission of Red Hat, Inc.
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartValueError, formatErrorMsg
 from pykickstart.options import KSOptionParser
-import warnings
 
 from pykickstart.i18n import _
 
 class F22_SshKeyData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("username", "key")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -63,14 +64,11 @@ class F22_SshKey(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.sshUserList = kwargs.get("sshUserList", [])
 
     def __str__(self):
-        retval = ""
-        for user in self.sshUserList:
-            retval += user.__str__()
+        retval = "".join(user.__str__() for user in self.sshUserList)
 
         return retval
 
@@ -90,7 +88,7 @@ class F22_SshKey(KickstartCommand):
         ud.key = extra[0]
 
         if ud in self.dataList():
-            warnings.warn(_("An ssh user with the name %s has already been defined.") % ud.username)
+            warn(_("An ssh user with the name %s has already been defined.") % ud.username, "duplicate")
 
         return ud
 
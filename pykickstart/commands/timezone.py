@@ -29,7 +29,6 @@ class FC3_Timezone(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.isUtc = kwargs.get("isUtc", False)
         self.timezone = kwargs.get("timezone", "")
@@ -87,7 +86,6 @@ class FC6_Timezone(FC3_Timezone):
 class F18_Timezone(FC6_Timezone):
     def __init__(self, writePriority=0, *args, **kwargs):
         FC6_Timezone.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.nontp = kwargs.get("nontp", False)
         self.ntpservers = kwargs.get("ntpservers", set())
 
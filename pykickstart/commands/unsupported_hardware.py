@@ -29,7 +29,6 @@ class RHEL6_UnsupportedHardware(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.unsupported_hardware = kwargs.get("unsupported_hardware", False)
 
     def __str__(self):
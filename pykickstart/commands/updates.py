@@ -29,7 +29,6 @@ class F7_Updates(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.url = kwargs.get("url", "")
 
     def __str__(self):
@@ -30,7 +30,6 @@ class FC3_Upgrade(KickstartCommand):
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
         self.upgrade = kwargs.get("upgrade", None)
-        self.op = self._getParser()
 
     def __str__(self):
         retval = KickstartCommand.__str__(self)
@@ -69,7 +68,6 @@ class F11_Upgrade(FC3_Upgrade):
     def __init__(self, writePriority=0, *args, **kwargs):
         FC3_Upgrade.__init__(self, writePriority, *args, **kwargs)
 
-        self.op = self._getParser()
         self.root_device = kwargs.get("root_device", None)
 
     def __str__(self):
@@ -31,8 +31,6 @@ class FC3_Url(KickstartCommand):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
         self.url = kwargs.get("url", None)
 
-        self.op = self._getParser()
-
     def __eq__(self, other):
         if not other:
             return False
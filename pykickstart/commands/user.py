@@ -18,24 +18,30 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
-from pykickstart.options import KSOptionParser
+from pykickstart.diagnostics import warn
+from pykickstart.schema import Field, ParserOption, buildParser
 
-import warnings
 from pykickstart.i18n import _
 
+def _groups_cb(option, _opt_str, value, parser):
+    for d in value.split(','):
+        parser.values.ensure_value(option.dest, []).append(d)
+
 class FC6_UserData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
 
-    def __init__(self, *args, **kwargs):
-        BaseData.__init__(self, *args, **kwargs)
-        self.groups = kwargs.get("groups", [])
-        self.homedir = kwargs.get("homedir", "")
-        self.isCrypted = kwargs.get("isCrypted", False)
-        self.name = kwargs.get("name", "")
-        self.password = kwargs.get("password", "")
-        self.shell = kwargs.get("shell", "")
-        self.uid = kwargs.get("uid", None)
+    fields = (
+        Field("groups", [], opts=["--groups"], render=" --groups=%s", join=",",
+              action="callback", callback=_groups_cb, nargs=1, type="string"),
+        Field("homedir", "", opts=["--homedir"], render=" --homedir=%s"),
+        Field("name", "", opts=["--name"], render=" --name=%s", required=1),
+        Field("password", "", opts=["--password"], render=" --password=%s"),
+        Field("isCrypted", False, opts=["--iscrypted"], render=" --iscrypted",
+              action="store_true", default=False),
+        Field("shell", "", opts=["--shell"], render=" --shell=%s"),
+        Field("uid", None, opts=["--uid"], render=" --uid=%s", type="int"),
+    )
 
     def __eq__(self, y):
         if not y:
@@ -55,73 +61,31 @@ class FC6_UserData(BaseData):
 
         return retval
 
-    def _getArgsAsStr(self):
-        retval = ""
-
-        if len(self.groups) > 0:
-            retval += " --groups=%s" % ",".join(self.groups)
-        if self.homedir:
-            retval += " --homedir=%s" % self.homedir
-        if self.name:
-            retval += " --name=%s" % self.name
-        if self.password:
-            retval += " --password=%s" % self.password
-        if self.isCrypted:
-            retval += " --iscrypted"
-        if self.shell:
-            retval += " --shell=%s" % self.shell
-        if self.uid:
-            retval += " --uid=%s" % self.uid
-
-        return retval
-
 class F8_UserData(FC6_UserData):
     removedKeywords = FC6_UserData.removedKeywords
     removedAttrs = FC6_UserData.removedAttrs
 
-    def __init__(self, *args, **kwargs):
-        FC6_UserData.__init__(self, *args, **kwargs)
-        self.lock = kwargs.get("lock", False)
-
-    def _getArgsAsStr(self):
-        retval = FC6_UserData._getArgsAsStr(self)
-
-        if self.lock:
-            retval += " --lock"
-
-        return retval
+    fields = FC6_UserData.fields + (
+        Field("lock", False, opts=["--lock"], render=" --lock",
+              action="store_true", default=False),
+        ParserOption("--plaintext", dest="isCrypted", action="store_false"),
+    )
 
 class F12_UserData(F8_UserData):
     removedKeywords = F8_UserData.removedKeywords
     removedAttrs = F8_UserData.removedAttrs
 
-    def __init__(self, *args, **kwargs):
-        F8_UserData.__init__(self, *args, **kwargs)
-        self.gecos = kwargs.get("gecos", "")
-
-    def _getArgsAsStr(self):
-        retval = F8_UserData._getArgsAsStr(self)
-
-        if self.gecos:
-            retval += " --gecos=\"%s\"" % (self.gecos,)
-
-        return retval
+    fields = F8_UserData.fields + (
+        Field("gecos", "", opts=["--gecos"], render=" --gecos=\"%s\"", type="string"),
+    )
 
 class F19_UserData(F12_UserData):
     removedKeywords = F12_UserData.removedKeywords
     removedAttrs = F12_UserData.removedAttrs
 
-    def __init__(self, *args, **kwargs):
-        F12_UserData.__init__(self, *args, **kwargs)
-        self.gid = kwargs.get("gid", None)
-
-    def _getArgsAsStr(self):
-        retval = F12_UserData._getArgsAsStr(self)
-
-        if self.gid:
-            retval += " --gid=%d" % (self.gid,)
-
-        return retval
+    fields = F12_UserData.fields + (
+        Field("gid", None, opts=["--gid"], render=" --gid=%d", type="int"),
+    )
 
 
 class FC6_User(KickstartCommand):
@@ -130,33 +94,16 @@ class FC6_User(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.userList = kwargs.get("userList", [])
 
     def __str__(self):
-        retval = ""
-        for user in self.userList:
-            retval += user.__str__()
+        retval = "".join(user.__str__() for user in self.userList)
 
         return retval
 
     def _getParser(self):
-        def groups_cb (option, opt_str, value, parser):
-            for d in value.split(','):
-                parser.values.ensure_value(option.dest, []).append(d)
-
-        op = KSOptionParser()
-        op.add_option("--groups", dest="groups", action="callback",
-                      callback=groups_cb, nargs=1, type="string")
-        op.add_option("--homedir")
-        op.add_option("--iscrypted", dest="isCrypted", action="store_true",
-                      default=False)
-        op.add_option("--name", required=1)
-        op.add_option("--password")
-        op.add_option("--shell")
-        op.add_option("--uid", type="int")
-        return op
+        return buildParser(FC6_UserData.fields)
 
     def parse(self, args):
         ud = self.handler.UserData()
@@ -166,7 +113,7 @@ class FC6_User(KickstartCommand):
 
         # Check for duplicates in the data list.
         if ud in self.dataList():
-            warnings.warn(_("A user with the name %s has already been defined.") % ud.name)
+            warn(_("A user with the name %s has already been defined.") % ud.name, "duplicate")
 
         return ud
 
@@ -178,25 +125,18 @@ class F8_User(FC6_User):
     removedAttrs = FC6_User.removedAttrs
 
     def _getParser(self):
-        op = FC6_User._getParser(self)
-        op.add_option("--lock", action="store_true", default=False)
-        op.add_option("--plaintext", dest="isCrypted", action="store_false")
-        return op
+        return buildParser(F8_UserData.fields)
 
 class F12_User(F8_User):
     removedKeywords = F8_User.removedKeywords
     removedAttrs = F8_User.removedAttrs
 
     def _getParser(self):
-        op = F8_User._getParser(self)
-        op.add_option("--gecos", type="string")
-        return op
+        return buildParser(F12_UserData.fields)
 
 class F19_User(F12_User):
     removedKeywords = F12_User.removedKeywords
     removedAttrs = F12_User.removedAttrs
 
     def _getParser(self):
-        op = F12_User._getParser(self)
-        op.add_option("--gid", type="int")
-        return op
+        return buildParser(F19_UserData.fields)
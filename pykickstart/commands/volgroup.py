@@ -18,15 +18,16 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartParseError, KickstartValueError, formatErrorMsg
 from pykickstart.options import KSOptionParser
 
-import warnings
 from pykickstart.i18n import _
 
 class FC3_VolGroupData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("format", "pesize", "preexist", "vgname", "physvols")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -36,6 +37,9 @@ class FC3_VolGroupData(BaseData):
         self.vgname = kwargs.get("vgname", "")
         self.physvols = kwargs.get("physvols", [])
 
+    def _getDupKey(self):
+        return self.vgname
+
     def __eq__(self, y):
         if not y:
             return False
@@ -69,6 +73,7 @@ class FC3_VolGroupData(BaseData):
         return retval.strip() + "\n"
 
 class FC16_VolGroupData(FC3_VolGroupData):
+    __slots__ = ("reserved_space", "reserved_percent")
     def __init__(self, *args, **kwargs):
         FC3_VolGroupData.__init__(self, *args, **kwargs)
         self.reserved_space = kwargs.get("reserved-space", 0)
@@ -84,6 +89,7 @@ class FC16_VolGroupData(FC3_VolGroupData):
         return retval
 
 class F21_VolGroupData(FC16_VolGroupData):
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         FC16_VolGroupData.__init__(self, *args, **kwargs)
         self.pesize = kwargs.get("pesize", 0)
@@ -96,14 +102,11 @@ class FC3_VolGroup(KickstartCommand):
 
     def __init__(self, writePriority=132, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.vgList = kwargs.get("vgList", [])
 
     def __str__(self):
-        retval = ""
-        for vg in self.vgList:
-            retval += vg.__str__()
+        retval = "".join(vg.__str__() for vg in self.vgList)
 
         return retval
 
@@ -142,8 +145,8 @@ class FC3_VolGroup(KickstartCommand):
             vg.physvols = extra[1:]
 
         # Check for duplicates in the data list.
-        if vg in self.dataList():
-            warnings.warn(_("A volgroup with the name %s has already been defined.") % vg.vgname)
+        if self._isDuplicate(vg):
+            warn(_("A volgroup with the name %s has already been defined.") % vg.vgname, "duplicate")
 
         return vg
 
@@ -154,13 +157,13 @@ class FC16_VolGroup(FC3_VolGroup):
     def _getParser(self):
         def space_cb(option, opt_str, value, parser):
             if value < 0:
-                raise KickstartValueError(formatErrorMsg(self.lineno, msg="Volume group reserved space must be a positive integer."))
+                raise KickstartValueError(formatErrorMsg(parser.lineno, msg="Volume group reserved space must be a positive integer."))
 
             parser.values.reserved_space = value
 
         def percent_cb(option, opt_str, value, parser):
             if not 0 < value < 100:
-                raise KickstartValueError(formatErrorMsg(self.lineno, msg="Volume group reserved space percentage must be between 1 and 99."))
+                raise KickstartValueError(formatErrorMsg(parser.lineno, msg="Volume group reserved space percentage must be between 1 and 99."))
 
             parser.values.reserved_percent = value
 
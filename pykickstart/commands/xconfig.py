@@ -29,7 +29,6 @@ class FC3_XConfig(KickstartCommand):
 
     def __init__(self, writePriority=0, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.card = kwargs.get("card", "")
         self.defaultdesktop = kwargs.get("defaultdesktop", "")
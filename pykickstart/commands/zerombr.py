@@ -17,9 +17,9 @@
 # subject to the GNU General Public License and may only be used or replicated
 # with the express permission of Red Hat, Inc. 
 #
-import warnings
 
 from pykickstart.base import KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartParseError, formatErrorMsg
 from pykickstart.options import KSOptionParser
 
@@ -31,7 +31,6 @@ class FC3_ZeroMbr(KickstartCommand):
 
     def __init__(self, writePriority=110, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
         self.zerombr = kwargs.get("zerombr", False)
 
     def __str__(self):
@@ -50,7 +49,7 @@ class FC3_ZeroMbr(KickstartCommand):
         (_opts, extra) = self.op.parse_args(args=args, lineno=self.lineno)
 
         if len(extra) > 0:
-            warnings.warn(_("Ignoring deprecated option on line %s:  The zerombr command no longer takes any options.  In future releases, this will result in a fatal error from kickstart.  Please modify your kickstart file to remove any options.") % self.lineno, DeprecationWarning)
+            warn(_("Ignoring deprecated option on line %s:  The zerombr command no longer takes any options.  In future releases, this will result in a fatal error from kickstart.  Please modify your kickstart file to remove any options.") % self.lineno, "deprecated-option", DeprecationWarning)
 
         self.zerombr = True
         return self
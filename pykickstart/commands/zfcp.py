@@ -18,14 +18,15 @@
 # with the express permission of Red Hat, Inc. 
 #
 from pykickstart.base import BaseData, KickstartCommand
+from pykickstart.diagnostics import warn
 from pykickstart.options import KSOptionParser
 
-import warnings
 from pykickstart.i18n import _
 
 class FC3_ZFCPData(BaseData):
     removedKeywords = BaseData.removedKeywords
     removedAttrs = BaseData.removedAttrs
+    __slots__ = ("devnum", "wwpn", "fcplun", "scsiid", "scsilun")
 
     def __init__(self, *args, **kwargs):
         BaseData.__init__(self, *args, **kwargs)
@@ -66,6 +67,7 @@ class FC3_ZFCPData(BaseData):
 class F12_ZFCPData(FC3_ZFCPData):
     removedKeywords = FC3_ZFCPData.removedKeywords + ["scsiid", "scsilun"]
     removedAttrs = FC3_ZFCPData.removedAttrs + ["scsiid", "scsilun"]
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         FC3_ZFCPData.__init__(self, *args, **kwargs)
@@ -79,14 +81,11 @@ class FC3_ZFCP(KickstartCommand):
 
     def __init__(self, writePriority=71, *args, **kwargs):
         KickstartCommand.__init__(self, writePriority, *args, **kwargs)
-        self.op = self._getParser()
 
         self.zfcp = kwargs.get("zfcp", [])
 
     def __str__(self):
-        retval = ""
-        for zfcp in self.zfcp:
-            retval += zfcp.__str__()
+        retval = "".join(zfcp.__str__() for zfcp in self.zfcp)
 
         return retval
 
@@ -107,7 +106,7 @@ class FC3_ZFCP(KickstartCommand):
 
         # Check for duplicates in the data list.
         if zd in self.dataList():
-            warnings.warn(_("A zfcp with this information has already been defined."))
+            warn(_("A zfcp with this information has already been defined."), "duplicate")
 
         return zd
 
@@ -0,0 +1,133 @@
+#
+# Copyright 2016 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Collecting the errors and warnings found while parsing.
+
+This module exports two classes:
+
+    Diagnostic - A single error or warning, along with where it was found.
+
+    Diagnostics - An append-only collection of Diagnostic instances, as kept
+                  by KickstartParser.
+
+It also exports a single function:
+
+    warn - Report a warning from code run by the parser.
+
+A KickstartParser given a Diagnostics collects every warning in it, along
+with every error it goes past when errorsAreFatal is False, so a whole
+kickstart file can be checked in one pass.
+"""
+import threading
+import warnings
+
+ERROR = "error"
+WARNING = "warning"
+
+class Diagnostic(object):
+    """A single error or warning found while parsing.  Instance attributes:
+
+       severity -- ERROR or WARNING.
+       code     -- A short string saying what kind of problem this is, such
+                   as "parse-error" or "deprecated-option".
+       message  -- The full message, as it would have been printed.
+       lineno   -- The line number the problem was found on, or None.
+       file     -- The name of the file being read, or None if the kickstart
+                   file was given as a string.  This is the included file
+                   for problems found in one.
+       command  -- The command or section header being handled, or None.
+    """
+    __slots__ = ("severity", "code", "message", "lineno", "file", "command")
+
+    def __init__(self, severity, code, message, lineno=None, file=None, command=None):
+        self.severity = severity
+        self.code = code
+        self.message = message
+        self.lineno = lineno
+        self.file = file
+        self.command = command
+
+    def to_dict(self):
+        """Return a dict of all the attributes of this diagnostic, suitable
+           for encoding as JSON.
+        """
+        return dict((attr, getattr(self, attr)) for attr in self.__slots__)
+
+    def __str__(self):
+        return self.message
+
+class Diagnostics(object):
+    """An append-only collection of Diagnostic instances, in the order they
+       were found.
+    """
+    def __init__(self):
+        self._items = []
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def add(self, severity, code, message, lineno=None, file=None, command=None):
+        """Add a new Diagnostic with the given attributes."""
+        self._items.append(Diagnostic(severity, code, message, lineno, file, command))
+
+    @property
+    def errors(self):
+        """A list of the diagnostics with severity ERROR."""
+        return [d for d in self._items if d.severity == ERROR]
+
+    @property
+    def warnings(self):
+        """A list of the diagnostics with severity WARNING."""
+        return [d for d in self._items if d.severity == WARNING]
+
+    def to_list(self):
+        """Return a list of dicts, one for each diagnostic, suitable for
+           encoding as JSON.
+        """
+        return [d.to_dict() for d in self._items]
+
+# The parser that is reading a kickstart file in each thread.  This is
+# maintained by KickstartParser and no one else should be touching it.
+_local = threading.local()
+
+def _activeParser():
+    return getattr(_local, "parser", None)
+
+def _setActiveParser(parser):
+    prev = _activeParser()
+    _local.parser = parser
+    return prev
+
+def warn(message, code, category=UserWarning):
+    """Report a warning found while parsing.  If the parser reading a
+       kickstart file in this thread collects warnings, it is added to its
+       diagnostics along with where it was found.  Otherwise, it goes through
+       warnings.warn with the given category.
+    """
+    parser = _activeParser()
+
+    if parser is not None and parser._collectWarnings:
+        parser._diagnose(WARNING, code, message)
+    else:
+        warnings.warn(message, category, stacklevel=2)
@@ -47,7 +47,12 @@ def formatErrorMsg(lineno, msg=""):
         return _("There was a problem reading from line %s of the kickstart file") % lineno
 
 class KickstartError(Exception):
-    """A generic exception class for unspecific error conditions."""
+    """A generic exception class for unspecific error conditions.  The code
+       class attribute says what kind of error this is when it is collected
+       as a pykickstart.diagnostics.Diagnostic.
+    """
+    code = "error"
+
     def __init__(self, val = ""):
         """Create a new KickstartError exception instance with the descriptive
            message val.  val should be the return value of formatErrorMsg.
@@ -62,6 +67,8 @@ class KickstartParseError(KickstartError):
     """An exception class for errors when processing the input file, such as
        unknown options, commands, or sections.
     """
+    code = "parse-error"
+
     def __init__(self, msg):
         """Create a new KickstartParseError exception instance with the
            descriptive message msg.  msg should be the return value of
@@ -77,6 +84,8 @@ class KickstartValueError(KickstartError):
        such as too many arguments, too few arguments, or missing required
        arguments.
     """
+    code = "value-error"
+
     def __init__(self, msg):
         """Create a new KickstartValueError exception instance with the
            descriptive message msg.  msg should be the return value of
@@ -91,6 +100,8 @@ class KickstartVersionError(KickstartError):
     """An exception class for errors related to using an incorrect version of
        kickstart syntax.
     """
+    code = "version-error"
+
     def __init__(self, msg):
         """Create a new KickstartVersionError exception instance with the
            descriptive message msg.  msg should be the return value of
@@ -17,7 +17,8 @@
 # subject to the GNU General Public License and may only be used or replicated
 # with the express permission of Red Hat, Inc. 
 #
-from pykickstart.handlers import \
-     fc3, fc4, fc5, fc6, f7, f8, f9, f10, f11, f12, f13, f14, f15, f16, f17, \
-     f18, f19, f20, f21, f22, f23, f24, \
-     rhel3, rhel4, rhel5, rhel6, rhel7
+
+# The handler modules are not imported here so that asking for one version of
+# kickstart syntax does not pay for loading all the others.  Use
+# pykickstart.version.returnClassForVersion to get at a handler class, or
+# import pykickstart.handlers.control for the maps of every version.
@@ -20,6 +20,10 @@
 __all__ = ["commandMap", "dataMap"]
 
 from pykickstart import handlers
+from pykickstart.handlers import \
+     fc3, fc4, fc5, fc6, f7, f8, f9, f10, f11, f12, f13, f14, f15, f16, f17, \
+     f18, f19, f20, f21, f22, f23, f24, \
+     rhel3, rhel4, rhel5, rhel6, rhel7   # pylint: disable=unused-import
 
 commandMap = {}
 dataMap = {}
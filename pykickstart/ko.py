@@ -27,6 +27,9 @@ The module exports the following important classes:
 
 class KickstartObject(object):
     """The base class for all other classes in pykickstart."""
+    # Subclasses without __slots__ of their own get a __dict__ as usual.
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """Create a new KickstartObject instance.  All other classes in
            pykickstart should be derived from this one.  Instance attributes:
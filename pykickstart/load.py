@@ -17,17 +17,30 @@
 # subject to the GNU General Public License and may only be used or replicated
 # with the express permission of Red Hat, Inc.
 #
-import requests
+from multiprocessing.pool import ThreadPool
 import shutil
+import threading
 
 from pykickstart.errors import KickstartError
 from pykickstart.i18n import _
-from requests.exceptions import SSLError, RequestException
 
 _is_url = lambda location: '://' in location # RFC 3986
 
 SSL_VERIFY = True
 
+# Something that remote locations are cached in, such as an instance of
+# pykickstart.cache.URLCache, or None to always download them.
+URL_CACHE = None
+
+# The most URLs load_many will fetch at the same time.
+MAX_WORKERS = 8
+
+# Every URL is fetched through this one requests.Session, so connections to
+# the same server are kept open and reused.  It is created the first time it
+# is needed by _get_session.  No one else should be touching it.
+_session = None
+_session_lock = threading.Lock()
+
 def load_to_str(location):
     '''Load a destination URL or file into a string.
     Type of input is inferred automatically.
@@ -44,6 +57,43 @@ def load_to_str(location):
         return _load_file(location)
 
 
+def load_many(locations, max_workers=MAX_WORKERS):
+    '''Load several destination URLs or files into strings at the same time.
+    Type of each input is inferred automatically.
+
+    Arguments:
+    locations -- URLs or file names to load
+    max_workers -- the most locations to load at once
+
+    Returns: dict mapping each location that could be loaded to its contents.
+    Locations that could not be loaded are left out, so that loading them
+    again with load_to_str raises the usual error.'''
+
+    unique = []
+    for location in locations:
+        if location not in unique:
+            unique.append(location)
+
+    def _load(location):
+        try:
+            return (location, load_to_str(location))
+        except KickstartError:
+            return (location, None)
+
+    if len(unique) <= 1 or max_workers <= 1:
+        results = [_load(location) for location in unique]
+    else:
+        pool = ThreadPool(min(max_workers, len(unique)))
+        try:
+            results = pool.map(_load, unique)
+        finally:
+            pool.close()
+            pool.join()
+
+    return dict((location, contents) for (location, contents) in results
+                if contents is not None)
+
+
 def load_to_file(location, destination):
     '''Load a destination URL or file into a file name.
     Type of input is inferred automatically.
@@ -72,19 +122,54 @@ def load_to_file(location, destination):
 
 
 
+def _get_session():
+    '''Return the requests.Session shared by all URL loads'''
+
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            import requests
+            _session = requests.Session()
+
+        return _session
+
+
 def _load_url(location):
     '''Load a location (URL or filename) and return contents as string'''
 
+    # requests is expensive to import and only needed for remote locations.
+    import requests
+    from requests.exceptions import SSLError, RequestException
+
+    cache = URL_CACHE
+    entry = cache.get(location) if cache else None
+    headers = {}
+
+    if entry:
+        if cache.isFresh(entry):
+            return entry["contents"]
+
+        headers = cache.headers(entry)
+
     try:
-        request = requests.get(location, verify=SSL_VERIFY)
+        request = _get_session().get(location, verify=SSL_VERIFY, headers=headers)
     except SSLError as e:
         raise KickstartError(_('Error securely accessing URL "%s"') % location + ': {e}'.format(e=str(e)))
     except RequestException as e:
         raise KickstartError(_('Error accessing URL "%s"') % location + ': {e}'.format(e=str(e)))
 
+    if entry and request.status_code == requests.codes.not_modified:
+        cache.touch(location, entry)
+        return entry["contents"]
+
     if request.status_code != requests.codes.ok:
         raise KickstartError(_('Error accessing URL "%s"') % location + ': {c}'.format(c=str(request.status_code)))
 
+    if cache is not None:
+        cache.put(location, request.text, request.headers.get("ETag"),
+                  request.headers.get("Last-Modified"))
+
     return request.text
 
 
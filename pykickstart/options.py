@@ -26,11 +26,16 @@ This module exports two classes:
                      in BaseHandler subclasses.
 
     KSOption - A specialized subclass of Option.
+
+It also exports a single function:
+
+    sharedParser - Return a private copy of a KSOptionParser whose option
+                   table is built only once and shared between copies.
 """
-import warnings
 from copy import copy
 from optparse import Option, OptionError, OptionParser, OptionValueError
 
+from pykickstart.diagnostics import warn
 from pykickstart.errors import KickstartParseError, KickstartValueError, formatErrorMsg
 from pykickstart.version import versionToString
 
@@ -44,6 +49,12 @@ class KSOptionParser(OptionParser):
     def exit(self, status=0, msg=None):
         pass
 
+    def add_option(self, *args, **kwargs):
+        if self._frozen:
+            raise TypeError("Cannot add options to a shared KSOptionParser.")
+
+        return OptionParser.add_option(self, *args, **kwargs)
+
     def error(self, msg):
         if self.lineno != None:
             raise KickstartParseError(formatErrorMsg(self.lineno, msg=msg))
@@ -51,39 +62,92 @@ class KSOptionParser(OptionParser):
             raise KickstartParseError(msg)
 
     def keys(self):
+        """Return a tuple of the destinations of all options, without
+           duplicates, in the order the options were added.  Frozen parsers
+           only work this out once and share it with their clones.
+        """
+        if self._keys is not None:
+            return self._keys
+
         retval = []
+        seen = set()
 
         for opt in self.option_list:
-            if opt not in retval:
+            if opt.dest is not None and opt.dest not in seen:
+                seen.add(opt.dest)
                 retval.append(opt.dest)
 
+        retval = tuple(retval)
+        if self._frozen:
+            self._keys = retval
+
         return retval
 
     def _init_parsing_state (self):
         OptionParser._init_parsing_state(self)
         self.option_seen = {}
 
-    def check_values (self, values, args):
-        def seen(option):
-            return option in self.option_seen
+    def _versionPolicy(self):
+        """Return the verdicts of this parser's syntax version on its options
+           as a tuple of (required, verdicts).  required is a list of
+           (position, option) for every required option, and verdicts maps
+           each option that may not be used as given to a (position, verdict)
+           tuple, where verdict is one of "new", "removed", or "deprecated".
+           Positions are indexes into option_list, so problems can be reported
+           in the order the options were added.
+
+           This does not depend on what is being parsed, so frozen parsers
+           only work it out once and share it with their clones.
+        """
+        if self._policy is not None:
+            return self._policy
+
+        required = []
+        verdicts = {}
+
+        for (i, option) in enumerate(self.option_list):
+            if not isinstance(option, Option):
+                continue
 
-        def usedTooNew(option):
-            return option.introduced and option.introduced > self.version
+            if option.required:
+                required.append((i, option))
 
-        def usedDeprecated(option):
-            return option.deprecated
+            # Without a version, there is nothing to compare introduced and
+            # removed to.  Deprecated options are still warned about.
+            if self.version is None:
+                if option.deprecated:
+                    verdicts[option] = (i, "deprecated")
+            elif option.introduced and option.introduced > self.version:
+                verdicts[option] = (i, "new")
+            elif option.removed and option.removed <= self.version:
+                verdicts[option] = (i, "removed")
+            elif option.deprecated and self.version >= option.deprecated:
+                verdicts[option] = (i, "deprecated")
 
-        def usedRemoved(option):
-            return option.removed and option.removed <= self.version
+        policy = (required, verdicts)
+        if self._frozen:
+            self._policy = policy
 
-        for option in [o for o in self.option_list if isinstance(o, Option)]:
-            if option.required and not seen(option):
+        return policy
+
+    def check_values (self, values, args):
+        (required, verdicts) = self._versionPolicy()
+
+        # Only options that are required or were seen can cause a problem.
+        problems = [(i, "required", option) for (i, option) in required if option not in self.option_seen]
+        for option in self.option_seen:
+            if option in verdicts:
+                (i, verdict) = verdicts[option]
+                problems.append((i, verdict, option))
+
+        for (_i, verdict, option) in sorted(problems, key=lambda p: p[0]):
+            if verdict == "required":
                 raise KickstartValueError(formatErrorMsg(self.lineno, _("Option %s is required") % option))
-            elif seen(option) and usedTooNew(option):
+            elif verdict == "new":
                 mapping = {"option": option, "intro": versionToString(option.introduced),
                            "version": versionToString(self.version)}
                 self.error(_("The %(option)s option was introduced in version %(intro)s, but you are using kickstart syntax version %(version)s.") % mapping)
-            elif seen(option) and usedRemoved(option):
+            elif verdict == "removed":
                 mapping = {"option": option, "removed": versionToString(option.removed),
                            "version": versionToString(self.version)}
 
@@ -91,9 +155,9 @@ class KSOptionParser(OptionParser):
                     self.error(_("The %(option)s option is no longer supported.") % mapping)
                 else:
                     self.error(_("The %(option)s option was removed in version %(removed)s, but you are using kickstart syntax version %(version)s.") % mapping)
-            elif seen(option) and usedDeprecated(option) and self.version >= option.deprecated:
+            else:
                 mapping = {"lineno": self.lineno, "option": option}
-                warnings.warn(_("Ignoring deprecated option on line %(lineno)s:  The %(option)s option has been deprecated and no longer has any effect.  It may be removed from future releases, which will result in a fatal error from kickstart.  Please modify your kickstart file to remove this option.") % mapping, DeprecationWarning)
+                warn(_("Ignoring deprecated option on line %(lineno)s:  The %(option)s option has been deprecated and no longer has any effect.  It may be removed from future releases, which will result in a fatal error from kickstart.  Please modify your kickstart file to remove this option.") % mapping, "deprecated-option", DeprecationWarning)
 
         return (values, args)
 
@@ -101,6 +165,9 @@ class KSOptionParser(OptionParser):
         if "lineno" in kwargs:
             self.lineno = kwargs.pop("lineno")
 
+        # optparse doesn't reset this between calls, but only the options
+        # given this time are to be checked.
+        self.option_seen = {}
         return OptionParser.parse_args(self, **kwargs)
 
     def __init__(self, mapping=None, version=None):
@@ -124,6 +191,58 @@ class KSOptionParser(OptionParser):
         self.lineno = None
         self.option_seen = {}
         self.version = version
+        self._frozen = False
+        self._keys = None
+        self._policy = None
+
+    def freeze(self):
+        """Mark the option table of this parser as complete.  After this, no
+           more options may be added and clone may be used to hand out copies
+           of this parser.
+        """
+        self._frozen = True
+        self.keys()
+        self._versionPolicy()
+
+    def clone(self):
+        """Return a new KSOptionParser that shares the option table of this
+           one, which must be frozen.  Everything that is modified while
+           parsing (lineno, option_seen, and the optparse parsing state) is
+           private to the returned copy, so clones may be used independently
+           of each other.
+        """
+        if not self._frozen:
+            raise TypeError("Only a frozen KSOptionParser may be cloned.")
+
+        op = copy(self)
+        op.lineno = None
+        op.option_seen = {}
+        return op
+
+# A dict mapping (class, version) to a frozen KSOptionParser.  This is
+# maintained by sharedParser and no one else should be touching it.
+_parserCache = {}
+
+def sharedParser(cls, version, builder):
+    """Return a private clone of the KSOptionParser for the given class and
+       kickstart syntax version.  The first time a (cls, version) pair is seen,
+       builder is called with no arguments to create the parser.  The result
+       is frozen and kept, so later calls only pay for the clone.
+
+       builder must not return a parser that depends on the state of any one
+       instance of cls, since the same option table will be used by all of
+       them.
+    """
+    key = (cls, version)
+
+    try:
+        op = _parserCache[key]
+    except KeyError:
+        op = builder()
+        op.freeze()
+        op = _parserCache.setdefault(key, op)
+
+    return op.clone()
 
 def _check_ksboolean(_option, opt, value):
     if value.lower() in ("on", "yes", "true", "1"):
@@ -52,6 +52,11 @@ class OrderedSet(collections.MutableSet):
         self.discard(key)
         return key
 
+    def __reduce__(self):
+        # Pickle the elements, not the linked list holding them, which would
+        # nest one level deeper for every element.
+        return (self.__class__, (list(self),))
+
     def __repr__(self):
         if not self:
             return '%s()' % (self.__class__.__name__,)
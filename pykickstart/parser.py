@@ -29,20 +29,26 @@ This module exports several important classes:
     Packages - Representation of the %packages section.
 
     KickstartParser - The kickstart file parser state machine.
+
+It also exports parseKickstart, which loads a kickstart file once, picks the
+handler for the version it asks for, and parses it.
 """
 
 from collections import Iterator
+import itertools
+from multiprocessing.pool import ThreadPool
 import os
+import re
 import six
-import shlex
+import sys
 import tempfile
 from optparse import OptionParser
-import warnings
 
 from pykickstart import constants, version
+from pykickstart.diagnostics import ERROR, WARNING, Diagnostics, _setActiveParser, warn
 from pykickstart.errors import KickstartError, KickstartParseError, KickstartValueError, formatErrorMsg
 from pykickstart.ko import KickstartObject
-from pykickstart.load import load_to_str
+from pykickstart.load import MAX_WORKERS, _is_url, load_many, load_to_str
 from pykickstart.orderedset import OrderedSet
 from pykickstart.sections import PackageSection, PreScriptSection, PreInstallScriptSection, PostScriptSection, TracebackScriptSection, NullSection
 
@@ -51,15 +57,164 @@ from pykickstart.i18n import _
 STATE_END = "end"
 STATE_COMMANDS = "commands"
 
-ver = version.DEVEL
+# Lines without quotes, escapes, comments, or any whitespace other than what
+# shlex considers whitespace can simply be split with str.split.
+_plainLineRe = re.compile(r"[^\S \t\r\n]|['\"\\]")
+_plainLineCommentsRe = re.compile(r"[^\S \t\r\n]|['\"\\#]")
+
+# The pieces a word is made of in the general case.
+_wordRe = re.compile(r"[^ \t\r\n'\"\\]+")
+_wordCommentsRe = re.compile(r"[^ \t\r\n'\"\\#]+")
+_spaceRe = re.compile(r"[ \t\r\n]*")
+_dquoteRe = re.compile(r"[^\"\\]*")
+
+# The kinds of lines _classifyLine knows about.
+LINE_BLANK = 0
+LINE_COMMENT = 1
+LINE_PERCENT = 2
+LINE_OTHER = 3
+
+def _classifyLine(line):
+    """Return a tuple of the kind of the given line and, for lines where the
+       first non-whitespace character is a percent sign, the first word on
+       the line.  This looks at the line only once, instead of stripping it
+       again for every question the parser has about it.
+    """
+    s = line.lstrip()
+    if not s:
+        return (LINE_BLANK, None)
+
+    c = s[0]
+    if c == "#":
+        return (LINE_COMMENT, None)
+    elif c == "%":
+        return (LINE_PERCENT, s.split(None, 1)[0])
+    else:
+        return (LINE_OTHER, None)
+
+def _splitLine(s, comments=False):
+    """Split the string s into a list of arguments the same way
+       shlex.split(s, comments) does, following POSIX shell quoting rules.
+       Plain lines are handled by str.split, and everything else by a
+       scanner that works on whole chunks of the string at once.
+    """
+    if comments:
+        if not _plainLineCommentsRe.search(s):
+            return s.split()
+
+        wordRe = _wordCommentsRe
+    else:
+        if not _plainLineRe.search(s):
+            return s.split()
+
+        wordRe = _wordRe
+
+    retval = []
+    length = len(s)
+    pos = _spaceRe.match(s).end()
+
+    while pos < length:
+        if comments and s[pos] == "#":
+            # Like shlex, skip to the end of the current line.
+            pos = s.find("\n", pos)
+            if pos == -1:
+                break
+
+            pos = _spaceRe.match(s, pos + 1).end()
+            continue
+
+        word = []
+        quoted = False
+
+        while pos < length:
+            ch = s[pos]
+
+            if ch in " \t\r\n" or (comments and ch == "#"):
+                break
+            elif ch == "'":
+                end = s.find("'", pos + 1)
+                if end == -1:
+                    raise ValueError("No closing quotation")
+
+                word.append(s[pos + 1:end])
+                quoted = True
+                pos = end + 1
+            elif ch == '"':
+                pos += 1
+                quoted = True
+
+                while True:
+                    end = _dquoteRe.match(s, pos).end()
+                    word.append(s[pos:end])
+
+                    if end == length:
+                        raise ValueError("No closing quotation")
+                    elif s[end] == '"':
+                        pos = end + 1
+                        break
+                    elif end + 1 == length:
+                        raise ValueError("No escaped character")
+                    elif s[end + 1] in '"\\':
+                        word.append(s[end + 1])
+                    else:
+                        word.append(s[end:end + 2])
+
+                    pos = end + 2
+            elif ch == "\\":
+                if pos + 1 == length:
+                    raise ValueError("No escaped character")
+
+                word.append(s[pos + 1])
+                pos += 2
+            else:
+                m = wordRe.match(s, pos)
+                word.append(m.group())
+                pos = m.end()
+
+        if word or quoted:
+            retval.append("".join(word))
+
+        pos = _spaceRe.match(s, pos).end()
+
+    return retval
+
+def _iterLines(s, chunkSize=65536):
+    """Generate the lines of the string s the way s.splitlines(True) would
+       split them, without making a list of them all at once.  A line always
+       ends right after a newline, so s is cut into chunks after newlines
+       and only one chunk is split at a time.
+    """
+    start = 0
+    length = len(s)
+
+    while start < length:
+        end = s.find("\n", start + chunkSize)
+        if end == -1:
+            end = length
+        else:
+            end += 1
+
+        for line in s[start:end].splitlines(True):
+            yield line
+
+        start = end
+
+def _preprocessStateMachine (lineIter, prefetched=None):
+    """Generate the lines of the preprocessed kickstart file, reading the
+       original from lineIter.  %ksappend lines are replaced with the
+       contents of the file they name, taken from the dict prefetched if it
+       is there.  The lines are split exactly as they would be if the whole
+       output were written to a file and read back.
+    """
+    if prefetched is None:
+        prefetched = {}
 
-def _preprocessStateMachine (lineIter):
     l = None
     lineno = 0
 
-    # Now open an output kickstart file that we are going to write to one
-    # line at a time.
-    (outF, outName) = tempfile.mkstemp("-ks.cfg", "", "/tmp")
+    # Any appended file that does not end with a newline runs on into the
+    # next line of the input, same as it would in a file.
+    partial = ""
 
     while True:
         try:
@@ -76,10 +231,8 @@ def _preprocessStateMachine (lineIter):
 
         ll = l.strip()
         if not ll.startswith("%ksappend"):
-            if six.PY3:
-                import sys
-                l = l.encode(sys.getdefaultencoding())
-            os.write(outF, l)
+            yield partial + l
+            partial = ""
             continue
 
         # Try to pull down the remote file.
@@ -89,21 +242,102 @@ def _preprocessStateMachine (lineIter):
             raise KickstartParseError(formatErrorMsg(lineno, msg=_("Illegal url for %%ksappend: %s") % ll))
 
         try:
-            contents = load_to_str(ksurl)
+            if ksurl in prefetched:
+                contents = prefetched[ksurl]
+            else:
+                contents = load_to_str(ksurl)
         except KickstartError as e:
             raise KickstartError(formatErrorMsg(lineno, msg=_("Unable to open %%ksappend file: %s") % str(e)))
 
-        # If that worked, write the remote file to the output kickstart
-        # file in one burst.  Then close everything up to get ready to
-        # read ahead in the input file.  This allows multiple %ksappend
-        # lines to exist.
-        if contents is not None:
-            os.write(outF, contents)
+        # If that worked, pass the remote file along in place of the
+        # %ksappend line.  This allows multiple %ksappend lines to exist.
+        if contents:
+            appended = (partial + contents).splitlines(True)
+            if appended[-1].endswith(("\r", "\n")):
+                partial = ""
+            else:
+                partial = appended.pop()
+
+            for line in appended:
+                yield line
+
+    if partial:
+        yield partial
+
+def _urlsIn (s, keyword):
+    # Return every URL named by a line in s starting with keyword, which is
+    # "%include" or "%ksappend".  The lines are split the same way the parser
+    # and preprocessor split them.
+    urls = []
+
+    for line in s.splitlines():
+        (kind, first) = _classifyLine(line)
+        if kind != LINE_PERCENT or first != keyword:
+            continue
+
+        if keyword == "%ksappend":
+            args = line.strip().split(' ')
+        else:
+            args = _splitLine(line, comments=True)
+
+        if len(args) > 1 and _is_url(args[1]):
+            urls.append(args[1])
+
+    return urls
+
+def _prefetchAppends (s):
+    # Fetch all the %ksappend URLs in s at once, if there is more than one.
+    urls = _urlsIn(s, "%ksappend")
+    if len(urls) > 1:
+        return load_many(urls)
+    else:
+        return {}
+
+def _writeTempKickstart (lines):
+    # Write all the preprocessed lines out to a temporary kickstart file in
+    # one burst and return its location.
+    contents = "".join(lines)
+    if six.PY3:
+        contents = contents.encode(sys.getdefaultencoding())
+
+    (outF, outName) = tempfile.mkstemp("-ks.cfg", "", "/tmp")
+    with os.fdopen(outF, "wb") as f:
+        f.write(contents)
 
-    # All done - close the temp file and return its location.
-    os.close(outF)
     return outName
 
+def _readInput (f):
+    try:
+        return load_to_str(f)
+    except KickstartError as e:
+        raise KickstartError(formatErrorMsg(0, msg=_("Unable to open input kickstart file: %s") % str(e)))
+
+def preprocessLines (lineIter):
+    """Preprocess the kickstart file, provided as an iterable of lines.  This
+        is a generator that yields the lines of the complete kickstart file
+        with all %ksappend lines resolved, without writing anything to disk.
+        Iteration stops at the end of lineIter or at the first empty string.
+    """
+    return _preprocessStateMachine (iter(lineIter))
+
+def preprocessFromStringToString (s):
+    """Preprocess the kickstart file, provided as the string s.  This
+        method is currently only useful for handling %ksappend lines,
+        which need to be fetched before the real kickstart parser can be
+        run.  Returns the complete kickstart file as a string, suitable
+        for passing to KickstartParser.readKickstartFromString.
+    """
+    return "".join(_preprocessStateMachine (iter(s.splitlines(True)), _prefetchAppends(s)))
+
+def preprocessKickstartToString (f):
+    """Preprocess the kickstart file, given by the filename f.  This
+        method is currently only useful for handling %ksappend lines,
+        which need to be fetched before the real kickstart parser can be
+        run.  Returns the complete kickstart file as a string, suitable
+        for passing to KickstartParser.readKickstartFromString.
+    """
+    return preprocessFromStringToString (_readInput(f))
+
 def preprocessFromString (s):
     """Preprocess the kickstart file, provided as the string str.  This
         method is currently only useful for handling %ksappend lines,
@@ -111,8 +345,7 @@ def preprocessFromString (s):
         run.  Returns the location of the complete kickstart file.
     """
     i = iter(s.splitlines(True) + [""])
-    rc = _preprocessStateMachine (i)
-    return rc
+    return _writeTempKickstart (_preprocessStateMachine (i, _prefetchAppends(s)))
 
 def preprocessKickstart (f):
     """Preprocess the kickstart file, given by the filename file.  This
@@ -120,12 +353,53 @@ def preprocessKickstart (f):
         which need to be fetched before the real kickstart parser can be
         run.  Returns the location of the complete kickstart file.
     """
-    try:
-        contents = load_to_str(f)
-    except KickstartError as e:
-        raise KickstartError(formatErrorMsg(0, msg=_("Unable to open input kickstart file: %s") % str(e)))
+    contents = _readInput(f)
+    i = iter(contents.splitlines(True))
+    return _writeTempKickstart (_preprocessStateMachine (i, _prefetchAppends(contents)))
+
+def parseKickstart (f, syntaxVersion=None, **kwargs):
+    """Process the kickstart file given by the filename or URL f, loading it
+        only once.  If syntaxVersion is None, the version of the handler is
+        taken from the #version= comment at the top of the file, as
+        versionFromFile would.  Any other keyword arguments are passed on to
+        KickstartParser.  Returns the parser, whose handler holds the
+        results.
+    """
+    s = _readInput(f)
+
+    if syntaxVersion is None:
+        syntaxVersion = version.versionFromString(s)
+
+    parser = KickstartParser(version.makeVersion(syntaxVersion), **kwargs)
+    parser.readKickstart(f, contents=s)
+    return parser
+
+def parse_many (sources, max_workers=MAX_WORKERS, syntaxVersion=None, **kwargs):
+    """Process several kickstart files given by filenames or URLs at the same
+        time, each as parseKickstart would with its own parser and handler.
+        Files of different syntax versions may be mixed.  At most max_workers
+        are processed at once.  Any keyword arguments are passed on to every
+        KickstartParser, so a ParseCache should not be given here since it
+        is not safe to share between threads.  Returns a list with one item
+        for each source, in the same order: the parser if processing
+        succeeded, or the KickstartError that stopped it.
+    """
+    sources = list(sources)
 
-    return _preprocessStateMachine (iter(contents.splitlines(True)))
+    def _parse(f):
+        try:
+            return parseKickstart(f, syntaxVersion, **kwargs)
+        except KickstartError as e:
+            return e
+
+    if len(sources) <= 1 or max_workers <= 1:
+        return [_parse(f) for f in sources]
+
+    pool = ThreadPool(min(max_workers, len(sources)))
+    try:
+        return pool.map(_parse, sources)
+    finally:
+        pool.close()
 
 class PutBackIterator(Iterator):
     def __init__(self, iterable):
@@ -176,12 +450,23 @@ class Script(KickstartObject):
            :keyword logfile: Where all messages from the script should be logged.
 
            :keyword script: A string containing all the lines of the script.
+                            It may also be given as a list of lines, which
+                            are only joined into one string the first time
+                            script is read.
 
            :keyword type: The type of the script, which can be KS_SCRIPT_* from
                           :mod:`pykickstart.constants`.
+
+           :keyword version: The kickstart syntax version the script is
+                             written out for.  Defaults to DEVEL.
         """
         KickstartObject.__init__(self, *args, **kwargs)
-        self.script = "".join(script)
+
+        if isinstance(script, six.string_types):
+            self.script = script
+        else:
+            self._script = None
+            self._scriptLines = script if isinstance(script, list) else list(script)
 
         self.interp = kwargs.get("interp", "/bin/sh")
         self.inChroot = kwargs.get("inChroot", False)
@@ -189,39 +474,82 @@ class Script(KickstartObject):
         self.logfile = kwargs.get("logfile", None)
         self.errorOnFail = kwargs.get("errorOnFail", False)
         self.type = kwargs.get("type", constants.KS_SCRIPT_PRE)
+        self.version = kwargs.get("version", version.DEVEL)
+
+    @property
+    def script(self):
+        """A string containing all the lines of the script."""
+        if self._script is None:
+            self._script = "".join(self._scriptLines)
+            self._scriptLines = None
+
+        return self._script
+
+    @script.setter
+    def script(self, value):
+        self._script = value
+        self._scriptLines = None
+
+    def to_dict(self):
+        """Return a dict of all the attributes of this script, suitable for
+           encoding as JSON.  The result can be turned back into a script with
+           from_dict.
+        """
+        return {"script": self.script, "interp": self.interp,
+                "inChroot": self.inChroot, "lineno": self.lineno,
+                "logfile": self.logfile, "errorOnFail": self.errorOnFail,
+                "type": self.type, "version": self.version}
+
+    @classmethod
+    def from_dict(cls, d):
+        """Return a new Script with the attributes given by d, as returned by
+           to_dict.
+        """
+        kwargs = dict(d)
+        return cls(kwargs.pop("script"), **kwargs)
 
     def __str__(self):
         """Return a string formatted for output to a kickstart file."""
-        retval = ""
+        retval = []
 
         if self.type == constants.KS_SCRIPT_PRE:
-            retval += '\n%pre'
+            retval.append('\n%pre')
         elif self.type == constants.KS_SCRIPT_POST:
-            retval += '\n%post'
+            retval.append('\n%post')
         elif self.type == constants.KS_SCRIPT_TRACEBACK:
-            retval += '\n%traceback'
+            retval.append('\n%traceback')
         elif self.type == constants.KS_SCRIPT_PREINSTALL:
-            retval += '\n%pre-install'
+            retval.append('\n%pre-install')
 
         if self.interp != "/bin/sh" and self.interp != "":
-            retval += " --interpreter=%s" % self.interp
+            retval.append(" --interpreter=%s" % self.interp)
         if self.type == constants.KS_SCRIPT_POST and not self.inChroot:
-            retval += " --nochroot"
+            retval.append(" --nochroot")
         if self.logfile != None:
-            retval += " --logfile %s" % self.logfile
+            retval.append(" --logfile %s" % self.logfile)
         if self.errorOnFail:
-            retval += " --erroronfail"
+            retval.append(" --erroronfail")
 
-        if self.script.endswith("\n"):
-            if ver >= version.F8:
-                return retval + "\n%s%%end\n" % self.script
-            else:
-                return retval + "\n%s\n" % self.script
+        retval.append("\n")
+
+        # Write a body nobody has asked for yet straight from its lines,
+        # instead of joining them up just to copy them again.
+        if self._script is None:
+            retval.extend(self._scriptLines)
+            last = next((line for line in reversed(self._scriptLines) if line), "")
         else:
-            if ver >= version.F8:
-                return retval + "\n%s\n%%end\n" % self.script
-            else:
-                return retval + "\n%s\n" % self.script
+            retval.append(self._script)
+            last = self._script
+
+        if not last.endswith("\n"):
+            retval.append("\n")
+
+        if self.version >= version.F8:
+            retval.append("%end\n")
+        elif last.endswith("\n"):
+            retval.append("\n")
+
+        return "".join(retval)
 
 
 ##
@@ -240,6 +568,17 @@ class Group(KickstartObject):
         self.name = name
         self.include = include
 
+    def to_dict(self):
+        """Return a dict of all the attributes of this group."""
+        return {"name": self.name, "include": self.include}
+
+    @classmethod
+    def from_dict(cls, d):
+        """Return a new Group with the attributes given by d, as returned by
+           to_dict.
+        """
+        return cls(d["name"], d["include"])
+
     def __str__(self):
         """Return a string formatted for output to a kickstart file."""
         if self.include == constants.GROUP_REQUIRED:
@@ -302,6 +641,8 @@ class Packages(KickstartObject):
            multiLib      -- Whether to use yum's "all" multilib policy.
            seen          -- If %packages was ever used in the kickstart file,
                             this attribute will be set to True.
+           version       -- The kickstart syntax version the section is
+                            written out for.  Defaults to DEVEL.
 
         """
         KickstartObject.__init__(self, *args, **kwargs)
@@ -310,68 +651,125 @@ class Packages(KickstartObject):
         self.nocore = False
         self.default = False
         self.environment = None
-        self.excludedList = []
         self.excludedGroupList = []
         self.excludeDocs = False
         self.groupList = []
         self.handleMissing = constants.KS_MISSING_PROMPT
-        self.packageList = []
         self.instLangs = None
         self.multiLib = False
         self.seen = False
+        self.version = kwargs.get("version", version.DEVEL)
+
+        # The package and excluded package sets are kept live across calls to
+        # add so each line costs constant time.  The matching lists are only
+        # built when someone asks for them.  Once handed out, a list is the
+        # authoritative copy (it may have been modified in place) until the
+        # next call to add rebuilds the sets from it.
+        self._packageSet = OrderedSet()
+        self._excludedSet = OrderedSet()
+        self._packageList = None
+        self._excludedList = None
+
+    @property
+    def packageList(self):
+        if self._packageList is None:
+            self._packageList = list(self._packageSet)
+
+        return self._packageList
+
+    @packageList.setter
+    def packageList(self, value):
+        self._packageList = value
+
+    @property
+    def excludedList(self):
+        if self._excludedList is None:
+            self._excludedList = list(self._excludedSet)
+
+        return self._excludedList
+
+    @excludedList.setter
+    def excludedList(self, value):
+        self._excludedList = value
+
+    # The attributes saved by to_dict, besides the package and group lists.
+    _dictAttrs = ["addBase", "nocore", "default", "environment", "excludeDocs",
+                  "handleMissing", "instLangs", "multiLib", "seen"]
+
+    def to_dict(self):
+        """Return a dict of all the attributes of this %packages section,
+           suitable for encoding as JSON.  The result can be turned back into
+           a Packages object with from_dict.
+        """
+        d = dict((attr, getattr(self, attr)) for attr in self._dictAttrs)
+        d["version"] = self.version
+        d["packageList"] = list(self.packageList)
+        d["excludedList"] = list(self.excludedList)
+        d["groupList"] = [grp.to_dict() for grp in self.groupList]
+        d["excludedGroupList"] = [grp.to_dict() for grp in self.excludedGroupList]
+        return d
+
+    @classmethod
+    def from_dict(cls, d):
+        """Return a new Packages object with the attributes given by d, as
+           returned by to_dict.
+        """
+        obj = cls(version=d.get("version", version.DEVEL))
+
+        for attr in cls._dictAttrs:
+            setattr(obj, attr, d[attr])
+
+        obj.packageList = list(d["packageList"])
+        obj.excludedList = list(d["excludedList"])
+        obj.groupList = [Group.from_dict(grp) for grp in d["groupList"]]
+        obj.excludedGroupList = [Group.from_dict(grp) for grp in d["excludedGroupList"]]
+        return obj
 
     def __str__(self):
-        """Return a string formatted for output to a kickstart file."""
-        pkgs = ""
+        """Return a string formatted for output to a kickstart file.  The
+           package and group lists are written out sorted, but are not
+           themselves reordered.
+        """
+        pkgs = []
 
         if not self.default:
             if self.environment:
-                pkgs += "@^%s\n" % self.environment
-
-            grps = self.groupList
-            grps.sort()
-            for grp in grps:
-                pkgs += "%s\n" % grp.__str__()
-
-            p = self.packageList
-            p.sort()
-            for pkg in p:
-                pkgs += "%s\n" % pkg
-
-            grps = self.excludedGroupList
-            grps.sort()
-            for grp in grps:
-                pkgs += "-%s\n" % grp.__str__()
+                pkgs.append("@^%s\n" % self.environment)
 
-            p = self.excludedList
-            p.sort()
-            for pkg in p:
-                pkgs += "-%s\n" % pkg
+            pkgs.extend("%s\n" % grp.__str__() for grp in sorted(self.groupList))
+            pkgs.extend("%s\n" % pkg for pkg in sorted(self.packageList))
+            pkgs.extend("-%s\n" % grp.__str__() for grp in sorted(self.excludedGroupList))
+            pkgs.extend("-%s\n" % pkg for pkg in sorted(self.excludedList))
 
-            if pkgs == "" and not self.seen:
+            if not pkgs and not self.seen:
                 return ""
 
-        retval = "\n%packages"
+        retval = ["\n%packages"]
 
         if self.default:
-            retval += " --default"
+            retval.append(" --default")
         if self.excludeDocs:
-            retval += " --excludedocs"
+            retval.append(" --excludedocs")
         if not self.addBase:
-            retval += " --nobase"
+            retval.append(" --nobase")
         if self.nocore:
-            retval += " --nocore"
+            retval.append(" --nocore")
         if self.handleMissing == constants.KS_MISSING_IGNORE:
-            retval += " --ignoremissing"
+            retval.append(" --ignoremissing")
         if self.instLangs is not None:
-            retval += " --instLangs=%s" % self.instLangs
+            retval.append(" --instLangs=%s" % self.instLangs)
         if self.multiLib:
-            retval += " --multilib"
+            retval.append(" --multilib")
 
-        if ver >= version.F8:
-            return retval + "\n" + pkgs + "\n%end\n"
+        retval.append("\n")
+        retval.extend(pkgs)
+
+        if self.version >= version.F8:
+            retval.append("\n%end\n")
         else:
-            return retval + "\n" + pkgs + "\n"
+            retval.append("\n")
+
+        return "".join(retval)
 
     def _processGroup (self, line):
         op = OptionParser()
@@ -399,14 +797,18 @@ class Packages(KickstartObject):
 
     def add (self, pkgList):
         """Given a list of lines from the input file, strip off any leading
-           symbols and add the result to the appropriate list.
+           symbols and add the result to the appropriate list.  The lines are
+           processed in order, so calling this method once with every line of
+           a %packages section gives the same result as calling it once per
+           line.
         """
-        existingExcludedSet = OrderedSet(self.excludedList)
-        existingPackageSet = OrderedSet(self.packageList)
-        newExcludedSet = OrderedSet()
-        newPackageSet = OrderedSet()
+        if self._packageList is not None:
+            self._packageSet = OrderedSet(self._packageList)
+            self._packageList = None
 
-        excludedGroupList = []
+        if self._excludedList is not None:
+            self._excludedSet = OrderedSet(self._excludedList)
+            self._excludedList = None
 
         for pkg in pkgList:
             stripped = pkg.strip()
@@ -419,32 +821,28 @@ class Packages(KickstartObject):
                 if stripped[1:3] == "@^" and self.environment == stripped[3:]:
                     self.environment = None
                 elif stripped[1] == "@":
-                    excludedGroupList.append(Group(name=stripped[2:]))
+                    grp = Group(name=stripped[2:])
+
+                    # Groups have to be excluded in two different ways (note:
+                    # can't use sets here because we have to store objects).
+                    # First, an excluded group may be cancelling out a
+                    # previously given one.  This is often the case when using
+                    # %include.  So there we should just remove the group from
+                    # the list.
+                    self.groupList = [g for g in self.groupList if g.name != grp.name]
+
+                    # Second, the package list could have included globs which
+                    # are not processed by pykickstart.  In that case we need
+                    # to preserve a list of excluded groups so whatever tool
+                    # doing package/group installation can take appropriate
+                    # action.
+                    self.excludedGroupList.append(grp)
                 else:
-                    newExcludedSet.add(stripped[1:])
+                    self._packageSet.discard(stripped[1:])
+                    self._excludedSet.add(stripped[1:])
             else:
-                newPackageSet.add(stripped)
-
-        # Groups have to be excluded in two different ways (note: can't use
-        # sets here because we have to store objects):
-        excludedGroupNames = [g.name for g in excludedGroupList]
-
-        # First, an excluded group may be cancelling out a previously given
-        # one.  This is often the case when using %include.  So there we should
-        # just remove the group from the list.
-        self.groupList = [g for g in self.groupList if g.name not in excludedGroupNames]
-
-        # Second, the package list could have included globs which are not
-        # processed by pykickstart.  In that case we need to preserve a list of
-        # excluded groups so whatever tool doing package/group installation can
-        # take appropriate action.
-        self.excludedGroupList.extend(excludedGroupList)
-
-        existingPackageSet = (existingPackageSet - newExcludedSet) | newPackageSet
-        existingExcludedSet = (existingExcludedSet - existingPackageSet) | newExcludedSet
-
-        self.packageList = list(existingPackageSet)
-        self.excludedList = list(existingExcludedSet)
+                self._packageSet.add(stripped)
+                self._excludedSet.discard(stripped)
 
 
 ###
@@ -458,12 +856,28 @@ class KickstartParser(object):
        overridden.
     """
     def __init__ (self, handler, followIncludes=True, errorsAreFatal=True,
-                  missingIncludeIsFatal=True, unknownSectionIsFatal=True):
+                  missingIncludeIsFatal=True, unknownSectionIsFatal=True,
+                  cache=None, prefetch=False, diagnostics=None):
         """Create a new KickstartParser instance.  Instance attributes:
 
+           cache                 -- An instance of pykickstart.cache.ParseCache,
+                                    or None.  If given, the results of parsing
+                                    are saved there and reused when the same
+                                    kickstart file is read again.  Every
+                                    kickstart file read then starts from a
+                                    freshly reset handler.  Any directory it
+                                    keeps results in must be private to the
+                                    user running the parser.
+           diagnostics           -- An instance of
+                                    pykickstart.diagnostics.Diagnostics, or
+                                    None.  If given, every warning is added
+                                    to it, along with where it was found,
+                                    instead of going through the warnings
+                                    module.  If not, the parser makes its
+                                    own, which only collects errors.
            errorsAreFatal        -- Should errors cause processing to halt, or
-                                    just print a message to the screen?  This
-                                    is most useful for writing syntax checkers
+                                    just be added to diagnostics?  This is
+                                    most useful for writing syntax checkers
                                     that may want to continue after an error is
                                     encountered.
            followIncludes        -- If %include is seen, should the included
@@ -474,6 +888,12 @@ class KickstartParser(object):
                                     will be executed.
            missingIncludeIsFatal -- Should missing include files be fatal, even
                                     if errorsAreFatal is False?
+           prefetch              -- If %include is followed, should every URL
+                                    it names be fetched at the same time
+                                    before parsing starts?  This includes
+                                    URLs named by the files those URLs bring
+                                    in, and so on.  The parser then reads
+                                    them from memory when it gets to them.
            unknownSectionIsFatal -- Should an unknown %section be fatal?  Not all
                                     sections are handled by pykickstart.  Some are
                                     user-defined, so there should be a way to have
@@ -485,15 +905,38 @@ class KickstartParser(object):
         self.currentdir = {}
         self.missingIncludeIsFatal = missingIncludeIsFatal
         self.unknownSectionIsFatal = unknownSectionIsFatal
+        self.cache = cache
+        self.prefetch = prefetch
+
+        # A dict mapping URLs named by %include to their contents, filled in
+        # before parsing starts when prefetch is True.
+        self._prefetched = {}
+
+        # While a ParseCache is recording, this is a list of (path, contents)
+        # for every file brought in by %include.
+        self._includes = None
 
         self._state = STATE_COMMANDS
         self._includeDepth = 0
         self._line = ""
 
-        self.version = self.handler.version
+        self._collectWarnings = diagnostics is not None
+        if diagnostics is None:
+            diagnostics = Diagnostics()
+        self.diagnostics = diagnostics
+
+        # Where the parser is, for diagnostics.  _files is a stack of the
+        # names of the files being read, with included files on top.
+        self._lineno = None
+        self._command = None
+        self._files = []
+
+        # A new object for each kickstart file read, not counting the files
+        # it includes.  Commands use it to tell when something else could
+        # have changed their data since they last looked.
+        self._readToken = None
 
-        global ver
-        ver = self.version
+        self.version = self.handler.version
 
         self._sections = {}
         self.setupSections()
@@ -570,23 +1013,24 @@ class KickstartParser(object):
 
             lineno += 1
 
+            (kind, possibleSectionStart) = _classifyLine(line)
+
             # Throw away blank lines and comments, unless the section wants all
             # lines.
-            if self._isBlankOrComment(line) and not obj.allLines:
+            if kind in (LINE_BLANK, LINE_COMMENT) and not obj.allLines:
                 continue
 
-            if line.lstrip().startswith("%"):
+            if kind == LINE_PERCENT:
                 # If we're in a script, the line may begin with "%something"
                 # that's not the start of any section we recognize, but still
                 # valid for that script.  So, don't do the split below unless
                 # we're sure.
-                possibleSectionStart = line.split()[0]
-                if not self._validState(possibleSectionStart) \
+                if possibleSectionStart not in self._sections \
                    and possibleSectionStart not in ("%end", "%include"):
                     obj.handleLine(line)
                     continue
 
-                args = shlex.split(line)
+                args = _splitLine(line)
 
                 if args and args[0] == "%end":
                     # This is a properly terminated section.
@@ -596,7 +1040,10 @@ class KickstartParser(object):
                     if len(args) == 1 or not args[1]:
                         raise KickstartParseError(formatErrorMsg(lineno))
 
+                    self._lineno = lineno
+                    self._command = "%include"
                     self._handleInclude(args[1])
+                    self._command = obj.sectionOpen
                     continue
                 elif args and args[0] == "%ksappend":
                     continue
@@ -620,23 +1067,30 @@ class KickstartParser(object):
 
     def _validState(self, st):
         """Is the given section tag one that has been registered with the parser?"""
-        return st in list(self._sections.keys())
+        return st in self._sections
+
+    def _diagnose(self, severity, code, message):
+        """Add a problem found at the current position to diagnostics."""
+        self.diagnostics.add(severity, code, message, self._lineno,
+                             self._files[-1] if self._files else None, self._command)
 
     def _tryFunc(self, fn):
         """Call the provided function (which doesn't take any arguments) and
            do the appropriate error handling.  If errorsAreFatal is False, this
-           function will just print the exception and keep going.
+           function will just add the exception to diagnostics and keep going.
         """
         try:
             fn()
         except Exception as msg:    # pylint: disable=broad-except
             if self.errorsAreFatal:
                 raise
+            elif isinstance(msg, Warning):
+                self._diagnose(WARNING, "warning", str(msg))
             else:
-                print(msg)
+                self._diagnose(ERROR, getattr(msg, "code", "internal-error"), str(msg))
 
     def _isBlankOrComment(self, line):
-        return line.isspace() or line == "" or line.lstrip()[0] == '#'
+        return _classifyLine(line)[0] in (LINE_BLANK, LINE_COMMENT)
 
     def _handleInclude(self, f):
         # This case comes up primarily in ksvalidator.
@@ -647,13 +1101,15 @@ class KickstartParser(object):
 
         try:
             self.readKickstart(f, reset=False)
-        except KickstartError:
+        except KickstartError as e:
             # Handle the include file being provided over the
             # network in a %pre script.  This case comes up in the
             # early parsing in anaconda.
             if self.missingIncludeIsFatal:
                 raise
 
+            self._diagnose(ERROR, "missing-include", str(e))
+
         self._includeDepth -= 1
 
     def _stateMachine(self, lineIter):
@@ -672,17 +1128,19 @@ class KickstartParser(object):
             lineno += 1
 
             # Eliminate blank lines, whitespace-only lines, and comments.
-            if self._isBlankOrComment(self._line):
+            if _classifyLine(self._line)[0] in (LINE_BLANK, LINE_COMMENT):
                 self._handleSpecialComments(self._line)
                 continue
 
             # Split the line, discarding comments.
-            args = shlex.split(self._line, comments=True)
+            args = _splitLine(self._line, comments=True)
 
             if args[0] == "%include":
                 if len(args) == 1 or not args[1]:
                     raise KickstartParseError(formatErrorMsg(lineno))
 
+                self._lineno = lineno
+                self._command = "%include"
                 self._handleInclude(args[1])
                 continue
 
@@ -703,11 +1161,15 @@ class KickstartParser(object):
                             # NullSection for the header we just saw.  Then nothing else
                             # needs to change.  You can turn this warning into an error via
                             # ksvalidator, or the warnings module.
-                            warnings.warn(_("Potentially unknown section seen at line %(lineno)s: %(sectionName)s") % {"lineno": lineno, "sectionName": newSection})
+                            self._lineno = lineno
+                            self._command = newSection
+                            warn(_("Potentially unknown section seen at line %(lineno)s: %(sectionName)s") % {"lineno": lineno, "sectionName": newSection}, "unknown-section")
                             self.registerSection(NullSection(self.handler, sectionOpen=newSection))
 
                     self._state = newSection
                     obj = self._sections[self._state]
+                    self._lineno = lineno
+                    self._command = newSection
                     self._tryFunc(lambda: obj.handleHeader(lineno, args))
 
                     # This will handle all section processing, kicking us back
@@ -716,6 +1178,8 @@ class KickstartParser(object):
                     lineno = self._readSection(lineIter, lineno)
                 else:
                     # This is a command in the command section.  Dispatch to it.
+                    self._lineno = lineno
+                    self._command = args[0]
                     self._tryFunc(lambda: self.handleCommand(lineno, args))
             elif self._state == STATE_END:
                 break
@@ -724,19 +1188,112 @@ class KickstartParser(object):
                 lineno -= 1
                 lineno = self._readSection(lineIter, lineno)
 
+    def parse(self, s, fresh=True):
+        """Process a kickstart file, provided as the string s, and return the
+           handler holding the results.  If fresh is True, the handler and all
+           sections are first reset so nothing is left over from any kickstart
+           file previously parsed with them.  This allows one parser and
+           handler to be reused for many kickstart files.
+        """
+        if fresh:
+            self._resetHandler()
+
+        self.readKickstartFromString(s)
+        return self.handler
+
+    def _resetHandler(self):
+        if self.handler:
+            self.handler.reset()
+
+        for obj in self._sections.values():
+            obj.reset()
+
     def readKickstartFromString (self, s, reset=True):
         """Process a kickstart file, provided as the string str."""
         if reset:
             self._reset()
 
-        # Add a "" to the end of the list so the string reader acts like the
+        if self.cache is not None and self._includeDepth == 0:
+            self.cache.read(self, s, lambda: self._readString(s))
+        else:
+            self._readString(s)
+
+    def _readString(self, s):
+        if self.prefetch and self.followIncludes and self._includeDepth == 0:
+            self._prefetched = self._prefetchIncludes(s)
+
+            try:
+                self._readLines(s)
+            finally:
+                self._prefetched = {}
+        else:
+            self._readLines(s)
+
+    def _readLines(self, s):
+        self._readIterable(_iterLines(s))
+
+    def _readIterable(self, lines):
+        # Add a "" to the end of the lines so the string reader acts like the
         # file reader and we only get StopIteration when we're after the final
         # line of input.
-        i = PutBackIterator(s.splitlines(True) + [""])
-        self._stateMachine (i)
+        i = PutBackIterator(itertools.chain(lines, [""]))
+
+        # Warnings from anything called while reading go to this parser.
+        # Another parser may already be reading in this thread, so put it
+        # back afterwards.
+        prev = _setActiveParser(self)
+        if prev is not self:
+            self._readToken = object()
+
+        try:
+            self._stateMachine (i)
+        finally:
+            _setActiveParser(prev)
+
+    def readKickstartFromIterable(self, lines, reset=True):
+        """Process a kickstart file, provided as an iterable of lines that
+           each keep their line ending, as from str.splitlines(True).  The
+           lines are read one at a time as they are needed, so the whole file
+           is never held in memory.  Reading stops at the end of lines or at
+           the first empty string.  Since the contents are not known ahead
+           of time, the parser's cache and prefetch settings are not used.
+        """
+        if reset:
+            self._reset()
 
-    def readKickstart(self, f, reset=True):
-        """Process a kickstart file, given by the filename f."""
+        self._readIterable(lines)
+
+    def readKickstartFromFile(self, f, reset=True):
+        """Process a kickstart file, provided as the file object f opened in
+           text mode.  The file is read a line at a time, the same way
+           readKickstartFromIterable reads its lines.
+        """
+        self.readKickstartFromIterable(f, reset=reset)
+
+    def _prefetchIncludes(self, s):
+        # Fetch every URL included by s, then every URL included by those, and
+        # so on.  Each round is fetched all at once.
+        prefetched = {}
+        seen = set()
+        pending = _urlsIn(s, "%include")
+
+        while pending:
+            seen.update(pending)
+            fetched = load_many(pending)
+            prefetched.update(fetched)
+
+            pending = []
+            for contents in fetched.values():
+                pending.extend(url for url in _urlsIn(contents, "%include")
+                               if url not in seen and url not in pending)
+
+        return prefetched
+
+    def readKickstart(self, f, reset=True, contents=None):
+        """Process a kickstart file, given by the filename f.  If the file has
+           already been loaded, its contents can be given so it is not loaded
+           again.
+        """
         if reset:
             self._reset()
 
@@ -755,12 +1312,29 @@ class KickstartParser(object):
             cd = os.path.abspath(cd)
         self.currentdir[self._includeDepth] = cd
 
+        recording = self._includeDepth > 0 and self._includes is not None
+
         try:
-            s = load_to_str(f)
+            if contents is not None:
+                s = contents
+            elif f in self._prefetched:
+                s = self._prefetched[f]
+            else:
+                s = load_to_str(f)
         except KickstartError as e:
+            if recording:
+                self._includes.append((f, None))
+
             raise KickstartError(formatErrorMsg(0, msg=_("Unable to open input kickstart file: %s") % str(e)))
 
-        self.readKickstartFromString(s, reset=False)
+        if recording:
+            self._includes.append((f, s))
+
+        self._files.append(f)
+        try:
+            self.readKickstartFromString(s, reset=False)
+        finally:
+            self._files.pop()
 
     def setupSections(self):
         """Install the sections all kickstart files support.  You may override
@@ -0,0 +1,137 @@
+#
+# Copyright 2016 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Declarative descriptions of data objects.
+
+Instead of setting every attribute in __init__, writing each one out in
+_getArgsAsStr, and adding an option for it in _getParser, and extending all
+three in every later version, a data class may list its attributes in a
+fields class attribute:
+
+    class F8_UserData(FC6_UserData):
+        fields = FC6_UserData.fields + (
+            Field("lock", False, opts=["--lock"], render=" --lock",
+                  action="store_true", default=False),
+        )
+
+BaseData reads the complete list to set up new objects with initFields and
+to write them out with renderFields, and gives the class a slot for every
+field.  The command that goes with the data class builds its option parser
+from the same list with buildParser.
+
+This module exports two classes:
+
+    Field - One attribute of a data object.
+
+    ParserOption - An option that only exists on the command line, such as
+                   one that sets the same attribute as another.
+
+It also exports these functions:
+
+    buildParser - Return a KSOptionParser for a list of fields.
+
+    initFields - Set the fields of a new data object.
+
+    renderFields - Return the fields of a data object as kickstart options.
+"""
+from copy import copy
+
+from pykickstart.options import KSOptionParser
+
+class Field(object):
+    def __init__(self, dest, initial=None, opts=None, render=None, join=None, **kwargs):
+        """Create a new Field instance.  Instance attributes:
+
+           dest    -- The name of the attribute on the data object.
+           initial -- What the attribute is set to when the data object is
+                      created without it.  Each object gets its own copy.
+           opts    -- A list of option strings for the option parser, or
+                      None if the attribute can't be given on the command
+                      line.
+           render  -- A format string for writing the attribute out when it
+                      is set to something true, or None to never write it.
+                      If it has no %s or %d in it, it is written as is.
+           join    -- If given, the value is a list and is joined with this
+                      string before it is formatted.
+
+           All other keyword arguments are passed to add_option.
+        """
+        self.dest = dest
+        self.initial = initial
+        self.opts = opts or []
+        self.render = render
+        self.join = join
+        self.kwargs = kwargs
+
+class ParserOption(object):
+    def __init__(self, *args, **kwargs):
+        """Create a new ParserOption instance.  The arguments are passed to
+           add_option as they are.
+        """
+        self.args = args
+        self.kwargs = kwargs
+
+def buildParser(fields, **kwargs):
+    """Return a new KSOptionParser with an option for every ParserOption and
+       every Field that has opts, in the order they are listed.  Any keyword
+       arguments are passed to KSOptionParser.
+    """
+    op = KSOptionParser(**kwargs)
+
+    for field in fields:
+        if isinstance(field, ParserOption):
+            op.add_option(*field.args, **field.kwargs)
+        elif field.opts:
+            op.add_option(*field.opts, dest=field.dest, **field.kwargs)
+
+    return op
+
+def initFields(obj, fields, kwargs):
+    """Set every field of obj from the keyword arguments it was created with,
+       or to a copy of its initial value.
+    """
+    for field in fields:
+        if isinstance(field, Field):
+            if field.dest in kwargs:
+                setattr(obj, field.dest, kwargs[field.dest])
+            else:
+                setattr(obj, field.dest, copy(field.initial))
+
+def renderFields(obj, fields):
+    """Return every field of obj with a render format that is set to
+       something true, in the order they are listed, as a string of kickstart
+       options.
+    """
+    chunks = []
+
+    for field in fields:
+        if not isinstance(field, Field) or field.render is None:
+            continue
+
+        value = getattr(obj, field.dest)
+        if not value:
+            continue
+
+        if "%" not in field.render:
+            chunks.append(field.render)
+        elif field.join is not None:
+            chunks.append(field.render % (field.join.join(value),))
+        else:
+            chunks.append(field.render % (value,))
+
+    return "".join(chunks)
@@ -32,7 +32,7 @@ parser.registerSection with an instance of your new class.
 from pykickstart.constants import KS_SCRIPT_PRE, KS_SCRIPT_POST, KS_SCRIPT_TRACEBACK, \
                                   KS_SCRIPT_PREINSTALL, KS_MISSING_IGNORE, KS_MISSING_PROMPT
 from pykickstart.errors import KickstartParseError, formatErrorMsg
-from pykickstart.options import KSOptionParser
+from pykickstart.options import KSOptionParser, sharedParser
 from pykickstart.version import FC4, F7, F9, F18, F21, F22
 
 from pykickstart.i18n import _
@@ -99,6 +99,13 @@ class Section(object):
         """
         self.timesSeen += 1
 
+    def reset(self):
+        """This method is called when the parser is asked to start over with a
+           fresh handler.  It should throw away anything collected from a
+           previous kickstart file.
+        """
+        self.timesSeen = 0
+
     @property
     def seen(self):
         """This property is given for consistency with KickstartCommand objects
@@ -128,6 +135,10 @@ class ScriptSection(Section):
         self._script = {}
         self._resetScript()
 
+    def reset(self):
+        Section.reset(self)
+        self._resetScript()
+
     def _getParser(self):
         op = KSOptionParser(self.version)
         op.add_option("--erroronfail", dest="errorOnFail", action="store_true",
@@ -144,7 +155,9 @@ class ScriptSection(Section):
         self._script["body"].append(line)
 
     def finalize(self):
-        if " ".join(self._script["body"]).strip() == "":
+        # Scripts with nothing but whitespace in them are thrown out.  This
+        # usually only has to look at the first line.
+        if not any(line.strip() for line in self._script["body"]):
             return
 
         kwargs = {"interp": self._script["interp"],
@@ -152,7 +165,8 @@ class ScriptSection(Section):
                   "lineno": self._script["lineno"],
                   "logfile": self._script["log"],
                   "errorOnFail": self._script["errorOnFail"],
-                  "type": self._script["type"]}
+                  "type": self._script["type"],
+                  "version": self.version}
 
         s = self.dataObj (self._script["body"], **kwargs)
         self._resetScript()
@@ -166,7 +180,7 @@ class ScriptSection(Section):
            This method may be overridden in a subclass if necessary.
         """
         Section.handleHeader(self, lineno, args)
-        op = self._getParser()
+        op = sharedParser(self.__class__, self.version, self._getParser)
 
         (opts, _extra) = op.parse_args(args=args[1:], lineno=lineno)
 
@@ -215,6 +229,14 @@ class TracebackScriptSection(ScriptSection):
 class PackageSection(Section):
     sectionOpen = "%packages"
 
+    def __init__(self, *args, **kwargs):
+        Section.__init__(self, *args, **kwargs)
+        self._lines = []
+
+    def reset(self):
+        Section.reset(self)
+        self._lines = []
+
     def handleLine(self, line):
         if not self.handler:
             return
@@ -222,14 +244,18 @@ class PackageSection(Section):
         h = line.partition('#')[0]
         line = h.rstrip()
 
-        self.handler.packages.add([line])
+        # Lines are collected here and handed to the Packages object in one
+        # batch once the end of the section is seen.
+        self._lines.append(line)
 
-    def handleHeader(self, lineno, args):
-        """Process the arguments to the %packages header and set attributes
-           on the Version's Packages instance appropriate.  This method may be
-           overridden in a subclass if necessary.
-        """
-        Section.handleHeader(self, lineno, args)
+    def finalize(self):
+        lines = self._lines
+        self._lines = []
+
+        if self.handler and lines:
+            self.handler.packages.add(lines)
+
+    def _getParser(self):
         op = KSOptionParser(version=self.version)
         op.add_option("--excludedocs", dest="excludedocs", action="store_true",
                       default=False)
@@ -249,7 +275,15 @@ class PackageSection(Section):
                       default=None, introduced=F9)
         op.add_option("--multilib", dest="multiLib", action="store_true",
                       default=False, introduced=F18)
+        return op
 
+    def handleHeader(self, lineno, args):
+        """Process the arguments to the %packages header and set attributes
+           on the Version's Packages instance appropriate.  This method may be
+           overridden in a subclass if necessary.
+        """
+        Section.handleHeader(self, lineno, args)
+        op = sharedParser(self.__class__, self.version, self._getParser)
         (opts, _extra) = op.parse_args(args=args[1:], lineno=lineno)
 
         if opts.defaultPackages and opts.nobase:
@@ -0,0 +1,50 @@
+#
+# Copyright 2016 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Encoding parsed kickstart files for other programs.
+
+This module exports functions to turn a handler into JSON or msgpack and back
+again, using the dicts made by BaseHandler.to_dict:
+
+    toJSON, fromJSON       - Compact JSON text.
+    toMsgpack, fromMsgpack - msgpack bytes.  These require the msgpack module,
+                             and raise ImportError if it is not installed.
+"""
+import json
+
+from pykickstart.base import BaseHandler
+
+def toJSON(handler):
+    """Return a compact JSON string describing handler."""
+    return json.dumps(handler.to_dict(), separators=(",", ":"), sort_keys=True)
+
+def fromJSON(s):
+    """Return a new handler from the JSON string s, as returned by toJSON."""
+    return BaseHandler.from_dict(json.loads(s))
+
+def toMsgpack(handler):
+    """Return msgpack bytes describing handler."""
+    import msgpack
+    return msgpack.packb(handler.to_dict(), use_bin_type=True)
+
+def fromMsgpack(data):
+    """Return a new handler from the msgpack bytes data, as returned by
+       toMsgpack.
+    """
+    import msgpack
+    return BaseHandler.from_dict(msgpack.unpackb(data, raw=False))
@@ -42,18 +42,20 @@ This module also exports several functions:
     versionFromFile - Read a kickstart file and determine the version of
                       syntax it uses.  This requires the kickstart file to
                       have a version= comment in it.
-"""
-import re, sys
 
-try:
-    from imputil import imp
-except ImportError: # Python 3
-    import imp
+    versionFromLines - The same as versionFromFile, but for lines that have
+                       already been read.
+
+    versionFromString - The same as versionFromFile, but for a kickstart
+                        file that has already been read into a string.
+"""
+import importlib
+import re
 
 from pykickstart.i18n import _
 
-from pykickstart.errors import KickstartVersionError
-from pykickstart.load import load_to_str
+from pykickstart.errors import KickstartError, KickstartVersionError
+from pykickstart.load import _is_url, load_to_str
 
 # Symbolic names for internal version numbers.
 RHEL3 = 900
@@ -148,23 +150,60 @@ def versionToString(version, skipDevel=False):
 
     raise KickstartVersionError(_("Unsupported version specified: %s") % version)
 
+def versionFromLines(lines):
+    """Given an iterable of the lines of a kickstart file, look for a line
+       starting with #version= and return the version number.  If no version
+       is found, return DEVEL.  Reading stops at the first version comment,
+       wherever in the file it is.
+    """
+    for line in lines:
+        if line[:9] == "#version=":
+            return stringToVersion(line[9:].rstrip())
+
+    return DEVEL
+
+def _iterLines(s):
+    # Generate the lines of s one at a time, without splitting all of it.
+    start = 0
+    length = len(s)
+
+    while start < length:
+        end = s.find("\n", start)
+        if end == -1:
+            end = length
+        else:
+            end += 1
+
+        yield s[start:end]
+        start = end
+
+def versionFromString(s):
+    """Given the contents of a kickstart file as the string s, look for a line
+       starting with #version= and return the version number.  If no version
+       is found, return DEVEL.  See versionFromLines.
+    """
+    return versionFromLines(_iterLines(s))
+
 def versionFromFile(f):
     """Given a file or URL, look for a line starting with #version= and
        return the version number.  If no version is found, return DEVEL.
+       A local file is read a line at a time, only up to the version
+       comment.  See versionFromLines.
     """
-    v = DEVEL
-
-    contents = load_to_str(f)
+    if _is_url(f):
+        return versionFromString(load_to_str(f))
 
-    for line in contents.splitlines(True):
-        if line.strip() == "":
-            continue
-
-        if line[:9] == "#version=":
-            v = stringToVersion(line[9:].rstrip())
-            break
+    try:
+        with open(f, "r") as fh:
+            return versionFromLines(fh)
+    except IOError as e:
+        raise KickstartError(_('Error opening file: %s') % str(e))
 
-    return v
+# A dict mapping version numbers to handler classes, filled in by
+# returnClassForVersion the first time each version is asked for.  The handler
+# for a version is always the class named <VERSION>Handler in the module
+# pykickstart.handlers.<version>, so only that one module needs to be imported.
+_handlerClasses = {}
 
 def returnClassForVersion(version=DEVEL):
     """Return the class of the syntax handler for version.  version can be
@@ -173,28 +212,23 @@ def returnClassForVersion(version=DEVEL):
     """
     try:
         version = int(version)
-        module = "%s" % versionToString(version, skipDevel=True)
     except ValueError:
-        module = "%s" % version
         version = stringToVersion(version)
 
-    module = module.lower()
+    try:
+        return _handlerClasses[version]
+    except KeyError:
+        pass
 
     try:
-        import pykickstart.handlers
-        sys.path.extend(pykickstart.handlers.__path__)
-        found = imp.find_module(module)
-        loaded = imp.load_module(module, found[0], found[1], found[2])
-
-        for (k, v) in list(loaded.__dict__.items()):
-            if k.lower().endswith("%shandler" % module):
-                return v
-    except:
-        found = None
+        name = versionToString(version, skipDevel=True)
+        module = importlib.import_module("pykickstart.handlers.%s" % name.lower())
+        cl = getattr(module, "%sHandler" % name)
+    except (ImportError, AttributeError, KickstartVersionError):
         raise KickstartVersionError(_("Unsupported version specified: %s") % version)
-    finally: # Closing opened files in imp.load_module
-        if found and len(found) > 0:
-            found[0].close()
+
+    _handlerClasses[version] = cl
+    return cl
 
 def makeVersion(version=DEVEL):
     """Return a new instance of the syntax handler for version.  version can be
@@ -0,0 +1,304 @@
+#
+# Copyright 2016 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use, modify,
+# copy, or redistribute it subject to the terms and conditions of the GNU
+# General Public License v.2.  This program is distributed in the hope that it
+# will be useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.  Any Red Hat
+# trademarks that are incorporated in the source code or documentation are not
+# subject to the GNU General Public License and may only be used or replicated
+# with the express permission of Red Hat, Inc.
+#
+"""
+Which commands and options exist in which kickstart syntax versions.
+
+Finding out what changed between two versions used to mean creating a
+handler for each and building the option parser of every command.  This
+module answers the same questions from a table that is worked out ahead of
+time and shipped as pykickstart._versionmatrix.  Run "make versionmatrix"
+to write it again after changing a command or a handler.
+
+This module exports two classes:
+
+    VersionMatrix - Every command and option, and the versions that have
+                    them or have deprecated them.
+
+    VersionDiff   - The commands and options that differ between two
+                    versions.
+
+It also exports these functions:
+
+    loadMatrix - Return the VersionMatrix shipped with pykickstart.
+
+    diffVersions - Return the VersionDiff between two versions, using the
+                   shipped VersionMatrix.
+
+    writeMatrix - Write a VersionMatrix out as a Python module.
+"""
+from pykickstart.errors import KickstartVersionError
+from pykickstart.version import returnClassForVersion, stringToVersion, versionMap, versionToString
+
+from pykickstart.i18n import _
+
+def _versionName(version):
+    # Return the name of version, which is either a string or a constant.
+    # DEVEL is turned into the name of the version it stands for.
+    try:
+        version = int(version)
+    except ValueError:
+        version = stringToVersion(version)
+
+    return versionToString(version, skipDevel=True)
+
+class VersionDiff(object):
+    def __init__(self, fromVersion, toVersion):
+        """Create a new VersionDiff instance.  Instance attributes:
+
+           fromVersion        -- The name of the older version.
+           toVersion          -- The name of the newer version.
+           addedCommands      -- A sorted list of the commands in toVersion
+                                 but not in fromVersion.
+           removedCommands    -- A sorted list of the commands in fromVersion
+                                 but not in toVersion.
+           deprecatedCommands -- A sorted list of the commands in both that
+                                 are deprecated in toVersion.
+           addedOptions       -- A dict mapping each command in both versions
+                                 to a sorted list of the options it gained.
+           removedOptions     -- The same, for the options it lost.
+           deprecatedOptions  -- The same, for the options that are
+                                 deprecated in toVersion.
+
+           Commands with nothing to list are left out of the three option
+           dicts.
+        """
+        self.fromVersion = fromVersion
+        self.toVersion = toVersion
+        self.addedCommands = []
+        self.removedCommands = []
+        self.deprecatedCommands = []
+        self.addedOptions = {}
+        self.removedOptions = {}
+        self.deprecatedOptions = {}
+
+    def to_dict(self):
+        """Return a dict of all the attributes of this diff, suitable for
+           encoding as JSON.
+        """
+        return dict(self.__dict__)
+
+class VersionMatrix(object):
+    def __init__(self, versions, commands):
+        """Create a new VersionMatrix instance.  Instance attributes:
+
+           versions -- A tuple of version names, oldest first.  Version i
+                       stands for the bit 1 << i in all the masks below.
+           commands -- A dict mapping each command name to a tuple of
+                       (present, deprecated, options).  present and
+                       deprecated are masks of the versions that have the
+                       command and that have deprecated it.  options maps
+                       each option string to a (present, deprecated) tuple
+                       of masks in the same way.
+
+           Most callers want loadMatrix instead of creating one of these.
+        """
+        self.versions = tuple(versions)
+        self.commands = commands
+
+        self._bits = dict((name, 1 << i) for (i, name) in enumerate(self.versions))
+
+    @classmethod
+    def fromHandlers(cls, versions=None):
+        """Return a new VersionMatrix worked out from the handler of each of
+           the given versions, or of every version pykickstart supports.
+           This builds every command and its option parser, so it is slow.
+        """
+        # Only building a matrix needs the commands themselves.
+        from pykickstart.base import DeprecatedCommand
+
+        if versions is None:
+            versions = [name for name in versionMap if name != "DEVEL"]
+
+        versions = sorted(set(_versionName(v) for v in versions), key=stringToVersion)
+        commands = {}
+
+        for (i, name) in enumerate(versions):
+            bit = 1 << i
+            number = stringToVersion(name)
+            handler = returnClassForVersion(number)()
+
+            for (cmdName, cmd) in handler.commands.items():
+                (present, deprecated, options) = commands.get(cmdName, (0, 0, {}))
+                present |= bit
+
+                if isinstance(cmd, DeprecatedCommand):
+                    deprecated |= bit
+
+                try:
+                    optionList = cmd.op.option_list
+                except AttributeError:
+                    optionList = []
+
+                for option in optionList:
+                    if option.introduced and option.introduced > number:
+                        continue
+                    elif option.removed and option.removed <= number:
+                        continue
+
+                    opt = option.get_opt_string()
+                    (optPresent, optDeprecated) = options.get(opt, (0, 0))
+                    optPresent |= bit
+
+                    if option.deprecated and number >= option.deprecated:
+                        optDeprecated |= bit
+
+                    options[opt] = (optPresent, optDeprecated)
+
+                commands[cmdName] = (present, deprecated, options)
+
+        return cls(versions, commands)
+
+    def _bit(self, version):
+        name = _versionName(version)
+
+        try:
+            return (name, self._bits[name])
+        except KeyError:
+            raise KickstartVersionError(_("Unsupported version specified: %s") % version)
+
+    def commandsIn(self, version):
+        """Return a sorted list of the commands in version."""
+        (_name, bit) = self._bit(version)
+        return sorted(cmd for (cmd, (present, _deprecated, _options)) in self.commands.items() if present & bit)
+
+    def optionsIn(self, version, command):
+        """Return a sorted list of the options command takes in version.  This
+           is empty if version does not have the command.
+        """
+        (_name, bit) = self._bit(version)
+
+        try:
+            options = self.commands[command][2]
+        except KeyError:
+            return []
+
+        return sorted(opt for (opt, (present, _deprecated)) in options.items() if present & bit)
+
+    def isDeprecated(self, version, command, option=None):
+        """Return whether command, or its option if one is given, is
+           deprecated in version.
+        """
+        (_name, bit) = self._bit(version)
+
+        try:
+            (_present, deprecated, options) = self.commands[command]
+            if option is not None:
+                (_present, deprecated) = options[option]
+        except KeyError:
+            return False
+
+        return bool(deprecated & bit)
+
+    def diff(self, fromVersion, toVersion):
+        """Return a VersionDiff of what changed going from fromVersion to
+           toVersion.
+        """
+        (fromName, fromBit) = self._bit(fromVersion)
+        (toName, toBit) = self._bit(toVersion)
+        d = VersionDiff(fromName, toName)
+
+        for (cmd, (present, deprecated, options)) in self.commands.items():
+            if not present & toBit:
+                if present & fromBit:
+                    d.removedCommands.append(cmd)
+                continue
+            elif not present & fromBit:
+                d.addedCommands.append(cmd)
+                continue
+
+            if deprecated & toBit:
+                d.deprecatedCommands.append(cmd)
+
+            added = []
+            removed = []
+            deprecatedOpts = []
+
+            for (opt, (optPresent, optDeprecated)) in options.items():
+                if optPresent & toBit:
+                    if not optPresent & fromBit:
+                        added.append(opt)
+                    if optDeprecated & toBit:
+                        deprecatedOpts.append(opt)
+                elif optPresent & fromBit:
+                    removed.append(opt)
+
+            if added:
+                d.addedOptions[cmd] = sorted(added)
+            if removed:
+                d.removedOptions[cmd] = sorted(removed)
+            if deprecatedOpts:
+                d.deprecatedOptions[cmd] = sorted(deprecatedOpts)
+
+        d.addedCommands.sort()
+        d.removedCommands.sort()
+        d.deprecatedCommands.sort()
+        return d
+
+    def diffAll(self):
+        """Return a dict mapping every (fromVersion, toVersion) pair of
+           version names, with fromVersion older than toVersion, to the
+           VersionDiff between them.
+        """
+        return dict(((f, t), self.diff(f, t))
+                    for (i, f) in enumerate(self.versions)
+                    for t in self.versions[i+1:])
+
+# The VersionMatrix shipped with pykickstart, loaded the first time it is
+# needed.  This is maintained by loadMatrix and no one else should be
+# touching it.
+_matrix = None
+
+def loadMatrix():
+    """Return the VersionMatrix shipped with pykickstart.  No handlers or
+       commands are created to answer questions with it.
+    """
+    global _matrix
+
+    if _matrix is None:
+        from pykickstart import _versionmatrix
+        _matrix = VersionMatrix(_versionmatrix.VERSIONS, _versionmatrix.COMMANDS)
+
+    return _matrix
+
+def diffVersions(fromVersion, toVersion):
+    """Return the VersionDiff between fromVersion and toVersion, which can be
+       either strings or version constants.  Raises KickstartVersionError if
+       either one is not supported.
+    """
+    return loadMatrix().diff(fromVersion, toVersion)
+
+def writeMatrix(f, matrix):
+    """Write matrix to the open file f as a Python module that defines the
+       VERSIONS and COMMANDS that loadMatrix expects.
+    """
+    f.write("# Generated by pykickstart.versionmatrix.writeMatrix.  Do not edit this\n")
+    f.write("# file.  Run \"make versionmatrix\" to write it again instead.\n")
+    f.write("# pylint: skip-file\n")
+    f.write("VERSIONS = (\n")
+    for name in matrix.versions:
+        f.write("    %r,\n" % name)
+    f.write(")\n\n")
+
+    f.write("COMMANDS = {\n")
+    for cmd in sorted(matrix.commands):
+        (present, deprecated, options) = matrix.commands[cmd]
+        f.write("    %r: (%#x, %#x, {\n" % (cmd, present, deprecated))
+        for opt in sorted(options):
+            f.write("        %r: (%#x, %#x),\n" % ((opt,) + options[opt]))
+        f.write("    }),\n")
+    f.write("}\n")
@@ -1,8 +1,14 @@
+import pickle
 import unittest
+import six
 from tests.baseclass import ParserTest
 
 from pykickstart.base import BaseData, BaseHandler, DeprecatedCommand, KickstartCommand
+from pykickstart.commands.upgrade import F11_Upgrade, F20_Upgrade
+from pykickstart.commands.zfcp import F12_ZFCPData
 from pykickstart.errors import KickstartParseError
+from pykickstart.parser import KickstartParser
+from pykickstart.version import DEVEL, F19, F20, F21, RHEL7, makeVersion, versionMap
 
 class BaseClasses_TestCase(ParserTest):
     def runTest(self):
@@ -17,6 +23,26 @@ class HandlerString_TestCase(ParserTest):
         self.handler.platform = "x86_64"
         self.assertIn("#platform=x86_64", str(self.handler))
 
+class HandlerWrite_TestCase(ParserTest):
+    def runTest(self):
+        self.parser.readKickstartFromString("""
+network --device=eth0 --bootproto=dhcp
+part / --size=1000
+part swap --recommended
+%post
+echo hello
+%end
+%packages
+vim
+%end
+""")
+        self.handler.platform = "x86_64"
+
+        f = six.StringIO()
+        self.handler.write(f)
+        self.assertEqual(f.getvalue(), str(self.handler))
+        self.assertIn("part swap --recommended\n", f.getvalue())
+
 class HandlerResetCommand_TestCase(ParserTest):
     def runTest(self):
         # fail - tried to reset a command that doesn't exist
@@ -39,6 +65,77 @@ class HandlerResetCommand_TestCase(ParserTest):
         self.assertEqual(self.handler.autopart.passphrase, "")
         self.assertNotIn("bogus", self.handler.autopart.__dict__)
 
+class HandlerLazyCommands_TestCase(ParserTest):
+    def runTest(self):
+        # Nothing is created until something asks for it.
+        self.assertEqual(self.handler._commandObjs, {})
+        self.assertIn("partition", self.handler.commands)
+        self.assertEqual(self.handler._commandObjs, {})
+
+        # Attribute access and lookup through the commands dict give the
+        # same object, and all aliases of a command share it.
+        part = self.handler.partition
+        self.assertIs(part, self.handler.commands["part"])
+        self.assertIs(part, self.handler.commands["partition"])
+        self.assertIs(part.handler, self.handler)
+        self.assertEqual(len(self.handler._commandObjs), 1)
+
+        self.assertRaises(AttributeError, getattr, self.handler, "fakecommand")
+
+        # Writing out the handler has to consider every command.
+        self.handler.dispatcher(["rootpw", "secret"], 1)
+        self.assertIn("rootpw --plaintext secret", str(self.handler))
+        self.assertEqual(len(self.handler._commandObjs),
+                         len(set(self.handler.commands.commandClass(c).__name__ for c in self.handler.commands)))
+
+class HandlerSharedAttrName_TestCase(unittest.TestCase):
+    def runTest(self):
+        # install and upgrade are handled by different classes that share the
+        # upgrade attribute.  It always belongs to the newer class, whichever
+        # command is created first.
+        for version in [F20, F21, RHEL7, DEVEL]:
+            handler = makeVersion(version)
+            parser = KickstartParser(handler)
+            parser.readKickstartFromString("install\nurl --url=http://x/\n")
+
+            self.assertIsInstance(handler.commands["install"], F11_Upgrade)
+            self.assertEqual(handler.upgrade.__class__, F20_Upgrade)
+            self.assertIs(handler.upgrade, handler.commands["upgrade"])
+
+        handler = makeVersion(F19)
+        handler.commands["install"]
+        self.assertEqual(handler.upgrade.__class__, F11_Upgrade)
+
+class HandlerReset_TestCase(ParserTest):
+    def runTest(self):
+        empty = str(self.handler)
+
+        self.handler.platform = "x86_64"
+        self.handler.dispatcher(["rootpw", "secret"], 1)
+        self.handler.dispatcher(["part", "/", "--size=100"], 2)
+        self.handler.packages.add(["vim"])
+        rootpw = self.handler.rootpw
+        partitions = self.handler.partition.partitions
+
+        self.handler.reset()
+
+        # Everything is created again, and nothing is left over.
+        self.assertEqual(self.handler._commandObjs, {})
+        self.assertIsNot(self.handler.rootpw, rootpw)
+        self.assertIs(self.handler.rootpw, self.handler.commands["rootpw"])
+        self.assertEqual(self.handler.rootpw.password, "")
+        self.assertEqual(self.handler.partition.partitions, [])
+        self.assertEqual(len(partitions), 1)
+        self.assertEqual(self.handler.packages.packageList, [])
+        self.assertEqual(str(self.handler), empty)
+
+        # Masked commands stay masked.
+        self.handler.maskAllExcept(["rootpw"])
+        self.handler.reset()
+        self.assertIsNone(self.handler.commands["part"])
+        self.handler.dispatcher(["rootpw", "secret"], 1)
+        self.assertEqual(self.handler.rootpw.password, "secret")
+
 class HandlerDispatch_TestCase(ParserTest):
     def runTest(self):
         # fail - no such command
@@ -68,5 +165,46 @@ class HandlerMask_TestCase(ParserTest):
         self.assertFalse(self.handler.autopart.encrypted)
         self.assertEqual(self.handler.autopart.passphrase, "")
 
+class DataSlots_TestCase(ParserTest):
+    def runTest(self):
+        # Everything a data object is created with lives in a slot, and
+        # there is no __dict__ to hold anything else.
+        lv = self.handler.LogVolData(name="root", vgname="vg0", mountpoint="/")
+        self.assertFalse(hasattr(lv, "__dict__"))
+        self.assertIn("vgname", lv._slotNames)
+        self.assertEqual(lv.vgname, "vg0")
+        self.assertRaises(AttributeError, setattr, lv, "bogus", True)
+
+        # Removed attributes are really gone.
+        zfcp = F12_ZFCPData(devnum="0.0.4000")
+        self.assertFalse(hasattr(zfcp, "scsiid"))
+        self.assertNotIn("scsiid", zfcp.to_dict())
+        zfcp(scsiid="0x0")
+        self.assertFalse(hasattr(zfcp, "scsiid"))
+        self.assertEqual(str(zfcp), "zfcp --devnum=0.0.4000\n")
+
+        copy = pickle.loads(pickle.dumps(lv, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(copy.to_dict(), lv.to_dict())
+        self.assertEqual(str(copy), str(lv))
+
+        # Subclasses that don't give slots of their own can still hold
+        # anything.
+        class MyLogVolData(self.handler.LogVolData):
+            pass
+
+        mine = MyLogVolData(name="root")
+        mine.bogus = True
+        self.assertEqual(mine.to_dict()["bogus"], True)
+        self.assertEqual(mine.to_dict()["name"], "root")
+
+class DataSlotsEverywhere_TestCase(unittest.TestCase):
+    def runTest(self):
+        # Every data class of every version declares its slots.
+        for version in sorted(set(versionMap.values())):
+            handler = makeVersion(version)
+
+            for dataClass in handler._dataNames:
+                self.assertFalse(hasattr(dataClass(), "__dict__"), dataClass.__name__)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,21 @@
+#
+# Helpers shared by the pykickstart benchmarks.  These are not unit tests and
+# are not run by "make test".  Run them with "make bench" instead.
+#
+import timeit
+
+def bench(fn, number=1, repeat=3):
+    """Return the best wall clock time, in seconds, of calling fn number times."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat))
+
+def scaling(title, setup, sizes, number=1, repeat=3):
+    """Time the callable returned by setup(n) for every n in sizes and print
+       the time per element, which should stay roughly flat for code that
+       scales linearly.
+    """
+    print(title)
+
+    for n in sizes:
+        fn = setup(n)
+        t = bench(fn, number=number, repeat=repeat) / number
+        print("  %8d: %10.4fs  %8.2fus/item" % (n, t, t * 1e6 / n))
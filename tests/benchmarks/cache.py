@@ -0,0 +1,25 @@
+#
+# Time parsing the same kickstart file over and over with and without a
+# ParseCache.
+#
+from tests.benchmarks import bench
+
+from pykickstart.cache import ParseCache
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+KS = "".join(["rootpw --plaintext secret\n",
+              "network --device=eth0 --bootproto=dhcp\n"] +
+             ["part /data%d --size=100\n" % i for i in range(200)] +
+             ["%post\n"] + ["echo %d\n" % i for i in range(1000)] + ["%end\n",
+              "%packages\n"] + ["package-%d\n" % i for i in range(1000)] + ["%end\n"])
+
+if __name__ == "__main__":
+    parser = KickstartParser(makeVersion())
+    cachedParser = KickstartParser(makeVersion(), cache=ParseCache())
+    cachedParser.parse(KS)
+
+    print("parsing the same kickstart file again")
+    old = bench(lambda: parser.parse(KS), number=20) / 20
+    new = bench(lambda: cachedParser.parse(KS), number=20) / 20
+    print("  uncached %8.4fs  cached %8.4fs  (%.1fx)" % (old, new, old / new))
@@ -0,0 +1,16 @@
+#
+# Time a fresh interpreter importing the parser and creating one handler.
+#
+import subprocess
+import sys
+
+from tests.benchmarks import bench
+
+CODE = "import pykickstart.parser; from pykickstart.version import makeVersion, F24; makeVersion(F24)"
+
+if __name__ == "__main__":
+    base = bench(lambda: subprocess.check_call([sys.executable, "-c", "pass"]), number=5) / 5
+    t = bench(lambda: subprocess.check_call([sys.executable, "-c", CODE]), number=5) / 5
+
+    print("cold start")
+    print("  %s: %10.4fs (interpreter startup %.4fs)" % ("makeVersion(F24)", t - base, base))
@@ -0,0 +1,35 @@
+#
+# Time creating a new handler, which is what every fresh parse has to pay for,
+# against reusing one parser and handler with KickstartParser.parse.
+#
+from tests.benchmarks import bench
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import DEVEL, RHEL6, makeVersion, versionToString
+
+KS = """
+rootpw secret
+part / --size=1000
+network --device=eth0 --bootproto=dhcp
+%packages
+vim
+%end
+"""
+
+def newParser(v):
+    KickstartParser(makeVersion(v)).readKickstartFromString(KS)
+
+if __name__ == "__main__":
+    print("handler construction")
+
+    for v in [DEVEL, RHEL6]:
+        t = bench(lambda: makeVersion(v), number=100) / 100
+        print("  %8s: %10.6fs" % (versionToString(v), t))
+
+    print("parsing a small kickstart, new handler vs. parse(fresh=True)")
+
+    for v in [DEVEL, RHEL6]:
+        parser = KickstartParser(makeVersion(v))
+        old = bench(lambda: newParser(v), number=100) / 100
+        new = bench(lambda: parser.parse(KS), number=100) / 100
+        print("  %8s: %10.6fs  %10.6fs  (%.1fx)" % (versionToString(v), old, new, old / new))
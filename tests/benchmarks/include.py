@@ -0,0 +1,54 @@
+#
+# Time parsing a kickstart file that brings in fragments with %include from a
+# slow local web server, fetching them one at a time or all at once.
+#
+import threading
+import time
+
+import six
+
+from tests.benchmarks import bench
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+LATENCY = 0.02
+FRAGMENTS = 20
+
+class Handler(six.moves.BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        body = ("network --device=eth%s --bootproto=dhcp\n" % self.path[1:-len(".ks")]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class Server(six.moves.socketserver.ThreadingMixIn, six.moves.BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+def run(ks, prefetch):
+    parser = KickstartParser(makeVersion(), prefetch=prefetch)
+    parser.readKickstartFromString(ks)
+
+if __name__ == "__main__":
+    server = Server(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    ks = "".join("%%include http://127.0.0.1:%d/%d.ks\n" % (server.server_port, i)
+                 for i in range(FRAGMENTS))
+
+    print("%d %%include URLs, %dms each" % (FRAGMENTS, LATENCY * 1000))
+    serial = bench(lambda: run(ks, False))
+    print("  %10s: %8.4fs" % ("serial", serial))
+    t = bench(lambda: run(ks, True))
+    print("  %10s: %8.4fs  (%.1fx)" % ("prefetch", t, serial / t))
+
+    server.shutdown()
@@ -0,0 +1,36 @@
+#
+# Compare preprocessing a kickstart file through a temporary file against
+# preprocessing it in memory.
+#
+import os
+import tempfile
+
+from tests.benchmarks import bench
+
+from pykickstart.parser import KickstartParser, preprocessFromString, preprocessFromStringToString
+from pykickstart.version import makeVersion
+
+def viaTempFile(ks):
+    parser = KickstartParser(makeVersion())
+    path = preprocessFromString(ks)
+    parser.readKickstart(path)
+    os.unlink(path)
+
+def inMemory(ks):
+    parser = KickstartParser(makeVersion())
+    parser.readKickstartFromString(preprocessFromStringToString(ks))
+
+if __name__ == "__main__":
+    (handle, appendPath) = tempfile.mkstemp(prefix="ksappend-", text=True)
+    os.write(handle, b"".join(b"# appended line %d\n" % i for i in range(100)))
+    os.close(handle)
+
+    ks = "".join("%%ksappend %s\n" % appendPath if i % 200 == 0 else "# comment %d\n" % i
+                 for i in range(2000))
+
+    print("preprocessing 2000 lines with 10 %ksappend lines")
+    old = bench(lambda: viaTempFile(ks), number=10)
+    new = bench(lambda: inMemory(ks), number=10)
+    print("  temp file %8.4fs  in memory %8.4fs  (%.1fx)" % (old, new, old / new))
+
+    os.unlink(appendPath)
@@ -0,0 +1,40 @@
+#
+# Measure the memory held by a parsed kickstart file with a growing number of
+# storage, network, and user lines.  Nearly all of it is data objects.
+#
+import gc
+import tracemalloc
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+def kickstart(n):
+    lines = ["volgroup vg%d --pesize=4096 pv.%d\n" % (i, i) for i in range(n)]
+    lines += ["logvol /lv%d --vgname=vg%d --name=lv%d --size=100 --fstype=xfs\n" % (i, i, i) for i in range(n)]
+    lines += ["part pv.%d --size=1000 --ondisk=sda\n" % i for i in range(n)]
+    lines += ["network --device=eth%d --bootproto=dhcp\n" % i for i in range(n)]
+    lines += ["user --name=user%d --groups=wheel\n" % i for i in range(n)]
+    return "".join(lines)
+
+def measure(n):
+    ks = kickstart(n)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    parser = KickstartParser(makeVersion())
+    parser.readKickstartFromString(ks)
+    handler = parser.handler
+    del parser
+    gc.collect()
+
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return (handler, size)
+
+if __name__ == "__main__":
+    print("memory held by a parsed kickstart file")
+
+    for n in [1000, 10000]:
+        (_handler, size) = measure(n)
+        print("  %8d: %10.1fKiB  %8.1fB/object" % (n, size / 1024.0, size / (n * 5.0)))
@@ -0,0 +1,43 @@
+#
+# Time parsing the options of commands with long option tables, which is where
+# checking every option on every line used to add up, and copying the results
+# onto data objects.
+#
+from tests.benchmarks import bench
+
+from pykickstart.version import makeVersion
+
+LINES = [
+    ["part", "/home", "--fstype=ext4", "--size=10000", "--grow", "--ondisk=sda"],
+    ["logvol", "/var", "--vgname=vg0", "--name=var", "--size=2000"],
+    ["network", "--device=eth0", "--bootproto=dhcp", "--onboot=yes"],
+    ["bootloader", "--location=mbr", "--append=quiet"],
+    ["raid", "/", "--level=1", "--device=md0", "raid.01", "raid.02"],
+]
+
+DATA = {
+    "logvol": "LogVolData",
+    "network": "NetworkData",
+    "raid": "RaidData",
+}
+
+if __name__ == "__main__":
+    handler = makeVersion()
+    print("option parsing, 10000 lines")
+
+    for args in LINES:
+        op = handler.commands[args[0]].op
+        t = bench(lambda: [op.parse_args(args=args[1:], lineno=1) for _i in range(10000)])
+        print("  %10s: %8.4fs  %6.2fus/line  (%d options)" % (args[0], t, t * 1e2, len(op.option_list)))
+
+    print("copying options to data objects, 10000 lines")
+
+    for args in LINES:
+        if args[0] not in DATA:
+            continue
+
+        cmd = handler.commands[args[0]]
+        (opts, _extra) = cmd.op.parse_args(args=args[1:], lineno=1)
+        obj = getattr(handler, DATA[args[0]])()
+        t = bench(lambda: [cmd._setToObj(cmd.op, opts, obj) for _i in range(10000)])
+        print("  %10s: %8.4fs  %6.2fus/line  (%d keys)" % (args[0], t, t * 1e2, len(cmd.op.keys())))
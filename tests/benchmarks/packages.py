@@ -0,0 +1,21 @@
+#
+# Time parsing a %packages section with a growing number of package lines.
+#
+from tests.benchmarks import scaling
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+def setup(n):
+    lines = ["package-%d\n" % i for i in range(n)]
+    lines += ["-package-%d\n" % i for i in range(0, n, 10)]
+    ks = "%packages\n" + "".join(lines) + "%end\n"
+
+    def run():
+        parser = KickstartParser(makeVersion())
+        parser.readKickstartFromString(ks)
+
+    return run
+
+if __name__ == "__main__":
+    scaling("%packages section parsing", setup, [1000, 10000, 100000])
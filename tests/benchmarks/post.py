@@ -0,0 +1,27 @@
+#
+# Time parsing a %post script with a growing number of lines, which the parser
+# has to look at one by one to find the end of the section.
+#
+from tests.benchmarks import scaling
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+def setup(n):
+    lines = []
+    for i in range(n // 4):
+        lines.append("echo line %d >> /root/post.log\n" % i)
+        lines.append("    %s\n" % ("QUJDRA==" * 10))
+        lines.append("# comment %d\n" % i)
+        lines.append("%%wheel%d ALL=(ALL) ALL\n" % i)
+
+    ks = "%post\n" + "".join(lines) + "%end\n"
+
+    def run():
+        parser = KickstartParser(makeVersion())
+        parser.readKickstartFromString(ks)
+
+    return run
+
+if __name__ == "__main__":
+    scaling("%post section parsing", setup, [1000, 10000, 100000])
@@ -0,0 +1,22 @@
+#
+# Time writing out a handler with a growing number of packages and partitions.
+#
+from tests.benchmarks import scaling
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+def setup(n):
+    lines = ["part /data%d --size=100 --fstype=xfs\n" % i for i in range(n // 10)]
+    lines += ["%packages\n"] + ["package-%d\n" % i for i in range(n, 0, -1)] + ["%end\n"]
+
+    parser = KickstartParser(makeVersion())
+    handler = parser.parse("".join(lines))
+
+    def run():
+        str(handler)
+
+    return run
+
+if __name__ == "__main__":
+    scaling("writing out packages and partitions", setup, [1000, 10000, 100000])
@@ -0,0 +1,23 @@
+#
+# Time creating and writing out data objects whose attributes are declared as
+# fields, rather than set and written out by every earlier version in turn.
+#
+from tests.benchmarks import bench
+
+from pykickstart.commands.user import F19_UserData
+from pykickstart.version import makeVersion
+
+if __name__ == "__main__":
+    print("user data, 100000 objects")
+
+    t = bench(lambda: [F19_UserData(name="bob", groups=["wheel"], uid=1000) for _i in range(100000)])
+    print("  %10s: %8.4fs" % ("create", t))
+
+    user = F19_UserData(name="bob", groups=["wheel"], uid=1000, gid=1000, gecos="Bob", lock=True)
+    t = bench(lambda: [str(user) for _i in range(100000)])
+    print("  %10s: %8.4fs" % ("write", t))
+
+    handler = makeVersion()
+    t = bench(lambda: [handler.commands["user"].parse(["--name=bob", "--groups=wheel,adm", "--uid=1000", "--lock"])
+                       for _i in range(10000)])
+    print("  %10s: %8.4fs  (10000 lines)" % ("parse", t))
@@ -0,0 +1,43 @@
+#
+# Time and measure the peak memory of parsing and then writing out a
+# kickstart file with a 10MiB %post section.
+#
+import gc
+import time
+import tracemalloc
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+def kickstart(mb):
+    payload = "echo " + "QUJDREVGR0hJSktMTU5PUFFSU1RVVldYWVo=" * 2 + "\n"
+    lines = ["rootpw secret\n", "%post\n"]
+    lines += [payload] * (mb * 1024 * 1024 // len(payload))
+    lines += ["%end\n"]
+    return "".join(lines)
+
+def measure(fn):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    fn()
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (elapsed, peak)
+
+if __name__ == "__main__":
+    ks = kickstart(10)
+    state = {}
+
+    def parse():
+        state["parser"] = KickstartParser(makeVersion())
+        state["parser"].readKickstartFromString(ks)
+
+    def write():
+        str(state["parser"].handler)
+
+    print("10MiB %post section")
+    for (name, fn) in [("parse", parse), ("write", write)]:
+        (elapsed, peak) = measure(fn)
+        print("  %8s: %8.4fs  %8.1fMiB peak" % (name, elapsed, peak / 1048576.0))
@@ -0,0 +1,35 @@
+#
+# Compare handing a parsed kickstart file to another program as text, which
+# has to be parsed again, against handing it over as JSON or msgpack.
+#
+from tests.benchmarks import bench
+
+from pykickstart.parser import KickstartParser
+from pykickstart.serialize import fromJSON, fromMsgpack, toJSON, toMsgpack
+from pykickstart.version import makeVersion
+
+KS = "".join(["rootpw --plaintext secret\n",
+              "network --device=eth0 --bootproto=dhcp\n"] +
+             ["part /data%d --size=100\n" % i for i in range(200)] +
+             ["%post\n"] + ["echo %d\n" % i for i in range(1000)] + ["%end\n",
+              "%packages\n"] + ["package-%d\n" % i for i in range(1000)] + ["%end\n"])
+
+def viaText(handler):
+    KickstartParser(makeVersion()).readKickstartFromString(str(handler))
+
+if __name__ == "__main__":
+    parser = KickstartParser(makeVersion())
+    handler = parser.parse(KS)
+
+    print("round trip of a parsed kickstart file")
+    text = bench(lambda: viaText(handler), number=10) / 10
+    print("  %8s: %8.4fs" % ("text", text))
+
+    t = bench(lambda: fromJSON(toJSON(handler)), number=10) / 10
+    print("  %8s: %8.4fs  (%.1fx)" % ("json", t, text / t))
+
+    try:
+        t = bench(lambda: fromMsgpack(toMsgpack(handler)), number=10) / 10
+        print("  %8s: %8.4fs  (%.1fx)" % ("msgpack", t, text / t))
+    except ImportError:
+        print("  %8s: not installed" % "msgpack")
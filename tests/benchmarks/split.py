@@ -0,0 +1,22 @@
+#
+# Compare splitting kickstart lines with shlex against the parser's own
+# tokenizer.
+#
+import shlex
+
+from tests.benchmarks import bench
+
+from pykickstart.parser import _splitLine
+
+LINES = {
+    "plain": "part /home --fstype=ext4 --size=10000 --grow --ondisk=sda\n",
+    "quoted": "user --name=bob --gecos=\"Bob \\\"The\\\" Smith\" --password='se cret' # comment\n",
+}
+
+if __name__ == "__main__":
+    print("line splitting, 10000 lines")
+
+    for (name, line) in sorted(LINES.items()):
+        old = bench(lambda: [shlex.split(line, comments=True) for _i in range(10000)])
+        new = bench(lambda: [_splitLine(line, comments=True) for _i in range(10000)])
+        print("  %8s: shlex %8.4fs  _splitLine %8.4fs  (%.1fx)" % (name, old, new, old / new))
@@ -0,0 +1,27 @@
+#
+# Time parsing storage layouts with a growing number of part, raid, volgroup
+# and logvol lines, all of which are checked for duplicates.
+#
+from tests.benchmarks import scaling
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+def setup(n):
+    lines = []
+    for i in range(n // 4):
+        lines.append("part /data%d --size=100\n" % i)
+        lines.append("raid /raid%d --device=md%d --level=1 raid.%d raid.%d\n" % (i, i, i, i + 1))
+        lines.append("volgroup vg%d pv.%d\n" % (i, i))
+        lines.append("logvol /lv%d --vgname=vg%d --name=lv%d --size=100\n" % (i, i, i))
+
+    ks = "".join(lines)
+
+    def run():
+        parser = KickstartParser(makeVersion())
+        parser.readKickstartFromString(ks)
+
+    return run
+
+if __name__ == "__main__":
+    scaling("storage layout parsing", setup, [1000, 4000, 16000])
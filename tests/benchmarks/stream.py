@@ -0,0 +1,55 @@
+#
+# Compare the peak memory and time of parsing a large kickstart file read
+# into a string against reading it a line at a time from a file.
+#
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+def kickstart(mb):
+    # Mostly one big %post, like a script carrying a base64 payload, followed
+    # by some ordinary commands.
+    payload = "echo " + "QUJDREVGR0hJSktMTU5PUFFSU1RVVldYWVo=" * 2 + "\n"
+    lines = ["rootpw secret\n", "%post\n"]
+    lines += [payload] * (mb * 1024 * 1024 // len(payload))
+    lines += ["%end\n"]
+    lines += ["part /data%d --size=100\n" % i for i in range(1000)]
+    return "".join(lines)
+
+def measure(fn):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    fn()
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (elapsed, peak)
+
+def fromString(path):
+    with open(path) as f:
+        s = f.read()
+
+    KickstartParser(makeVersion()).readKickstartFromString(s)
+
+def fromFile(path):
+    with open(path) as f:
+        KickstartParser(makeVersion()).readKickstartFromFile(f)
+
+if __name__ == "__main__":
+    (fd, path) = tempfile.mkstemp(prefix="ks-", suffix=".cfg")
+    with os.fdopen(fd, "w") as f:
+        f.write(kickstart(10))
+
+    print("parsing a %.1fMiB kickstart file with a 10MiB %%post" % (os.path.getsize(path) / 1048576.0))
+
+    for (name, fn) in [("string", fromString), ("file", fromFile)]:
+        (elapsed, peak) = measure(lambda: fn(path))
+        print("  %8s: %8.4fs  %8.1fMiB peak" % (name, elapsed, peak / 1048576.0))
+
+    os.unlink(path)
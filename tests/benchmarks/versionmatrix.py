@@ -0,0 +1,38 @@
+#
+# Time finding out what changed between two kickstart syntax versions in a
+# fresh interpreter, by building both handlers and every option parser as
+# ksverdiff used to, and by using the shipped version matrix.
+#
+import subprocess
+import sys
+
+from tests.benchmarks import bench
+
+from pykickstart.versionmatrix import diffVersions, loadMatrix
+
+HANDLERS = """
+from pykickstart.version import makeVersion
+handlers = [makeVersion("FC3"), makeVersion("F24")]
+for h in handlers:
+    for cmd in h.commands.values():
+        getattr(cmd, "op", None)
+"""
+
+MATRIX = "from pykickstart.versionmatrix import diffVersions; diffVersions('FC3', 'F24')"
+
+if __name__ == "__main__":
+    base = bench(lambda: subprocess.check_call([sys.executable, "-c", "pass"]), number=5) / 5
+
+    print("FC3 to F24, cold")
+
+    for (name, code) in [("handlers", HANDLERS), ("matrix", MATRIX)]:
+        t = bench(lambda: subprocess.check_call([sys.executable, "-c", code]), number=5) / 5
+        print("  %10s: %8.4fs" % (name, t - base))
+
+    print("warm")
+
+    t = bench(lambda: diffVersions("FC3", "F24"), number=100) / 100
+    print("  %10s: %8.6fs" % ("one pair", t))
+
+    t = bench(loadMatrix().diffAll)
+    print("  %10s: %8.4fs  (%d pairs)" % ("all pairs", t, len(loadMatrix().diffAll())))
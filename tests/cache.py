@@ -0,0 +1,242 @@
+import json
+import os
+import shutil
+import six
+import tempfile
+import threading
+import unittest
+import warnings
+
+from pykickstart import load
+from pykickstart.cache import ParseCache, URLCache
+from pykickstart.load import load_to_str
+from pykickstart.parser import KickstartParser
+from pykickstart.version import DEVEL, F20, makeVersion
+
+class Base_Cache(unittest.TestCase):
+    ks = """
+rootpw --plaintext secret
+part / --size=1000
+part /home --size=1000 --grow
+network --device=eth0 --bootproto=dhcp
+%post
+echo hello
+%end
+%packages
+@core
+vim
+-nano
+%end
+"""
+
+    def setUp(self):
+        self.cache = ParseCache(maxsize=2)
+
+    def _parser(self, version=DEVEL, **kwargs):
+        return KickstartParser(makeVersion(version), cache=self.cache, **kwargs)
+
+class Cache_Hit_TestCase(Base_Cache):
+    def runTest(self):
+        expected = self._parser().parse(self.ks)
+
+        parser = self._parser()
+        handler = parser.handler
+        parser.readKickstartFromString(self.ks)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+        # The parser's own handler is filled in, and everything in it knows
+        # which handler it belongs to.
+        self.assertIs(parser.handler, handler)
+        self.assertIs(handler.rootpw.handler, handler)
+        self.assertIs(handler.commands["part"], handler.partition)
+        self.assertEqual(str(handler), str(expected))
+        self.assertEqual([p.mountpoint for p in handler.partition.partitions], ["/", "/home"])
+        self.assertEqual(handler.packages.packageList, ["vim"])
+        self.assertEqual(handler.scripts[0].script, "echo hello\n")
+
+        # Changing the result doesn't change what's in the cache.
+        handler.rootpw.password = "changed"
+        handler.partition.partitions.pop()
+        parser.readKickstartFromString(self.ks)
+        self.assertEqual(self.cache.hits, 2)
+        self.assertEqual(handler.rootpw.password, "secret")
+        self.assertEqual(len(handler.partition.partitions), 2)
+
+        # A duplicate after a cache hit is still noticed.
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            parser.readKickstartFromString("part / --size=1000\npart / --size=1000\n")
+            self.assertEqual(len(w), 1)
+
+class Cache_Key_TestCase(Base_Cache):
+    def runTest(self):
+        self._parser().parse(self.ks)
+        self._parser().parse(self.ks + "\n")
+        self._parser(F20).parse(self.ks)
+        self._parser(unknownSectionIsFatal=False).parse(self.ks)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 4)
+
+        # Only the two most recently used results are kept.
+        self.assertEqual(len(self.cache), 2)
+
+        # Parsers that don't stop on errors aren't cached at all.
+        self._parser(errorsAreFatal=False).parse(self.ks)
+        self._parser(errorsAreFatal=False).parse(self.ks)
+        self.assertEqual(self.cache.hits + self.cache.misses, 4)
+
+class Cache_Warnings_TestCase(Base_Cache):
+    ks = """
+network --device=eth0
+network --device=eth0
+"""
+
+    def runTest(self):
+        for _i in range(2):
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                self._parser().parse(self.ks)
+                self.assertEqual(len(w), 1)
+                self.assertIn("eth0 has already been defined", str(w[0].message))
+
+        self.assertEqual(self.cache.hits, 1)
+
+class Cache_Include_TestCase(Base_Cache):
+    def setUp(self):
+        Base_Cache.setUp(self)
+        (handle, self._path) = tempfile.mkstemp(prefix="include-", text=True)
+        os.close(handle)
+        self._write("rootpw one\n")
+
+    def tearDown(self):
+        os.unlink(self._path)
+
+    def _write(self, s):
+        with open(self._path, "w") as f:
+            f.write(s)
+
+    def runTest(self):
+        ks = "%%include %s\n" % self._path
+
+        self.assertEqual(self._parser().parse(ks).rootpw.password, "one")
+        self.assertEqual(self._parser().parse(ks).rootpw.password, "one")
+        self.assertEqual(self.cache.hits, 1)
+
+        # Changing the included file means parsing everything again.
+        self._write("rootpw two\n")
+        self.assertEqual(self._parser().parse(ks).rootpw.password, "two")
+        self.assertEqual(self.cache.misses, 2)
+
+class Cache_Disk_TestCase(Base_Cache):
+    def setUp(self):
+        Base_Cache.setUp(self)
+        self._dir = tempfile.mkdtemp(prefix="kscache-")
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def runTest(self):
+        self.cache = ParseCache(directory=self._dir)
+        expected = str(self._parser().parse(self.ks))
+        self.assertEqual(len(os.listdir(self._dir)), 1)
+
+        # A new cache using the same directory picks up the result.
+        self.cache = ParseCache(directory=self._dir)
+        self.assertEqual(str(self._parser().parse(self.ks)), expected)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 0)
+
+        # A directory anyone can write to is never read from.
+        os.chmod(self._dir, 0o777)
+        self.cache = ParseCache(directory=self._dir)
+        self.assertEqual(str(self._parser().parse(self.ks)), expected)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 1)
+
+class _ETagHandler(six.moves.BaseHTTPServer.BaseHTTPRequestHandler):
+    # Serves server.files, a dict mapping paths to contents, with the hash of
+    # the contents as the ETag.  Every response's path and status are kept in
+    # server.responses.
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.server.files[self.path].encode("utf-8")
+        etag = '"%s"' % hash(body)
+
+        if self.headers.get("If-None-Match") == etag:
+            self.server.responses.append((self.path, 304))
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.server.responses.append((self.path, 200))
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class _Server(six.moves.socketserver.ThreadingMixIn, six.moves.BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+class URLCache_TestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self._server = _Server(("127.0.0.1", 0), _ETagHandler)
+        self._server.files = {"/a.ks": "rootpw secret\n", "/b.ks": "text\n"}
+        self._server.responses = []
+        self._url = "http://127.0.0.1:%d" % self._server.server_port
+
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def tearDown(self):
+        load.URL_CACHE = None
+        self._server.shutdown()
+        self._server.server_close()
+        shutil.rmtree(self._tmpdir)
+
+    def runTest(self):
+        responses = self._server.responses
+
+        # With no ttl, the server is asked every time, and only sends the
+        # file again once it has changed.
+        load.URL_CACHE = URLCache(self._tmpdir, ttl=0)
+        self.assertEqual(load_to_str(self._url + "/a.ks"), "rootpw secret\n")
+        self.assertEqual(load_to_str(self._url + "/a.ks"), "rootpw secret\n")
+        self._server.files["/a.ks"] = "rootpw changed\n"
+        self.assertEqual(load_to_str(self._url + "/a.ks"), "rootpw changed\n")
+        self.assertEqual(responses, [("/a.ks", 200), ("/a.ks", 304), ("/a.ks", 200)])
+
+        # Within the ttl, the server isn't asked at all.
+        del responses[:]
+        load.URL_CACHE = URLCache(self._tmpdir, ttl=3600)
+        self.assertEqual(load_to_str(self._url + "/a.ks"), "rootpw changed\n")
+        self.assertEqual(responses, [])
+
+        # Once the cache is too big, the least recently used file goes.
+        load.URL_CACHE = URLCache(self._tmpdir, ttl=3600, maxsize=1)
+        load_to_str(self._url + "/b.ks")
+        self.assertIsNone(load.URL_CACHE.get(self._url + "/a.ks"))
+        self.assertEqual(len(os.listdir(self._tmpdir)), 0)
+
+        load.URL_CACHE.maxsize = 64 * 1024
+        load_to_str(self._url + "/a.ks")
+        load_to_str(self._url + "/b.ks")
+        self.assertEqual(len(os.listdir(self._tmpdir)), 2)
+        load.URL_CACHE.clear()
+        self.assertEqual(os.listdir(self._tmpdir), [])
+
+        # Entries are plain JSON, not anything that could be run.
+        load_to_str(self._url + "/b.ks")
+        with open(os.path.join(self._tmpdir, os.listdir(self._tmpdir)[0])) as f:
+            self.assertEqual(json.load(f)["contents"], "text\n")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -162,6 +162,12 @@ class F19_TestCase(F18_TestCase):
         self.assert_parse_error("liveimg --noverifyssl", KickstartValueError)
         self.assert_parse_error("liveimg --checksum=e7a9fe500330a1cae4ca114833bb3df014e6d14e63ea9566896a848f3832d0ba", KickstartValueError)
 
+        # The option parser is the one of whichever method was seen.
+        handler = self.handler()
+        self.assertIs(handler.method.op, handler.url.op)
+        handler.liveimg.seen = True
+        self.assertIs(handler.method.op, handler.liveimg.op)
+
 
 if __name__ == "__main__":
     unittest.main()
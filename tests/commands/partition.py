@@ -19,7 +19,7 @@
 #
 
 import unittest
-from tests.baseclass import CommandTest
+from tests.baseclass import CommandSequenceTest, CommandTest
 
 from pykickstart.errors import KickstartParseError, KickstartValueError
 
@@ -253,5 +253,49 @@ class F23_TestCase(F18_TestCase):
 
 RHEL7_TestCase = F23_TestCase
 
+class FC3_Duplicate_TestCase(CommandSequenceTest):
+    def runTest(self):
+        self.assert_parse("""
+part / --size=1024
+part /home --size=1024
+part swap --size=1024
+part swap --size=1024""")
+
+        self.assert_parse_error("""
+part / --size=1024
+part /home --size=1024
+part / --size=1024""", UserWarning, "mountpoint / has already")
+
+        # Duplicates are still found after the list is changed by hand.
+        parser = self.get_parser()
+        parser.readKickstartFromString("part /boot --size=512")
+        partitions = parser.handler.partition.partitions
+        partitions.remove(partitions[0])
+        partitions.append(parser.handler.PartData(mountpoint="/var"))
+        parser.readKickstartFromString("part /boot --size=512")
+        self.assertRaises(UserWarning, parser.readKickstartFromString, "part /var --size=1024")
+
+        parser.handler.partition.partitions = []
+        parser.readKickstartFromString("part /var --size=1024")
+        self.assertEqual(len(parser.handler.partition.partitions), 1)
+
+        # Or after an object already in the list is changed, or replaced in
+        # the middle of the list.
+        parser = self.get_parser()
+        parser.readKickstartFromString("part /a --size=512\npart /b --size=512\npart /c --size=512")
+        partitions = parser.handler.partition.partitions
+        partitions[0].mountpoint = "/d"
+        self.assertRaises(UserWarning, parser.readKickstartFromString, "part /d --size=1024", reset=False)
+
+        partitions[1] = parser.handler.PartData(mountpoint="/e")
+        parser.readKickstartFromString("part /b --size=1024", reset=False)
+        self.assertRaises(UserWarning, parser.readKickstartFromString, "part /e --size=1024", reset=False)
+
+        # Commands run without a parser are checked the same way.
+        handler = parser.handler
+        handler.partition.partitions[2].mountpoint = "/f"
+        self.assertRaises(UserWarning, handler.dispatcher, ["part", "/f", "--size=1024"], 1)
+        handler.dispatcher(["part", "/c", "--size=1024"], 1)
+
 if __name__ == "__main__":
     unittest.main()
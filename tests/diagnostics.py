@@ -0,0 +1,126 @@
+import os
+import six
+import sys
+import tempfile
+import unittest
+import warnings
+
+from pykickstart import diagnostics
+from pykickstart.cache import ParseCache
+from pykickstart.diagnostics import ERROR, WARNING, Diagnostics
+from pykickstart.errors import KickstartParseError
+from pykickstart.parser import KickstartParser
+from pykickstart.version import makeVersion
+
+class Base_Diagnostics(unittest.TestCase):
+    ks = """rootpw --bogus secret
+part / --size=abc
+user --name=a
+user --name=a
+zerombr foo
+%frobnicate
+%end
+"""
+
+    def setUp(self):
+        self.diagnostics = Diagnostics()
+
+    def _parse(self, s, **kwargs):
+        kwargs.setdefault("errorsAreFatal", False)
+        kwargs.setdefault("unknownSectionIsFatal", False)
+        parser = KickstartParser(makeVersion(), diagnostics=self.diagnostics, **kwargs)
+
+        stdout = sys.stdout
+        sys.stdout = six.StringIO()
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                parser.readKickstartFromString(s)
+            printed = sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+
+        # Nothing goes to the screen or the warnings module.
+        self.assertEqual(printed, "")
+        self.assertEqual(caught, [])
+        return parser
+
+class Diagnostics_OnePass_TestCase(Base_Diagnostics):
+    def runTest(self):
+        parser = self._parse(self.ks)
+        self.assertIs(parser.diagnostics, self.diagnostics)
+
+        found = [(d.severity, d.code, d.lineno, d.command) for d in self.diagnostics]
+        self.assertEqual(found, [(ERROR, "parse-error", 1, "rootpw"),
+                                 (ERROR, "parse-error", 2, "part"),
+                                 (WARNING, "duplicate", 4, "user"),
+                                 (ERROR, "parse-error", 5, "zerombr"),
+                                 (WARNING, "unknown-section", 6, "%frobnicate")])
+        self.assertEqual(len(self.diagnostics.errors), 3)
+        self.assertEqual(len(self.diagnostics.warnings), 2)
+        self.assertIn("no such option: --bogus", str(self.diagnostics[0]))
+
+        d = self.diagnostics.to_list()[2]
+        self.assertEqual(sorted(d.keys()), ["code", "command", "file", "lineno", "message", "severity"])
+        self.assertIsNone(d["file"])
+
+        # Everything done with the parser is over, so warnings go back to
+        # the warnings module.
+        self.assertIsNone(diagnostics._activeParser())
+
+class Diagnostics_Include_TestCase(Base_Diagnostics):
+    def setUp(self):
+        Base_Diagnostics.setUp(self)
+        (fd, self._path) = tempfile.mkstemp(prefix="ks-", text=True)
+        os.write(fd, b"\nzerombr foo\n")
+        os.close(fd)
+
+    def tearDown(self):
+        os.unlink(self._path)
+
+    def runTest(self):
+        self._parse("%%include %s\n%%include %s-missing\nrootpw --bogus\n" % (self._path, self._path),
+                    missingIncludeIsFatal=False)
+
+        found = [(d.code, d.file, d.lineno, d.command) for d in self.diagnostics]
+        self.assertEqual(found, [("parse-error", self._path, 2, "zerombr"),
+                                 ("missing-include", None, 2, "%include"),
+                                 ("parse-error", None, 3, "rootpw")])
+
+class Diagnostics_Default_TestCase(unittest.TestCase):
+    def runTest(self):
+        # Without a Diagnostics of its own, a parser still collects the
+        # errors it goes past, but warnings are left to the warnings module.
+        parser = KickstartParser(makeVersion(), errorsAreFatal=False)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            parser.readKickstartFromString(Base_Diagnostics.ks.replace("%frobnicate\n%end\n", ""))
+
+        self.assertEqual([d.code for d in parser.diagnostics], ["parse-error", "parse-error", "parse-error"])
+        self.assertEqual(len(caught), 1)
+        self.assertIn("has already been defined", str(caught[0].message))
+
+        # Errors are still raised when they are fatal.
+        parser = KickstartParser(makeVersion(), diagnostics=Diagnostics())
+        self.assertRaises(KickstartParseError, parser.readKickstartFromString, "rootpw --bogus\n")
+
+class Diagnostics_Cache_TestCase(unittest.TestCase):
+    def runTest(self):
+        # Warnings collected the first time come back when the result is
+        # reused.
+        cache = ParseCache()
+        ks = "user --name=a\nuser --name=a\n"
+        results = []
+
+        for _i in range(2):
+            d = Diagnostics()
+            parser = KickstartParser(makeVersion(), cache=cache, diagnostics=d)
+            parser.readKickstartFromString(ks)
+            results.append([(x.code, x.lineno, x.command) for x in d])
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(results, [[("duplicate", 2, "user")]] * 2)
+
+if __name__ == "__main__":
+    unittest.main()
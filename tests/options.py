@@ -0,0 +1,160 @@
+import unittest
+import warnings
+from tests.baseclass import ParserTest
+
+from pykickstart.constants import AUTOPART_TYPE_LVM_THINP, BOOTPROTO_IBFT, CLEARPART_TYPE_LIST
+from pykickstart.errors import KickstartParseError, KickstartValueError
+from pykickstart.options import KSOptionParser, sharedParser
+from pykickstart.base import BaseHandler, KickstartCommand
+from pykickstart.version import F9, F12, F13, F16, F18, F20, F21, makeVersion, versionMap
+
+class SharedParser_TestCase(unittest.TestCase):
+    def runTest(self):
+        def builder():
+            op = KSOptionParser()
+            op.add_option("--foo", dest="foo")
+            return op
+
+        # not frozen, so it can't be cloned
+        self.assertRaises(TypeError, builder().clone)
+
+        op1 = sharedParser(SharedParser_TestCase, None, builder)
+        op2 = sharedParser(SharedParser_TestCase, None, builder)
+
+        # Each caller gets its own parser, but the option table is shared.
+        self.assertIsNot(op1, op2)
+        self.assertIs(op1.option_list, op2.option_list)
+        self.assertRaises(TypeError, op1.add_option, "--bar")
+
+        # Per-parse state is kept on each clone.
+        (opts, _extra) = op1.parse_args(args=["--foo", "x"], lineno=10)
+        self.assertEqual(opts.foo, "x")
+        self.assertEqual(op1.lineno, 10)
+        self.assertEqual(len(op1.option_seen), 1)
+        self.assertIsNone(op2.lineno)
+        self.assertEqual(op2.option_seen, {})
+
+class SharedCommandParser_TestCase(ParserTest):
+    def runTest(self):
+        other = makeVersion(self.version)
+
+        self.assertIsNot(self.handler.clearpart.op, other.clearpart.op)
+        self.assertIs(self.handler.clearpart.op.option_list, other.clearpart.op.option_list)
+
+        # Callbacks must act on the command being parsed, not on whichever
+        # instance happened to build the shared option table.
+        self.handler.dispatcher(["clearpart", "--list=sda"], 1)
+        self.assertEqual(self.handler.clearpart.type, CLEARPART_TYPE_LIST)
+        self.assertIsNone(other.clearpart.type)
+
+class SharedCommandParserRefs_TestCase(unittest.TestCase):
+    def _refs(self, obj):
+        # Return everything a callback could reach an instance through.
+        refs = [getattr(obj, "__self__", None)]
+        refs.extend(cell.cell_contents for cell in getattr(obj, "__closure__", None) or [])
+        return refs
+
+    def runTest(self):
+        # A shared parser outlives the instance that built it, so nothing in
+        # it may hold on to that instance or to its handler.
+        for version in sorted(versionMap.values()):
+            handler = makeVersion(version)
+            for cmd in handler.commands.values():
+                if not hasattr(cmd, "_getParser"):
+                    continue
+
+                for option in cmd.op.option_list:
+                    refs = self._refs(option.callback) + list(option.callback_args or ())
+                    for ref in refs:
+                        self.assertNotIsInstance(ref, (KickstartCommand, BaseHandler),
+                                                 "%s %s" % (cmd.__class__.__name__, option))
+
+        # Choices that subclasses add to must still reach a later instance.
+        handler = makeVersion(F13)
+        handler.dispatcher(["raid", "/", "--level=4", "--device=md0", "raid.01"], 1)
+        self.assertEqual(handler.raid.raidList[0].level, "RAID4")
+
+        handler = makeVersion(F20)
+        handler.dispatcher(["autopart", "--type=thinp"], 1)
+        self.assertEqual(handler.autopart.type, AUTOPART_TYPE_LVM_THINP)
+
+        handler = makeVersion(F16)
+        handler.dispatcher(["network", "--bootproto=ibft"], 1)
+        self.assertEqual(handler.network.network[0].bootProto, BOOTPROTO_IBFT)
+
+class Keys_TestCase(ParserTest):
+    def runTest(self):
+        def builder():
+            op = KSOptionParser()
+            op.add_option("--iscrypted", dest="isCrypted", action="store_true")
+            op.add_option("--plaintext", dest="isCrypted", action="store_false")
+            op.add_option("--name", dest="name")
+            return op
+
+        # Each destination is only given once, and frozen parsers share
+        # the result.
+        self.assertEqual(builder().keys(), ("isCrypted", "name"))
+        op1 = sharedParser(Keys_TestCase, None, builder)
+        op2 = sharedParser(Keys_TestCase, None, builder)
+        self.assertIs(op1.keys(), op2.keys())
+
+        # Options that weren't given don't overwrite anything.
+        user = self.handler.UserData(name="old", homedir="/home/old")
+        op = self.handler.user.op
+        (opts, _extra) = op.parse_args(args=["--name=new", "--plaintext"], lineno=1)
+        self.handler.user._setToObj(op, opts, user)
+        self.assertEqual((user.name, user.homedir, user.isCrypted), ("new", "/home/old", False))
+
+class VersionPolicy_TestCase(unittest.TestCase):
+    def runTest(self):
+        def builder():
+            op = KSOptionParser(version=F18)
+            op.add_option("--name", dest="name", required=1)
+            op.add_option("--new", dest="new", action="store_true", introduced=F21)
+            op.add_option("--old", dest="old", action="store_true", removed=F9)
+            op.add_option("--stale", dest="stale", action="store_true", deprecated=F9)
+            op.add_option("--fine", dest="fine", action="store_true", introduced=F9)
+            return op
+
+        op1 = sharedParser(VersionPolicy_TestCase, F18, builder)
+        op2 = sharedParser(VersionPolicy_TestCase, F18, builder)
+
+        # The verdicts are worked out once, when the parser is frozen.
+        self.assertIs(op1._policy, op2._policy)
+        (required, verdicts) = op1._policy
+        self.assertEqual([o.dest for (_i, o) in required], ["name"])
+        self.assertEqual(sorted((o.dest, v) for (o, (_i, v)) in verdicts.items()),
+                         [("new", "new"), ("old", "removed"), ("stale", "deprecated")])
+
+        op1.parse_args(args=["--name=x", "--fine"], lineno=1)
+        self.assertRaises(KickstartValueError, op1.parse_args, args=["--fine"], lineno=1)
+        self.assertRaises(KickstartParseError, op1.parse_args, args=["--name=x", "--new"], lineno=1)
+        self.assertRaises(KickstartParseError, op1.parse_args, args=["--name=x", "--old"], lineno=1)
+
+        # Problems are reported in the order the options were added, not
+        # the order they were given in.
+        try:
+            op1.parse_args(args=["--name=x", "--old", "--new"], lineno=1)
+        except KickstartParseError as e:
+            self.assertIn("--new", str(e))
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            op1.parse_args(args=["--name=x", "--stale"], lineno=3)
+            self.assertEqual(len(w), 1)
+            self.assertTrue(issubclass(w[0].category, DeprecationWarning))
+
+class DeprecatedNoVersion_TestCase(unittest.TestCase):
+    def runTest(self):
+        # Command parsers are built without a version, and their deprecated
+        # options are still only warned about.
+        handler = makeVersion(F12)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            handler.dispatcher(["zfcp", "--devnum=0.0.4000", "--wwpn=0x1", "--fcplun=0x2", "--scsiid"], 1)
+            self.assertTrue(any(issubclass(x.category, DeprecationWarning) for x in w))
+
+        self.assertEqual(handler.zfcp.zfcp[0].devnum, "0.0.4000")
+
+if __name__ == "__main__":
+    unittest.main()
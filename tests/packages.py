@@ -170,5 +170,56 @@ class MultiLib_TestCase(DevelPackagesBase):
 
 %end""", str(pkgs).strip())
 
+class Batched_TestCase(DevelPackagesBase):
+    def runTest(self):
+        lines = ["vim-enhanced", "@group-a", "package-b", "-vim-enhanced",
+                 "-@group-a", "-package-c", "package-c", "-@group-b"]
+
+        single = Packages()
+        for line in lines:
+            single.add([line])
+
+        batched = Packages()
+        batched.add(lines)
+
+        self.assertEqual(single.packageList, batched.packageList)
+        self.assertEqual(single.excludedList, batched.excludedList)
+        self.assertEqual(batched.packageList, ["package-b", "package-c"])
+        self.assertEqual(batched.excludedList, ["vim-enhanced"])
+        self.assertEqual(str(single), str(batched))
+
+class ListAssignment_TestCase(DevelPackagesBase):
+    def runTest(self):
+        # Assigning to or modifying the lists must be honored by later adds.
+        pkgs = Packages()
+        pkgs.packageList = ["packageA", "packageB"]
+        pkgs.add(["packageC"])
+        self.assertEqual(pkgs.packageList, ["packageA", "packageB", "packageC"])
+
+        pkgs.packageList.remove("packageA")
+        pkgs.excludedList.append("packageD")
+        pkgs.add(["packageD"])
+        self.assertEqual(pkgs.packageList, ["packageB", "packageC", "packageD"])
+        self.assertEqual(pkgs.excludedList, [])
+
+class WriteDoesNotSort_TestCase(DevelPackagesBase):
+    def runTest(self):
+        # Output is sorted, but the lists themselves are left alone.
+        pkgs = Packages()
+        pkgs.add(["packageB", "packageA", "@groupB", "@groupA", "-packageD", "-packageC"])
+
+        self.assertEqual("""%packages
+@groupA
+@groupB
+packageA
+packageB
+-packageC
+-packageD
+
+%end""", str(pkgs).strip())
+        self.assertEqual(pkgs.packageList, ["packageB", "packageA"])
+        self.assertEqual([g.name for g in pkgs.groupList], ["groupB", "groupA"])
+        self.assertEqual(pkgs.excludedList, ["packageD", "packageC"])
+
 if __name__ == "__main__":
     unittest.main()
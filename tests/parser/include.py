@@ -1,11 +1,13 @@
 import os
 import six
+import threading
 import unittest
 import tempfile
 from tests.baseclass import ParserTest
 
 from pykickstart import constants
 from pykickstart.errors import KickstartError
+from pykickstart.parser import KickstartParser, preprocessFromStringToString
 
 class Base_Include(ParserTest):
     def setUp(self):
@@ -184,5 +186,89 @@ class Include_Bad_URL_TestCase(Include_URL_TestCase):
         self.assertRaisesRegexp(KickstartError, "Error accessing URL",
                 self.parser.readKickstartFromString, self.ks % (self._url + "-garbage"))
 
+class _FileServer(six.moves.socketserver.ThreadingMixIn, six.moves.BaseHTTPServer.HTTPServer):
+    # Serves the dict files, mapping paths to contents, and remembers every
+    # path asked for.  Requests are answered by one thread each, so they may
+    # all be in progress at the same time.
+    daemon_threads = True
+
+    def __init__(self, files):
+        self.files = files
+        self.requested = []
+        six.moves.BaseHTTPServer.HTTPServer.__init__(self, ("127.0.0.1", 0), _FileHandler)
+
+class _FileHandler(six.moves.BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requested.append(self.path)
+        body = self.server.files.get(self.path)
+
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class Include_Prefetch_TestCase(ParserTest):
+    def setUp(self):
+        ParserTest.setUp(self)
+
+        self._server = _FileServer({
+            "/a.ks": "%%include %(url)s/c.ks\nrootpw secret\n",
+            "/b.ks": "%%packages\nvim\n%%end\n%%include %(url)s/a.ks\n",
+            "/c.ks": "network --device=eth0 --bootproto=dhcp\n",
+            "/d.ks": "zerombr\n",
+            "/e.ks": "text\n",
+        })
+        self._url = "http://127.0.0.1:%d" % self._server.server_port
+        for (path, contents) in self._server.files.items():
+            self._server.files[path] = contents % {"url": self._url}
+
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def tearDown(self):
+        ParserTest.tearDown(self)
+        self._server.shutdown()
+        self._server.server_close()
+
+    def runTest(self):
+        ks = "%%include %(url)s/a.ks\n%%include %(url)s/b.ks\n%%include %(url)s/missing.ks\n" % {"url": self._url}
+
+        # Everything is fetched once before parsing starts.  Only the missing
+        # file is asked for again, when the parser gets to it and reports the
+        # usual error.
+        parser = KickstartParser(self.handler, prefetch=True)
+        self.assertRaisesRegexp(KickstartError, "Error accessing URL", parser.readKickstartFromString, ks)
+        self.assertEqual(sorted(self._server.requested),
+                         ["/a.ks", "/b.ks", "/c.ks", "/missing.ks", "/missing.ks"])
+        self.assertEqual(parser._prefetched, {})
+
+        # b.ks includes a.ks again, but it is still only fetched once.
+        self._server.requested = []
+        self.handler.reset()
+        parser.readKickstartFromString(ks.replace("%%include %s/missing.ks\n" % self._url, ""))
+        self.assertEqual(sorted(self._server.requested), ["/a.ks", "/b.ks", "/c.ks"])
+        self.assertEqual(self.handler.rootpw.password, "secret")
+        self.assertEqual(self.handler.network.network[0].device, "eth0")
+        self.assertEqual(self.handler.packages.packageList, ["vim"])
+
+        # %ksappend URLs are all fetched at once as well.
+        self._server.requested = []
+        ks = "%%ksappend %(url)s/d.ks\n%%ksappend %(url)s/e.ks\n" % {"url": self._url}
+        self.assertEqual(preprocessFromStringToString(ks), "zerombr\ntext\n")
+        self.assertEqual(sorted(self._server.requested), ["/d.ks", "/e.ks"])
+
 if __name__ == "__main__":
     unittest.main()
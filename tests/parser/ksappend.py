@@ -0,0 +1,111 @@
+import os
+import six
+import unittest
+import tempfile
+from tests.baseclass import ParserTest
+
+from pykickstart.errors import KickstartError, KickstartParseError
+from pykickstart.parser import preprocessFromString, preprocessFromStringToString, preprocessKickstart, preprocessKickstartToString, preprocessLines
+
+class Base_KSAppend(ParserTest):
+    def setUp(self):
+        ParserTest.setUp(self)
+        self._paths = []
+
+        for appendKS in self.appendKS:
+            (handle, path) = tempfile.mkstemp(prefix="ksappend-", text=True)
+            if six.PY3:
+                appendKS = appendKS.encode('utf-8')
+
+            os.write(handle, appendKS)
+            os.close(handle)
+            self._paths.append(path)
+
+        self.ks = self.ks % tuple(self._paths)
+
+    def tearDown(self):
+        ParserTest.tearDown(self)
+        for path in self._paths:
+            os.unlink(path)
+
+    def _readTempFile(self, path):
+        try:
+            with open(path) as f:
+                return f.read()
+        finally:
+            os.unlink(path)
+
+class KSAppend_Commands_TestCase(Base_KSAppend):
+    ks = """
+rootpw 123456
+%%ksappend %s
+text
+"""
+
+    appendKS = ["""
+autopart
+zerombr
+"""]
+
+    def runTest(self):
+        self.parser.readKickstartFromString(preprocessFromStringToString(self.ks))
+
+        self.assertEqual(self.handler.rootpw.password, "123456")
+        self.assertTrue(self.handler.autopart.autopart)
+        self.assertTrue(self.handler.zerombr.zerombr)
+        self.assertTrue(self.handler.displaymode.displayMode is not None)
+
+        # The streamed result is the same as the temporary file.
+        self.assertEqual(preprocessFromStringToString(self.ks),
+                         self._readTempFile(preprocessFromString(self.ks)))
+
+class KSAppend_Lines_TestCase(Base_KSAppend):
+    # The second file has no trailing newline so it runs on into the next
+    # line, just like it does when written out to a file.
+    ks = """%%ksappend %s
+%%ksappend %s
+text
+"""
+
+    appendKS = ["autopart\nzerombr\n", "rootpw 123"]
+
+    def runTest(self):
+        lines = list(preprocessLines(self.ks.splitlines(True)))
+        self.assertEqual(lines, ["autopart\n", "zerombr\n", "rootpw 123text\n"])
+        self.assertEqual("".join(lines), self._readTempFile(preprocessFromString(self.ks)))
+
+        # An empty string stops preprocessing.
+        lines = list(preprocessLines(["text\n", "", "zerombr\n"]))
+        self.assertEqual(lines, ["text\n"])
+
+class KSAppend_File_TestCase(Base_KSAppend):
+    ks = """
+%%ksappend %s
+"""
+
+    appendKS = ["zerombr\n"]
+
+    def runTest(self):
+        (handle, path) = tempfile.mkstemp(prefix="ks-", text=True)
+        ks = self.ks
+        if six.PY3:
+            ks = ks.encode('utf-8')
+
+        os.write(handle, ks)
+        os.close(handle)
+
+        try:
+            s = preprocessKickstartToString(path)
+            self.assertEqual(s, "\nzerombr\n")
+            self.assertEqual(s, self._readTempFile(preprocessKickstart(path)))
+        finally:
+            os.unlink(path)
+
+class KSAppend_Errors_TestCase(ParserTest):
+    def runTest(self):
+        self.assertRaises(KickstartParseError, preprocessFromStringToString, "%ksappend\n")
+        self.assertRaises(KickstartError, preprocessFromStringToString, "%ksappend /no/such/file.ks\n")
+        self.assertRaises(KickstartError, preprocessKickstartToString, "/no/such/file.ks")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+import os
+import six
+import tempfile
+import unittest
+from tests.baseclass import ParserTest
+
+from pykickstart import parser
+from pykickstart.parser import KickstartParser
+from pykickstart.errors import KickstartError, KickstartParseError
+from pykickstart.version import F20, F24, FC6, RHEL6, RHEL7, makeVersion
+
+class Parse_TestCase(ParserTest):
+    ks1 = """
+rootpw secret
+part / --size=100
+%post
+echo hello
+%end
+%packages
+vim
+%end
+"""
+
+    ks2 = """
+part /home --size=200
+"""
+
+    def runTest(self):
+        handler = self.parser.parse(self.ks1)
+        self.assertIs(handler, self.handler)
+        self.assertEqual(self.handler.rootpw.password, "secret")
+        self.assertEqual(len(self.handler.partition.partitions), 1)
+        self.assertEqual(len(self.handler.scripts), 1)
+        self.assertEqual(self.handler.packages.packageList, ["vim"])
+
+        # A fresh parse starts over from nothing.
+        self.parser.parse(self.ks2)
+        self.assertEqual(self.handler.rootpw.password, "")
+        self.assertEqual([p.mountpoint for p in self.handler.partition.partitions], ["/home"])
+        self.assertEqual(self.handler.scripts, [])
+        self.assertEqual(self.handler.packages.packageList, [])
+        self.assertFalse(self.parser.getSection("%packages").seen)
+
+        # Otherwise, the results are added to what is already there.
+        self.parser.parse(self.ks1, fresh=False)
+        self.assertEqual([p.mountpoint for p in self.handler.partition.partitions], ["/home", "/"])
+        self.assertEqual(self.handler.packages.packageList, ["vim"])
+
+class ParseUnterminated_TestCase(ParserTest):
+    def runTest(self):
+        # A section left open by a failed parse doesn't leak into the next.
+        self.assertRaises(KickstartParseError, self.parser.parse, "%post\necho one\n")
+        self.parser.parse("%post\necho two\n%end\n")
+        self.assertEqual(len(self.handler.scripts), 1)
+        self.assertEqual(self.handler.scripts[0].script, "echo two\n")
+
+class ParseKickstart_TestCase(unittest.TestCase):
+    def setUp(self):
+        (fd, self._path) = tempfile.mkstemp(prefix="ks-", text=True)
+        os.write(fd, b"#version=F20\nrootpw secret\n")
+        os.close(fd)
+
+        self._loaded = []
+        self._orig = parser.load_to_str
+        def _load(f):
+            self._loaded.append(f)
+            return self._orig(f)
+
+        parser.load_to_str = _load
+
+    def tearDown(self):
+        parser.load_to_str = self._orig
+        os.unlink(self._path)
+
+    def runTest(self):
+        # The file is loaded once, both to find the version and to parse it.
+        ksparser = parser.parseKickstart(self._path)
+        self.assertEqual(ksparser.handler.version, F20)
+        self.assertEqual(ksparser.handler.rootpw.password, "secret")
+        self.assertEqual(self._loaded, [self._path])
+
+        # A version given explicitly wins over the file.
+        ksparser = parser.parseKickstart(self._path, syntaxVersion=RHEL6, followIncludes=False)
+        self.assertEqual(ksparser.handler.version, RHEL6)
+        self.assertFalse(ksparser.followIncludes)
+
+        self.assertRaises(KickstartError, parser.parseKickstart, self._path + "-missing")
+
+class ParserVersions_TestCase(unittest.TestCase):
+    ks = """
+%post
+echo hello
+%packages
+vim
+"""
+
+    def runTest(self):
+        # Each parser's output follows its own version, no matter which
+        # parser was created last.
+        old = KickstartParser(makeVersion(FC6))
+        new = KickstartParser(makeVersion())
+        old.readKickstartFromString(self.ks)
+        new.readKickstartFromString(self.ks.replace("\n%packages", "\n%end\n%packages") + "%end\n")
+
+        self.assertNotIn("%end", str(old.handler))
+        self.assertEqual(str(new.handler).count("%end"), 2)
+        self.assertEqual(old.handler.scripts[0].version, FC6)
+        self.assertEqual(old.handler.packages.version, FC6)
+
+class ParseMany_TestCase(unittest.TestCase):
+    def setUp(self):
+        self._paths = []
+
+        for v in ["RHEL6", "RHEL7", "F24", "RHEL6"]:
+            (fd, path) = tempfile.mkstemp(prefix="ks-", text=True)
+            os.write(fd, ("#version=%s\nrootpw %s\n%%post\necho %s\n%%end\n" % (v, v, v)).encode("utf-8"))
+            os.close(fd)
+            self._paths.append(path)
+
+    def tearDown(self):
+        for path in self._paths:
+            os.unlink(path)
+
+    def runTest(self):
+        sources = self._paths + [self._paths[0] + "-missing"]
+        results = parser.parse_many(sources, max_workers=4)
+
+        # Every file gets its own parser of the right version, and results
+        # come back in order.
+        self.assertEqual(len(results), 5)
+        self.assertEqual([r.handler.version for r in results[:4]], [RHEL6, RHEL7, F24, RHEL6])
+        self.assertEqual([r.handler.rootpw.password for r in results[:4]], ["RHEL6", "RHEL7", "F24", "RHEL6"])
+        self.assertIsNot(results[0].handler, results[3].handler)
+        self.assertIn("echo F24\n%end\n", str(results[2].handler))
+        self.assertIsInstance(results[4], KickstartError)
+
+        # Running them one at a time gives the same answers.
+        serial = parser.parse_many(self._paths, max_workers=1)
+        self.assertEqual([str(r.handler) for r in serial], [str(r.handler) for r in results[:4]])
+
+class ReadStreaming_TestCase(unittest.TestCase):
+    ks = """#version=DEVEL
+rootpw secret
+part / --size=100
+%post --nochroot
+echo hello\r
+echo world
+%end
+%packages
+vim
+%end
+network --device=eth0 --bootproto=dhcp
+"""
+
+    def _parse(self, fn, arg):
+        ksparser = KickstartParser(makeVersion())
+        fn(ksparser)(arg)
+        return str(ksparser.handler)
+
+    def runTest(self):
+        expected = self._parse(lambda p: p.readKickstartFromString, self.ks)
+        self.assertIn("--device=eth0", expected)
+
+        self.assertEqual(self._parse(lambda p: p.readKickstartFromFile, six.StringIO(self.ks)), expected)
+        self.assertEqual(self._parse(lambda p: p.readKickstartFromIterable, iter(self.ks.splitlines(True))), expected)
+
+        # Lines are only read as they are needed, and an empty string ends
+        # the file.
+        def lines():
+            for line in self.ks.splitlines(True)[:3]:
+                yield line
+            yield ""
+            raise AssertionError("read past the end")
+
+        ksparser = KickstartParser(makeVersion())
+        ksparser.readKickstartFromIterable(lines())
+        self.assertEqual(ksparser.handler.rootpw.password, "secret")
+        self.assertEqual(len(ksparser.handler.partition.partitions), 1)
+
+class IterLines_TestCase(unittest.TestCase):
+    def runTest(self):
+        # Cutting into chunks never changes how lines are split, even when a
+        # chunk ends between \r and \n.
+        for s in ["", "\n", "abc", "a\nb", "a\r\nb\r\n", "a\rb\r\n\r\nc\x0bd\n\n",
+                  "line\n" * 50, "x" * 100 + "\r\n" + "y\r" * 30]:
+            for chunkSize in [1, 2, 3, 7, 65536]:
+                self.assertEqual(list(parser._iterLines(s, chunkSize)), s.splitlines(True))
+
+if __name__ == "__main__":
+    unittest.main()
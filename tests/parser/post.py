@@ -4,6 +4,7 @@ from tests.baseclass import ParserTest
 from pykickstart import constants
 from pykickstart.errors import KickstartParseError
 from pykickstart import version         # pylint: disable=unused-import
+from pykickstart.parser import Script
 
 class Script_Includes_Percent_Sign(ParserTest):
     ks = """
@@ -17,6 +18,56 @@ echo "# Added by kickstart
         self.parser.readKickstartFromString(self.ks)
         self.assertEqual(len(self.handler.scripts), 1)
 
+class Script_Body_Lines_TestCase(ParserTest):
+    ks = """
+%post
+# a comment
+
+   %notasection arg
+\t
+%packages-not
+echo done
+%end
+"""
+
+    def runTest(self):
+        self.parser.readKickstartFromString(self.ks)
+        self.assertEqual(len(self.handler.scripts), 1)
+
+        # Scripts keep every line that isn't a section tag.
+        self.assertEqual(self.handler.scripts[0].script,
+                         "# a comment\n\n   %notasection arg\n\t\n%packages-not\necho done\n")
+
+class Script_Lazy_Body_TestCase(ParserTest):
+    ks = """
+%post
+echo one
+echo two
+%end
+%post
+  \t
+
+%end
+"""
+
+    def runTest(self):
+        self.parser.readKickstartFromString(self.ks)
+
+        # The whitespace-only script is thrown out.
+        self.assertEqual(len(self.handler.scripts), 1)
+
+        # The body is only joined up when it's first asked for.
+        script = self.handler.scripts[0]
+        self.assertIn("\necho one\necho two\n%end\n", str(script))
+        self.assertIsNone(script._script)
+        self.assertEqual(script.script, "echo one\necho two\n")
+        self.assertIsNone(script._scriptLines)
+
+        script.script = "echo three\n"
+        self.assertIn("\necho three\n%end\n", str(script))
+        self.assertEqual(Script("echo four\n").script, "echo four\n")
+        self.assertEqual(Script(iter(["a\n", "b\n"])).script, "a\nb\n")
+
 class Simple_Terminated_TestCase(ParserTest):
     ks = """
 %post
@@ -0,0 +1,75 @@
+import ast
+import glob
+import os
+import shlex
+import sys
+import unittest
+
+from pykickstart.parser import _splitLine
+
+# Lines exercising the quoting, escaping, and comment rules.
+EDGE_CASES = [
+    "", " ", "\n", "\t \r\n", "#", "# comment", "  # comment\n",
+    "part /boot --size=500", "part /boot --size=500 # comment",
+    "part /boot --size=500#comment", "rootpw #secret", "a#b#c", "a # b \n",
+    "\\#notacomment", "'#quoted'", '"#quoted"', "a'#'b",
+    "user --name=bob --gecos='Bob Smith'", 'user --gecos="Bob \\"The\\" Smith"',
+    'a "b\\c" d', 'a "b\\\\c" d', 'a "b\\$c"', "a 'b\\c' d", "a\\ b c", "a\\\\b",
+    "''", '""', "a '' b", 'a "" b', "''a''", "a''", "'a'\"b\"c",
+    "unterminated 'quote", 'unterminated "quote', "escape at end \\",
+    '"escape in quote at end \\', "\\", "'", '"',
+    "form\x0cfeed", "vertical\x0btab", "non\xa0breaking", "\x1cfile separator",
+    "line\nbreak # comment\nnext line", "# comment\nnext line",
+    "%post --interpreter=/usr/bin/python --log=/root/ks-post.log",
+    "%include /tmp/part-include", "%ksappend http://example.com/ks.cfg",
+]
+
+def _result(fn, line, comments):
+    try:
+        return fn(line, comments=comments)
+    except ValueError as e:
+        return ("ValueError", str(e))
+
+def _stringValue(node):
+    # Return the value of node if it is a string constant, or None.  Python
+    # 3.8 and later parse every constant to ast.Constant, and 3.12 dropped
+    # ast.Str, which older versions use for strings.
+    if sys.version_info >= (3, 8):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+    elif isinstance(node, ast.Str):
+        return node.s
+
+    return None
+
+def _corpusLines():
+    """Return every line of every string constant in the test suite, which
+       contains all the kickstart snippets the tests use.
+    """
+    lines = set()
+    top = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    for fn in glob.glob(top + "/*.py") + glob.glob(top + "/*/*.py"):
+        with open(fn) as f:
+            tree = ast.parse(f.read())
+
+        for node in ast.walk(tree):
+            value = _stringValue(node)
+            if value is not None:
+                lines.update(value.splitlines(True))
+
+    return sorted(lines)
+
+class SplitLine_TestCase(unittest.TestCase):
+    def runTest(self):
+        lines = EDGE_CASES + _corpusLines()
+        self.assertGreater(len(lines), 1000)
+
+        for line in lines:
+            for comments in [False, True]:
+                self.assertEqual(_result(_splitLine, line, comments),
+                                 _result(shlex.split, line, comments),
+                                 "%r, comments=%s" % (line, comments))
+
+if __name__ == "__main__":
+    unittest.main()
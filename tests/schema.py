@@ -0,0 +1,56 @@
+import unittest
+
+from pykickstart.base import BaseData
+from pykickstart.errors import KickstartValueError
+from pykickstart.schema import Field, ParserOption, buildParser, renderFields
+
+class Base_ThingData(BaseData):
+    fields = (
+        Field("name", "", opts=["--name"], render=" --name=%s", required=1),
+        Field("tags", [], opts=["--tag"], render=" --tags=%s", join=",", action="append"),
+    )
+
+    def __str__(self):
+        return "thing" + self._getArgsAsStr() + "\n"
+
+class Later_ThingData(Base_ThingData):
+    fields = Base_ThingData.fields + (
+        Field("quiet", False, opts=["--quiet"], render=" --quiet", action="store_true", default=False),
+        ParserOption("--loud", dest="quiet", action="store_false"),
+        Field("secret", None),
+    )
+
+class Schema_TestCase(unittest.TestCase):
+    def runTest(self):
+        # Setting up and writing out the object both read the fields, so
+        # neither __init__ nor _getArgsAsStr has to be written.
+        self.assertNotIn("__init__", Later_ThingData.__dict__)
+        self.assertNotIn("_getArgsAsStr", Later_ThingData.__dict__)
+
+        thing = Later_ThingData(name="a", tags=["x", "y"])
+        self.assertFalse(hasattr(thing, "__dict__"))
+        self.assertEqual(Later_ThingData.__slots__, ("quiet", "secret"))
+        self.assertEqual(thing.lineno, 0)
+        self.assertIsNone(thing.secret)
+        self.assertFalse(thing.quiet)
+        self.assertEqual(str(thing), "thing --name=a --tags=x,y\n")
+
+        # Mutable initial values are not shared between objects.
+        self.assertIsNot(Later_ThingData().tags, Later_ThingData().tags)
+
+        thing.quiet = True
+        self.assertEqual(str(thing), "thing --name=a --tags=x,y --quiet\n")
+
+        op = buildParser(Later_ThingData.fields)
+        self.assertEqual([o.get_opt_string() for o in op.option_list], ["--name", "--tag", "--quiet", "--loud"])
+        (opts, _extra) = op.parse_args(args=["--name=b", "--tag=z", "--quiet", "--loud"], lineno=1)
+        self.assertEqual((opts.name, opts.tags, opts.quiet), ("b", ["z"], False))
+        self.assertRaises(KickstartValueError, op.parse_args, args=["--quiet"], lineno=1)
+
+        # Keyword arguments win over initial values.
+        thing = Later_ThingData(name="c", quiet=True, secret="s")
+        self.assertEqual((thing.quiet, thing.secret, thing.tags), (True, "s", []))
+        self.assertEqual(renderFields(thing, Base_ThingData.fields), " --name=c")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import json
+import unittest
+from tests.baseclass import ParserTest
+
+from pykickstart.base import BaseHandler
+from pykickstart.errors import KickstartError
+from pykickstart.parser import KickstartParser, Packages, Script
+from pykickstart.serialize import fromJSON, fromMsgpack, toJSON, toMsgpack
+from pykickstart.version import DEVEL, F20, F21, RHEL6, makeVersion
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+class Base_Serialize(ParserTest):
+    ks = """
+rootpw --plaintext secret
+timezone --ntpservers=ntp1,ntp2 Europe/Prague
+part / --size=1000
+volgroup vg pv.01
+logvol /home --vgname=vg --name=home --size=100
+%post --nochroot --logfile=/tmp/post.log
+echo hello
+%end
+%packages --excludedocs
+@core --nodefaults
+vim
+-nano
+-@games
+%end
+"""
+
+    def setUp(self):
+        ParserTest.setUp(self)
+        self.parser.readKickstartFromString(self.ks)
+
+    def assertSameHandler(self, handler):
+        self.assertEqual(handler.version, self.handler.version)
+        self.assertEqual(str(handler), str(self.handler))
+        self.assertEqual(handler.to_dict(), self.handler.to_dict())
+
+class Serialize_Dict_TestCase(Base_Serialize):
+    def runTest(self):
+        d = self.handler.to_dict()
+
+        # Only commands that were changed are written out.
+        self.assertIn("rootpw", d["commands"])
+        self.assertNotIn("autopart", d["commands"])
+        self.assertEqual(d["commands"]["logvol"]["lvList"][0]["__data__"], "LogVolData")
+        self.assertEqual(d["commands"]["timezone"]["ntpservers"], ["ntp1", "ntp2"])
+
+        handler = BaseHandler.from_dict(d)
+        self.assertSameHandler(handler)
+        self.assertIs(handler.logvol.handler, handler)
+        self.assertIsInstance(handler.logvol.lvList[0], handler.LogVolData)
+        self.assertEqual(handler.timezone.ntpservers, ["ntp1", "ntp2"])
+        self.assertIs(handler.commands["part"], handler.partition)
+
+        # Creating a specific handler class works too.
+        self.assertSameHandler(self.handler.__class__.from_dict(d))
+
+class Serialize_SharedAttrName_TestCase(unittest.TestCase):
+    def runTest(self):
+        # install and upgrade are different classes that share an attribute
+        # name, and both have to come back.
+        for version in [F21, DEVEL]:
+            parser = KickstartParser(makeVersion(version))
+            parser.readKickstartFromString("install\nurl --url=http://x/\n")
+            handler = parser.handler
+
+            d = handler.to_dict()
+            self.assertIn("install", d["commands"])
+            self.assertNotIn("upgrade", d["commands"])
+
+            for newHandler in [BaseHandler.from_dict(d), handler.__class__.from_dict(d), fromJSON(toJSON(handler))]:
+                self.assertIn("install\n", str(newHandler))
+                self.assertEqual(str(newHandler), str(handler))
+                self.assertEqual(newHandler.to_dict(), d)
+
+class Serialize_Pieces_TestCase(Base_Serialize):
+    def runTest(self):
+        script = Script.from_dict(self.handler.scripts[0].to_dict())
+        self.assertEqual(str(script), str(self.handler.scripts[0]))
+
+        packages = Packages.from_dict(self.handler.packages.to_dict())
+        self.assertEqual(str(packages), str(self.handler.packages))
+
+        lv = self.handler.LogVolData.from_dict(self.handler.logvol.lvList[0].to_dict())
+        self.assertEqual(str(lv), str(self.handler.logvol.lvList[0]))
+
+        rootpw = self.handler.rootpw.__class__.from_dict(self.handler.rootpw.to_dict())
+        self.assertEqual(str(rootpw), str(self.handler.rootpw))
+
+class Serialize_JSON_TestCase(Base_Serialize):
+    def runTest(self):
+        s = toJSON(self.handler)
+        self.assertNotIn(", ", s)
+        self.assertNotIn(": ", s)
+        self.assertSameHandler(fromJSON(s))
+
+        # Older handlers can be written out as well, and sets come back as
+        # sets.
+        handler = makeVersion(F20)
+        handler.rootpw(password="secret", isCrypted=False)
+        handler.timezone(timezone="Europe/Prague", ntpservers=set(["ntp1", "ntp2"]))
+
+        newHandler = fromJSON(toJSON(handler))
+        self.assertEqual(newHandler.version, F20)
+        self.assertEqual(str(newHandler), str(handler))
+        self.assertEqual(newHandler.timezone.ntpservers, set(["ntp1", "ntp2"]))
+
+@unittest.skipIf(msgpack is None, "msgpack is not installed")
+class Serialize_Msgpack_TestCase(Base_Serialize):
+    def runTest(self):
+        self.assertSameHandler(fromMsgpack(toMsgpack(self.handler)))
+
+class Serialize_Errors_TestCase(Base_Serialize):
+    def runTest(self):
+        d = self.handler.to_dict()
+
+        d["schema"] = 0
+        self.assertRaises(KickstartError, BaseHandler.from_dict, d)
+
+        d = json.loads(toJSON(self.handler))
+        d["commands"]["nosuchcommand"] = {}
+        self.assertRaises(KickstartError, BaseHandler.from_dict, d)
+
+        d = json.loads(toJSON(self.handler))
+        d["commands"]["logvol"]["lvList"][0]["__data__"] = "NoSuchData"
+        self.assertRaises(KickstartError, BaseHandler.from_dict, d)
+
+class Serialize_PrivateState_TestCase(ParserTest):
+    def runTest(self):
+        # Some commands keep what they were given in attributes starting with
+        # an underscore, and those have to come through too.
+        self.parser.readKickstartFromString("keyboard us\nlogging --level=debug --host=foo\n")
+        handler = fromJSON(toJSON(self.handler))
+        self.assertEqual(str(handler.keyboard), str(self.handler.keyboard))
+        self.assertEqual(str(handler.logging), str(self.handler.logging))
+        self.assertIn("logging --level=debug --host=foo\n", str(handler))
+        self.assertIn("keyboard 'us'\n", str(handler))
+
+        parser = KickstartParser(makeVersion(RHEL6))
+        parser.readKickstartFromString("logging --level=info\n")
+        handler = fromJSON(toJSON(parser.handler))
+        self.assertIn("logging --level=info\n", str(handler))
+
+if __name__ == "__main__":
+    unittest.main()
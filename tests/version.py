@@ -292,6 +292,17 @@ cdrom
         self.assertEqual(versionFromFile(ks_cfg), DEVEL)
         os.unlink(ks_cfg)
 
+        # version specified after the commands
+        ks_cfg = '''
+# This is a sample kickstart file
+rootpw testing123
+cdrom
+#version=F20
+'''
+        ks_cfg = write_ks_cfg(ks_cfg)
+        self.assertEqual(versionFromFile(ks_cfg), F20)
+        os.unlink(ks_cfg)
+
         # unknown version specified ... raise exception
         ks_cfg = '''
 # This is a sample kickstart file
@@ -303,29 +314,39 @@ cdrom
         self.assertRaises(KickstartVersionError, versionFromFile, ks_cfg)
         os.unlink(ks_cfg)
 
-class FailedImpImport_TestCase(CommandTest):
+class versionFromLines_TestCase(CommandTest):
     def runTest(self):
-        try:
-            # will force another import
-            del sys.modules['pykickstart.version']
-            del sys.modules['imp']
-
-            # will cause ImportError
-            sys.modules['imputil'] = None
-
-            import pykickstart.version as ver
-            from pykickstart.handlers.f23 import F23Handler
-
-            cls = ver.returnClassForVersion(ver.F23)
-
-            # assert the names; b/c of how the imp.load_module() works
-            # asserting both classes being equal fails
-            self.assertEqual(cls.__name__, F23Handler.__name__)
-        finally:
-            # force import to reload these modules
-            del sys.modules['pykickstart.version']
-            del sys.modules['imp']
-            del sys.modules['imputil']
+        def lines():
+            yield "# This is a sample kickstart file\n"
+            yield "\n"
+            yield "#version=F20\n"
+            raise AssertionError("read past the version comment")
+
+        self.assertEqual(versionFromLines(lines()), F20)
+
+        # The version comment is found wherever it is, even after commands.
+        self.assertEqual(versionFromString("rootpw testing123\n#version=F20\n"), F20)
+        self.assertEqual(versionFromString("rootpw testing123\ncdrom\n"), DEVEL)
+
+        self.assertEqual(versionFromString("#platform=x86\n#version=RHEL6"), RHEL6)
+        self.assertEqual(versionFromString(""), DEVEL)
+        self.assertRaises(KickstartVersionError, versionFromString, "#version=RHEL5000\n")
+
+class returnClassForVersionImport_TestCase(CommandTest):
+    def runTest(self):
+        from pykickstart.handlers.f23 import F23Handler
+
+        path = list(sys.path)
+
+        # The handler module is imported normally, so this is the very same
+        # class and not a second copy of it.
+        self.assertIs(returnClassForVersion(F23), F23Handler)
+        self.assertIs(returnClassForVersion("F23"), F23Handler)
+        self.assertIs(returnClassForVersion("Fedora 23"), F23Handler)
+        self.assertIs(returnClassForVersion("DEVEL"), returnClassForVersion(DEVEL))
+        self.assertEqual(sys.path, path)
+
+        self.assertRaises(KickstartVersionError, returnClassForVersion, "F5000")
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,112 @@
+import six
+import unittest
+
+from pykickstart.base import DeprecatedCommand
+from pykickstart.errors import KickstartVersionError
+from pykickstart.version import DEVEL, F20, F21, makeVersion
+from pykickstart.versionmatrix import VersionMatrix, diffVersions, loadMatrix, writeMatrix
+
+def _optSet(handler, cmd):
+    try:
+        return set(o.get_opt_string() for o in handler.commands[cmd].op.option_list)
+    except AttributeError:
+        return set()
+
+class VersionMatrix_Current_TestCase(unittest.TestCase):
+    def runTest(self):
+        # The shipped table has to match what the handlers say now.
+        shipped = loadMatrix()
+        built = VersionMatrix.fromHandlers()
+
+        self.assertEqual(shipped.versions, built.versions,
+                         "pykickstart/_versionmatrix.py is out of date, run \"make versionmatrix\"")
+        self.assertEqual(shipped.commands, built.commands,
+                         "pykickstart/_versionmatrix.py is out of date, run \"make versionmatrix\"")
+        self.assertEqual(len(shipped.versions), 27)
+        self.assertIs(loadMatrix(), shipped)
+
+class VersionMatrix_Diff_TestCase(unittest.TestCase):
+    def runTest(self):
+        d = diffVersions("F20", "F21")
+        self.assertEqual((d.fromVersion, d.toVersion), ("F20", "F21"))
+        self.assertEqual(d.addedCommands, ["ostreesetup"])
+        self.assertEqual(d.removedCommands, [])
+        self.assertEqual(d.deprecatedCommands, ["upgrade"])
+        self.assertEqual(d.addedOptions["bootloader"], ["--disabled", "--nombr"])
+        self.assertNotIn("rootpw", d.addedOptions)
+
+        # Version constants and DEVEL work too.
+        self.assertEqual(diffVersions(F20, F21).to_dict(), d.to_dict())
+        self.assertEqual(diffVersions("DEVEL", DEVEL).to_dict(), diffVersions("F24", "F24").to_dict())
+
+        # What is deprecated is listed even when nothing changed.
+        same = diffVersions("F24", "DEVEL")
+        self.assertEqual((same.addedCommands, same.removedCommands), ([], []))
+        self.assertEqual((same.addedOptions, same.removedOptions), ({}, {}))
+        self.assertIn("upgrade", same.deprecatedCommands)
+
+        # Going back swaps what was added and removed.
+        back = diffVersions("F21", "F20")
+        self.assertEqual(back.removedCommands, ["ostreesetup"])
+        self.assertEqual(back.removedOptions["bootloader"], ["--disabled", "--nombr"])
+
+        self.assertRaises(KickstartVersionError, diffVersions, "F20", "F99")
+        self.assertRaises(KickstartVersionError, diffVersions, "F1", "F20")
+
+class VersionMatrix_Handlers_TestCase(unittest.TestCase):
+    def runTest(self):
+        # The diff agrees with comparing the handlers themselves.
+        for (f, t) in [("FC3", "F24"), ("RHEL6", "RHEL7"), ("F8", "F9")]:
+            d = diffVersions(f, t)
+            fromHandler = makeVersion(f)
+            toHandler = makeVersion(t)
+            fromCmds = set(fromHandler.commands.keys())
+            toCmds = set(toHandler.commands.keys())
+
+            self.assertEqual(d.addedCommands, sorted(toCmds - fromCmds))
+            self.assertEqual(d.removedCommands, sorted(fromCmds - toCmds))
+            self.assertEqual(d.deprecatedCommands,
+                             sorted(c for c in fromCmds & toCmds if isinstance(toHandler.commands[c], DeprecatedCommand)))
+
+            for cmd in fromCmds & toCmds:
+                self.assertEqual(d.addedOptions.get(cmd, []), sorted(_optSet(toHandler, cmd) - _optSet(fromHandler, cmd)))
+                self.assertEqual(d.removedOptions.get(cmd, []), sorted(_optSet(fromHandler, cmd) - _optSet(toHandler, cmd)))
+
+class VersionMatrix_Queries_TestCase(unittest.TestCase):
+    def runTest(self):
+        matrix = loadMatrix()
+
+        self.assertIn("ostreesetup", matrix.commandsIn("F21"))
+        self.assertNotIn("ostreesetup", matrix.commandsIn("F20"))
+        self.assertEqual(matrix.optionsIn("F21", "nosuchcommand"), [])
+        self.assertIn("--nombr", matrix.optionsIn("F21", "bootloader"))
+        self.assertNotIn("--nombr", matrix.optionsIn("F20", "bootloader"))
+
+        self.assertTrue(matrix.isDeprecated("F20", "upgrade"))
+        self.assertFalse(matrix.isDeprecated("F19", "upgrade"))
+        self.assertTrue(matrix.isDeprecated("F12", "zfcp", "--scsiid"))
+        self.assertFalse(matrix.isDeprecated("F11", "zfcp", "--scsiid"))
+        self.assertFalse(matrix.isDeprecated("F12", "zfcp", "--nosuchoption"))
+
+        # Every pair at once, from older to newer.
+        everything = matrix.diffAll()
+        self.assertEqual(len(everything), 27 * 26 // 2)
+        self.assertEqual(everything[("F20", "F21")].to_dict(), diffVersions("F20", "F21").to_dict())
+        self.assertNotIn(("F21", "F20"), everything)
+
+class VersionMatrix_Write_TestCase(unittest.TestCase):
+    def runTest(self):
+        matrix = VersionMatrix.fromHandlers(["F20", F21])
+        self.assertEqual(matrix.versions, ("F20", "F21"))
+
+        f = six.StringIO()
+        writeMatrix(f, matrix)
+        namespace = {}
+        exec(f.getvalue(), namespace)
+
+        copy = VersionMatrix(namespace["VERSIONS"], namespace["COMMANDS"])
+        self.assertEqual(copy.commands, matrix.commands)
+        self.assertEqual(copy.diff("F20", "F21").to_dict(), diffVersions("F20", "F21").to_dict())
+
+if __name__ == "__main__":
+    unittest.main()